@@ -0,0 +1,107 @@
+from argparse import ArgumentParser
+from typing import Callable, Any
+import timeit
+
+from telebox.bot.types.types.update import Update
+from telebox.bot.utils.converters import DataclassConverter, GeneratedDataclassConverter
+
+
+USER = {
+    "id": 1,
+    "is_bot": False,
+    "first_name": "Ann",
+    "last_name": "Lee",
+    "username": "ann",
+    "language_code": "en"
+}
+CHAT = {
+    "id": -100,
+    "type": "supergroup",
+    "title": "Group",
+    "username": "group"
+}
+MESSAGE = {
+    "message_id": 10,
+    "from": USER,
+    "chat": CHAT,
+    "date": 1700000000,
+    "text": "/start hello https://example.com",
+    "entities": [
+        {"type": "bot_command", "offset": 0, "length": 6},
+        {"type": "url", "offset": 13, "length": 19}
+    ],
+    "reply_to_message": {
+        "message_id": 9,
+        "from": USER,
+        "chat": CHAT,
+        "date": 1699999999,
+        "photo": [
+            {"file_id": "a", "file_unique_id": "b", "width": 90, "height": 90}
+        ],
+        "caption": "Photo"
+    },
+    "forward_origin": {
+        "type": "user",
+        "date": 1699999000,
+        "sender_user": USER
+    }
+}
+UPDATES = [
+    {
+        "update_id": 1,
+        "message": MESSAGE
+    },
+    {
+        "update_id": 2,
+        "callback_query": {
+            "id": "1",
+            "from": USER,
+            "chat_instance": "1",
+            "data": "data",
+            "message": MESSAGE
+        }
+    },
+    {
+        "update_id": 3,
+        "chat_member": {
+            "chat": CHAT,
+            "from": USER,
+            "date": 1700000000,
+            "old_chat_member": {"status": "member", "user": USER},
+            "new_chat_member": {"status": "kicked", "user": USER, "until_date": 0}
+        }
+    }
+]
+
+
+def main() -> None:
+    parser = ArgumentParser()
+    parser.add_argument("--number", type=int, default=1000)
+    parser.add_argument("--repeat", type=int, default=5)
+    namespace = parser.parse_args()
+
+    for converter in (DataclassConverter(), GeneratedDataclassConverter()):
+        updates = [converter.get_object(i, Update) for i in UPDATES]
+        load_secs = _get_secs(
+            lambda: [converter.get_object(i, Update) for i in UPDATES],
+            number=namespace.number,
+            repeat=namespace.repeat
+        )
+        dump_secs = _get_secs(
+            lambda: [converter.get_data(i) for i in updates],
+            number=namespace.number,
+            repeat=namespace.repeat
+        )
+        print(
+            f"{type(converter).__name__}: "
+            f"load {load_secs:.3f}s, dump {dump_secs:.3f}s "
+            f"({namespace.number * len(UPDATES)} updates)"
+        )
+
+
+def _get_secs(function: Callable[[], Any], *, number: int, repeat: int) -> float:
+    return min(timeit.repeat(function, number=number, repeat=repeat))
+
+
+if __name__ == "__main__":
+    main()
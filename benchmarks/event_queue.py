@@ -0,0 +1,105 @@
+from argparse import ArgumentParser
+from threading import Thread, Event
+import random
+import time
+
+from telebox.dispatcher.enums.event_type import EventType
+from telebox.dispatcher.types.event_info import EventInfo
+from telebox.dispatcher.utils.event_queue import EventQueue
+
+
+def main() -> None:
+    parser = ArgumentParser()
+    parser.add_argument("--shards", type=int, default=4)
+    parser.add_argument("--threads", type=int, nargs="+", default=[4, 8, 16, 32])
+    parser.add_argument("--events", type=int, default=4000)
+    parser.add_argument("--hot-share", type=float, default=0.7, help="share of events of the first shard")
+    parser.add_argument("--event-secs", type=float, default=0.001)
+    parser.add_argument(
+        "--rebalance-interval-secs",
+        type=float,
+        default=0.1,
+        help="how long a worker waits for events before moving to another shard"
+    )
+    namespace = parser.parse_args()
+
+    for threads in namespace.threads:
+        if threads < namespace.shards:
+            raise ValueError("Number of threads cannot be less than number of shards!")
+
+        # Threads created under load are placed on registration,
+        # threads started before it have to move to the loaded shard.
+        for name, started_threads in (("added under load", namespace.shards), ("started before load", threads)):
+            secs, shard_workers = _process_events(
+                threads=threads,
+                started_threads=started_threads,
+                chat_ids=_get_chat_ids(namespace.events, namespace.shards, namespace.hot_share),
+                shards=namespace.shards,
+                event_secs=namespace.event_secs,
+                rebalance_interval_secs=namespace.rebalance_interval_secs
+            )
+            print(
+                f"{threads} threads {name}: {namespace.events / secs:.0f} events/s, "
+                f"workers per shard {shard_workers}"
+            )
+
+
+def _process_events(
+    *,
+    threads: int,
+    started_threads: int,
+    chat_ids: list[int],
+    shards: int,
+    event_secs: float,
+    rebalance_interval_secs: float
+) -> tuple[float, list[int]]:
+    events = EventQueue(shards)
+    stop_event = Event()
+    worker_shards = [None] * threads
+
+    def process_events(index: int) -> None:
+        shard_index = worker_shards[index] = events.register_worker()
+
+        while not stop_event.is_set():
+            event = events.get(shard_index, rebalance_interval_secs)
+
+            if event is None:
+                shard_index = worker_shards[index] = events.move_worker(shard_index)
+            else:
+                time.sleep(event_secs)
+                events.set_event_completion(shard_index, event.chat_id)
+
+    workers = [Thread(target=process_events, args=(i,), daemon=True) for i in range(threads)]
+
+    for i in workers[:started_threads]:
+        i.start()
+
+    start_time = time.perf_counter()
+
+    for i in chat_ids:
+        events.put(EventInfo(event=None, event_type=EventType.MESSAGE, chat_id=i))
+
+    for i in workers[started_threads:]:
+        i.start()
+
+    events.wait_events()
+    secs = time.perf_counter() - start_time
+    shard_workers = [worker_shards.count(i) for i in range(shards)]
+    stop_event.set()
+
+    for i in workers:
+        i.join()
+
+    return secs, shard_workers
+
+
+def _get_chat_ids(events: int, shards: int, hot_share: float) -> list[int]:
+    # Chat IDs are hashed to shards by their remainder.
+    return [
+        random.randrange(1, 1000000) * shards + (0 if random.random() < hot_share else random.randrange(1, shards))
+        for _ in range(events)
+    ]
+
+
+if __name__ == "__main__":
+    main()
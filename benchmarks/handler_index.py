@@ -0,0 +1,136 @@
+from argparse import ArgumentParser
+from typing import Optional, Iterable, Callable, Any
+import timeit
+
+from telebox.bot.types.types.message import Message
+from telebox.bot.utils.converters import DataclassConverter
+from telebox.dispatcher.filters.events import CommandFilterFactory, ChatTypeFilter
+from telebox.dispatcher.handlers.event import AbstractEventHandler
+from telebox.dispatcher.types.event_handler_info import EventHandlerInfo
+from telebox.dispatcher.utils.event_handler_index import EventHandlerIndex
+
+
+BOT_USERNAME = "bot"
+CONVERTER = DataclassConverter()
+
+
+def main() -> None:
+    parser = ArgumentParser()
+    parser.add_argument("--handlers", type=int, nargs="+", default=[10, 100, 300, 1000])
+    parser.add_argument("--number", type=int, default=2000)
+    parser.add_argument("--repeat", type=int, default=5)
+    namespace = parser.parse_args()
+    _check_registration_order()
+
+    for handlers in namespace.handlers:
+        factory = CommandFilterFactory(BOT_USERNAME)
+        index = _get_index(factory.get(f"command{i}") for i in range(handlers))
+
+        for case, command in (("last match", f"/command{handlers - 1}"), ("no match", "/unknown")):
+            message = _get_message(command)
+            linear_secs = _get_secs(
+                lambda: _get_linear_handler(index, message),
+                number=namespace.number,
+                repeat=namespace.repeat
+            )
+            indexed_secs = _get_secs(
+                lambda: _get_indexed_handler(index, message),
+                number=namespace.number,
+                repeat=namespace.repeat
+            )
+            print(
+                f"{handlers} handlers, {case}: "
+                f"linear {linear_secs / namespace.number * 1e6:.1f}us, "
+                f"indexed {indexed_secs / namespace.number * 1e6:.1f}us"
+            )
+
+
+def _check_registration_order() -> None:
+    # Indexed handlers of different indexes are interleaved with unindexed ones,
+    # and the first matching handler must be the one a linear lookup finds.
+    factory = CommandFilterFactory(BOT_USERNAME)
+    index = _get_index([
+        factory.get("a"),
+        factory.get("b") & ChatTypeFilter("group"),
+        ~factory.get("z"),
+        factory.get("b"),
+        ChatTypeFilter("private"),
+        factory.get("z"),
+        factory.get("a", "z")
+    ])
+    positions = {id(j): i for i, j in enumerate(index)}
+
+    for command in ("/a", "/b", "/z", "/unknown", "text"):
+        for chat_type in ("private", "group"):
+            message = _get_message(command, chat_type)
+            candidate_positions = [positions[id(i)] for i in index.get_candidates(message)]
+            _check(
+                candidate_positions == sorted(candidate_positions),
+                f"candidates for {command!r} in a {chat_type} chat must keep registration order"
+            )
+            _check(
+                _get_indexed_handler(index, message) is _get_linear_handler(index, message),
+                f"{command!r} in a {chat_type} chat must match the same handler as a linear lookup"
+            )
+
+
+def _get_index(filters: Iterable[Any]) -> EventHandlerIndex:
+    index = EventHandlerIndex()
+
+    for i in filters:
+        index.add(EventHandlerInfo(handler=_Handler(), filter=i, with_chat_queue=False))
+
+    return index
+
+
+def _get_linear_handler(index: EventHandlerIndex, message: Message) -> Optional[EventHandlerInfo]:
+    results = {}
+
+    for i in index:
+        if i.filter.get_result(message, results):
+            return i
+
+
+def _get_indexed_handler(index: EventHandlerIndex, message: Message) -> Optional[EventHandlerInfo]:
+    results = {}
+
+    for i in index.get_candidates(message):
+        if i.filter.get_result(message, results):
+            return i
+
+
+def _get_message(text: str, chat_type: str = "private") -> Message:
+    entities = []
+
+    if text.startswith("/"):
+        entities.append({"type": "bot_command", "offset": 0, "length": len(text)})
+
+    return CONVERTER.get_object(
+        {
+            "message_id": 1,
+            "chat": {"id": 1, "type": chat_type},
+            "date": 1700000000,
+            "text": text,
+            "entities": entities
+        },
+        Message
+    )
+
+
+def _get_secs(function: Callable[[], Any], *, number: int, repeat: int) -> float:
+    return min(timeit.repeat(function, number=number, repeat=repeat))
+
+
+def _check(condition: bool, message: str) -> None:
+    if not condition:
+        raise RuntimeError(f"Handler index check failed: {message}!")
+
+
+class _Handler(AbstractEventHandler):
+
+    def process_event(self, event) -> None:
+        pass
+
+
+if __name__ == "__main__":
+    main()
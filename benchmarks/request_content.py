@@ -0,0 +1,101 @@
+from argparse import ArgumentParser
+from typing import Callable, Any
+import timeit
+
+from requests_toolbelt import MultipartEncoder
+
+from telebox.bot.bot import Bot
+from telebox.bot.abstract_bot import _get_multipart_fields  # NOQA
+from telebox.bot.transports.requests_transport import RequestsTransport
+from telebox.bot.types.types.inline_keyboard_markup import InlineKeyboardMarkup
+from telebox.bot.types.types.inline_keyboard_button import InlineKeyboardButton
+
+
+REPLY_MARKUP = InlineKeyboardMarkup([
+    [
+        InlineKeyboardButton("Settings", callback_data="menu:settings"),
+        InlineKeyboardButton("Help", callback_data="menu:help")
+    ],
+    [InlineKeyboardButton("Site", url="https://example.com")]
+])
+REQUESTS = {
+    "sendMessage": {
+        "chat_id": 1000000000,
+        "text": "<b>Menu</b>\nChoose an option:",
+        "parse_mode": "HTML",
+        "reply_markup": REPLY_MARKUP
+    },
+    "answerCallbackQuery": {
+        "callback_query_id": "4382bfdwdsb323b2d9",
+        "text": "Saved",
+        "show_alert": False
+    },
+    "editMessageText": {
+        "chat_id": 1000000000,
+        "message_id": 10,
+        "text": "<b>Settings</b>\nNothing to change yet.",
+        "parse_mode": "HTML",
+        "reply_markup": REPLY_MARKUP
+    }
+}
+
+
+def main() -> None:
+    parser = ArgumentParser()
+    parser.add_argument("--number", type=int, default=10000)
+    parser.add_argument("--repeat", type=int, default=5)
+    namespace = parser.parse_args()
+
+    transport = RequestsTransport()
+    bot = Bot(transport, "123456:token")
+
+    for method, parameters in REQUESTS.items():
+        json_secs = _get_secs(
+            lambda: _get_json_body(bot, parameters),
+            number=namespace.number,
+            repeat=namespace.repeat
+        )
+        multipart_secs = _get_secs(
+            lambda: _get_multipart_body(bot, parameters),
+            number=namespace.number,
+            repeat=namespace.repeat
+        )
+        print(
+            f"{method}: "
+            f"JSON {json_secs / namespace.number * 1e6:.1f}us "
+            f"({len(_get_json_body(bot, parameters))} bytes), "
+            f"multipart {multipart_secs / namespace.number * 1e6:.1f}us "
+            f"({len(_get_multipart_body(bot, parameters))} bytes)"
+        )
+
+    transport.close()
+
+
+def _get_json_body(bot: Bot, parameters: dict[str, Any]) -> bytes:
+    # noinspection PyProtectedMember
+    fields, json_data, _ = bot._prepare_request_content(parameters)
+
+    if fields is not None:
+        raise RuntimeError("Request without files must be sent as JSON!")
+
+    return json_data
+
+
+def _get_multipart_body(bot: Bot, parameters: dict[str, Any]) -> bytes:
+    # Requests were built like this before JSON bodies were used.
+    fields = {}
+    # noinspection PyProtectedMember
+    values = {
+        name: bot._prepare_parameter_value(value, multipart_fields=fields, opened_files=[])
+        for name, value in parameters.items()
+    }
+
+    return MultipartEncoder(_get_multipart_fields(values, fields)).to_string()
+
+
+def _get_secs(function: Callable[[], Any], *, number: int, repeat: int) -> float:
+    return min(timeit.repeat(function, number=number, repeat=repeat))
+
+
+if __name__ == "__main__":
+    main()
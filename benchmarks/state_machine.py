@@ -0,0 +1,41 @@
+from argparse import ArgumentParser
+import time
+import tracemalloc
+
+from telebox.state_machine import StateMachine, State
+from telebox.state_machine.storages import MemoryStateStorage
+
+
+def main() -> None:
+    parser = ArgumentParser()
+    parser.add_argument("--users", type=int, default=100000)
+    parser.add_argument("--transitions", type=int, default=6)
+    namespace = parser.parse_args()
+
+    states = [State(f"state_{i}") for i in range(namespace.transitions + 1)]
+    start_time = time.perf_counter()
+    _set_states(states, namespace.users)
+    secs = time.perf_counter() - start_time
+    tracemalloc.start()
+    storage = _set_states(states, namespace.users)
+    memory_size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(
+        f"{namespace.users} users, {namespace.transitions} transitions: "
+        f"{secs:.2f}s, {memory_size / 1024 / 1024:.1f} MB"
+    )
+
+
+def _set_states(states: list[State], users: int) -> MemoryStateStorage:
+    storage = MemoryStateStorage()
+    machine = StateMachine(states[0], states[1:], storage)
+
+    for state in states[1:]:
+        for user_id in range(users):
+            machine.set_state(state, chat_id=user_id + 1000000000, user_id=user_id + 1000000000)
+
+    return storage
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,230 @@
+from argparse import ArgumentParser
+from pathlib import Path
+from threading import Thread
+from typing import Union
+import random
+import tempfile
+import time
+
+from telebox.state_machine.storages import (
+    AbstractStateStorage,
+    JSONStateStorage,
+    SQLiteStateStorage,
+    RedisStateStorage
+)
+from telebox.utils.serialization import get_serialized_data
+
+
+STATES = ["start", "menu"]
+NEXT_STATES = ["start", "menu", "settings"]
+FIRST_USER_ID = 1000000000
+
+
+def main() -> None:
+    parser = ArgumentParser()
+    parser.add_argument("--users", type=int, nargs="+", default=[10000, 100000, 1000000])
+    parser.add_argument("--transitions", type=int, default=20000)
+    parser.add_argument("--json-transitions", type=int, default=20)
+    parser.add_argument("--threads", type=int, default=8)
+    parser.add_argument("--redis-url", help="benchmark RedisStateStorage against this server")
+    namespace = parser.parse_args()
+    _check_redis_storage()
+
+    for users in namespace.users:
+        with tempfile.TemporaryDirectory() as directory:
+            json_path = Path(directory) / "states.json"
+            # Filling JSONStateStorage through its API would rewrite the file for every user.
+            json_path.write_text(
+                get_serialized_data({
+                    str(i): {str(i): STATES}
+                    for i in range(FIRST_USER_ID, FIRST_USER_ID + users)
+                }),
+                encoding="UTF-8"
+            )
+            _print_result(
+                "JSONStateStorage",
+                users,
+                _get_transitions_per_sec(
+                    JSONStateStorage(str(json_path)),
+                    users=users,
+                    transitions=namespace.json_transitions,
+                    threads=1
+                )
+            )
+
+            for with_group_commit in (False, True):
+                storage = SQLiteStateStorage(
+                    Path(directory) / f"states_{with_group_commit}.db",
+                    with_group_commit=with_group_commit
+                )
+
+                for i in range(FIRST_USER_ID, FIRST_USER_ID + users):
+                    storage.save_states(STATES, chat_id=i, user_id=i)
+
+                _print_result(
+                    f"SQLiteStateStorage(with_group_commit={with_group_commit})",
+                    users,
+                    _get_transitions_per_sec(
+                        storage,
+                        users=users,
+                        transitions=namespace.transitions,
+                        threads=namespace.threads
+                    )
+                )
+                storage.close()
+
+        if namespace.redis_url is not None:
+            storage = RedisStateStorage(url=namespace.redis_url, key_prefix="telebox:benchmark")
+
+            for i in range(FIRST_USER_ID, FIRST_USER_ID + users):
+                storage.save_states(STATES, chat_id=i, user_id=i)
+
+            _print_result(
+                "RedisStateStorage",
+                users,
+                _get_transitions_per_sec(
+                    storage,
+                    users=users,
+                    transitions=namespace.transitions,
+                    threads=namespace.threads
+                )
+            )
+            storage.close()
+
+
+def _check_redis_storage() -> None:
+    client = _DictRedis()
+    storage = RedisStateStorage(client, key_prefix="states", ttl_secs=60)
+    storage.save_states(["start", "menu"], chat_id=1, user_id=2)
+    storage.save_states(["start"], chat_id=1)
+    _check(storage.load_states(chat_id=1, user_id=2) == ["start", "menu"], "states must be loaded")
+    _check(storage.load_states(chat_id=1) == ["start"], "chat states must be stored separately")
+    _check(client.ttls == {b"states:1:2": 60, b"states:1": 60}, "TTL must be set on saved states")
+
+    storage.save_states(["menu"], chat_id=1, user_id=2)
+    _check(storage.load_states(chat_id=1, user_id=2) == ["menu"], "saved states must replace old ones")
+
+    storage.save_states([], chat_id=1, user_id=2)
+    _check(storage.load_states(chat_id=1, user_id=2) == [], "empty states must delete the key")
+    _check(b"states:1:2" not in client.lists, "empty states must not leave an empty key")
+
+    storage.close()
+    _check(not client.is_closed, "injected client must not be closed by the storage")
+
+
+class _DictRedis:
+    # Implements the commands used by RedisStateStorage on top of dicts, encoding arguments
+    # and returning bytes as a RESP client does.
+
+    def __init__(self):
+        self.lists: dict[bytes, list[bytes]] = {}
+        self.ttls: dict[bytes, int] = {}
+        self.is_closed = False
+
+    def pipeline(self, transaction: bool = True) -> "_DictRedisPipeline":
+        return _DictRedisPipeline(self)
+
+    def delete(self, *keys: Union[str, bytes]) -> int:
+        deleted = 0
+
+        for i in map(_get_encoded_value, keys):
+            self.ttls.pop(i, None)
+            deleted += self.lists.pop(i, None) is not None
+
+        return deleted
+
+    def rpush(self, key: Union[str, bytes], *values: Union[str, bytes, int]) -> int:
+        items = self.lists.setdefault(_get_encoded_value(key), [])
+        items.extend(map(_get_encoded_value, values))
+
+        return len(items)
+
+    def expire(self, key: Union[str, bytes], secs: int) -> bool:
+        key = _get_encoded_value(key)
+
+        if key not in self.lists:
+            return False
+
+        self.ttls[key] = secs
+
+        return True
+
+    def lrange(self, key: Union[str, bytes], start: int, end: int) -> list[bytes]:
+        items = self.lists.get(_get_encoded_value(key), [])
+
+        return items[start:] if end == -1 else items[start:end + 1]
+
+    def close(self) -> None:
+        self.is_closed = True
+
+
+class _DictRedisPipeline:
+
+    def __init__(self, client: _DictRedis):
+        self._client = client
+        self._commands = []
+
+    def __getattr__(self, name: str):
+        command = getattr(self._client, name)
+
+        def add_command(*args, **kwargs) -> _DictRedisPipeline:
+            self._commands.append((command, args, kwargs))
+            return self
+
+        return add_command
+
+    def execute(self) -> list:
+        commands, self._commands = self._commands, []
+
+        return [command(*args, **kwargs) for command, args, kwargs in commands]
+
+
+def _get_encoded_value(value: Union[str, bytes, int]) -> bytes:
+    if isinstance(value, bytes):
+        return value
+
+    return str(value).encode("UTF-8")
+
+
+def _get_transitions_per_sec(
+    storage: AbstractStateStorage,
+    *,
+    users: int,
+    transitions: int,
+    threads: int
+) -> float:
+    thread_transitions = max(transitions // threads, 1)
+    thread_list = [
+        Thread(target=_make_transitions, args=(storage, users, thread_transitions))
+        for _ in range(threads)
+    ]
+    start_time = time.perf_counter()
+
+    for i in thread_list:
+        i.start()
+
+    for i in thread_list:
+        i.join()
+
+    return thread_transitions * threads / (time.perf_counter() - start_time)
+
+
+def _make_transitions(storage: AbstractStateStorage, users: int, transitions: int) -> None:
+    for _ in range(transitions):
+        user_id = random.randrange(FIRST_USER_ID, FIRST_USER_ID + users)
+        states = storage.load_states(chat_id=user_id, user_id=user_id)
+        states.append(random.choice(NEXT_STATES))
+        storage.save_states(states[-3:], chat_id=user_id, user_id=user_id)
+
+
+def _check(condition: bool, message: str) -> None:
+    if not condition:
+        raise RuntimeError(f"Redis state storage check failed: {message}!")
+
+
+def _print_result(name: str, users: int, transitions_per_sec: float) -> None:
+    print(f"{name}, {users} users: {transitions_per_sec:.1f} transitions/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+from argparse import ArgumentParser
+import random
+import statistics
+import time
+
+from telebox.utils.task_executor import TaskExecutor
+
+
+def main() -> None:
+    parser = ArgumentParser()
+    parser.add_argument("--tasks", type=int, default=1000000)
+    parser.add_argument("--cancelled-tasks", type=int, default=100000)
+    namespace = parser.parse_args()
+
+    # Tasks are not started, so the heap only grows by adding and shrinks by compaction.
+    executor = TaskExecutor()
+    start_time = time.perf_counter()
+    ids = [
+        executor.add_task(_process_task, delay_secs=random.uniform(3600, 7200))
+        for _ in range(namespace.tasks)
+    ]
+    secs = time.perf_counter() - start_time
+    print(f"add: {namespace.tasks / secs:.0f} tasks/s, heap {_get_heap_size(executor)} entries")
+
+    random.shuffle(ids)
+    cancellation_secs = []
+
+    for i in ids[:namespace.cancelled_tasks]:
+        start_time = time.perf_counter()
+        executor.remove_task(i)
+        cancellation_secs.append(time.perf_counter() - start_time)
+
+    print(
+        f"cancel {namespace.cancelled_tasks} of {namespace.tasks}: "
+        f"p50 {statistics.median(cancellation_secs) * 1e6:.1f}us, "
+        f"heap {_get_heap_size(executor)} entries"
+    )
+
+    # Compaction runs once more than half of the heap entries are removed.
+    cancellation_secs = []
+
+    for i in ids[namespace.cancelled_tasks:]:
+        start_time = time.perf_counter()
+        executor.remove_task(i)
+        cancellation_secs.append(time.perf_counter() - start_time)
+
+    _check(_get_heap_size(executor) < 2048, "removed tasks must be compacted")
+    print(
+        f"cancel all: p50 {statistics.median(cancellation_secs) * 1e6:.1f}us, "
+        f"slowest (compaction) {max(cancellation_secs) * 1e3:.1f}ms, "
+        f"total {sum(cancellation_secs):.2f}s, heap {_get_heap_size(executor)} entries"
+    )
+
+
+def _get_heap_size(executor: TaskExecutor) -> int:
+    # noinspection PyProtectedMember
+    return len(executor._tasks)
+
+
+def _process_task() -> None:
+    pass
+
+
+def _check(condition: bool, message: str) -> None:
+    if not condition:
+        raise RuntimeError(f"Task executor check failed: {message}!")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+from argparse import ArgumentParser
+from typing import Any
+import dataclasses
+import gc
+import tracemalloc
+
+from telebox.bot.types.types.update import Update
+from telebox.bot.types.types.message import Message
+from telebox.bot.types.types.message_entity import MessageEntity
+from telebox.bot.types.types.user import User
+from telebox.bot.types.types.chat import Chat
+from telebox.bot.utils.converters import DataclassConverter
+from converters import UPDATES
+
+
+SLOTTED_TYPES = (Update, Message, MessageEntity, User, Chat)
+
+
+def main() -> None:
+    parser = ArgumentParser()
+    parser.add_argument("--updates", type=int, default=10000)
+    namespace = parser.parse_args()
+
+    converter = DataclassConverter()
+    updates = [converter.get_object(i, Update) for i in UPDATES]
+    unslotted_classes = {i: _get_unslotted_class(i) for i in SLOTTED_TYPES}
+    results = {}
+
+    for name, classes in (("without slots", unslotted_classes), ("with slots", {})):
+        results[name] = _get_bytes_per_update(updates, classes, namespace.updates)
+        print(f"{name}: {results[name]:.0f} bytes per update")
+
+    saved_bytes = results["without slots"] - results["with slots"]
+    print(f"saved: {saved_bytes:.0f} bytes per update ({saved_bytes / results['without slots']:.1%})")
+
+
+def _get_bytes_per_update(updates: list[Update], classes: dict[type, type], number: int) -> float:
+    gc.collect()
+    tracemalloc.start()
+
+    try:
+        copies = [_get_copy(updates[i % len(updates)], classes) for i in range(number)]
+        size = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+
+    del copies
+
+    return size / number
+
+
+def _get_copy(value: Any, classes: dict[type, type]) -> Any:
+    # Values shared by all copies (strings, numbers) are not copied,
+    # so only the size of the objects themselves is compared.
+    if isinstance(value, list):
+        return [_get_copy(i, classes) for i in value]
+    elif dataclasses.is_dataclass(value) and not isinstance(value, type):
+        class_ = type(value)
+        copy = object.__new__(classes.get(class_, class_))
+
+        for i in dataclasses.fields(value):
+            object.__setattr__(copy, i.name, _get_copy(getattr(value, i.name), classes))
+
+        return copy
+    else:
+        return value
+
+
+def _get_unslotted_class(class_: type) -> type:
+    # The same class as before with_slots: fields are stored in an instance dictionary.
+    namespace = {
+        name: value
+        for name, value in class_.__dict__.items()
+        if name not in class_.__slots__ and name != "__slots__"
+    }
+
+    return type(class_)(class_.__name__, class_.__bases__, namespace)
+
+
+if __name__ == "__main__":
+    main()
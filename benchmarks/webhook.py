@@ -0,0 +1,243 @@
+from argparse import ArgumentParser
+from http import HTTPStatus
+from pathlib import Path
+from threading import Thread, Event, current_thread, main_thread
+from typing import Optional, Any
+import asyncio
+import io
+import logging
+import statistics
+import time
+
+from telebox.dispatcher.utils.webhook_app import WebhookApp
+from telebox.utils.serialization import get_serialized_bytes, get_deserialized_data
+
+
+SECRET_TOKEN = "secret"
+USER = {"id": 1, "is_bot": False, "first_name": "Ann", "username": "ann"}
+CHAT = {"id": 1, "type": "private", "first_name": "Ann", "username": "ann"}
+UPDATES = [
+    {
+        "update_id": 1,
+        "message": {
+            "message_id": 1,
+            "from": USER,
+            "chat": CHAT,
+            "date": 1700000000,
+            "text": "/start",
+            "entities": [{"type": "bot_command", "offset": 0, "length": 6}]
+        }
+    },
+    {
+        "update_id": 2,
+        "callback_query": {
+            "id": "1",
+            "from": USER,
+            "chat_instance": "1",
+            "data": "menu:settings",
+            "message": {"message_id": 2, "chat": CHAT, "date": 1700000000, "text": "Menu"}
+        }
+    },
+    {
+        "update_id": 3,
+        "message": {
+            "message_id": 3,
+            "from": USER,
+            "chat": CHAT,
+            "date": 1700000000,
+            "photo": [{"file_id": "a", "file_unique_id": "b", "width": 90, "height": 90}],
+            "caption": "Photo"
+        }
+    }
+]
+
+
+def main() -> None:
+    parser = ArgumentParser()
+    parser.add_argument("--updates", type=Path, help="file with one recorded update body per line")
+    parser.add_argument("--requests", type=int, default=50000)
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--parser-threads", type=int, default=2)
+    parser.add_argument("--max-queue-size", type=int, default=1000)
+    namespace = parser.parse_args()
+    # Rejected updates are counted in the results instead of being logged one by one.
+    logging.getLogger("telebox").setLevel(logging.ERROR)
+
+    if namespace.updates is not None:
+        contents = [i for i in namespace.updates.read_bytes().splitlines() if i.strip()]
+    else:
+        contents = [get_serialized_bytes(i) for i in UPDATES]
+
+    _check_app(contents[0])
+
+    for name, run in (("WSGI", _run_wsgi), ("ASGI", _run_asgi)):
+        app = WebhookApp(
+            update_loader=get_deserialized_data,
+            update_processor=_process_update,
+            secret_token=SECRET_TOKEN,
+            max_queue_size=namespace.max_queue_size,
+            parser_threads=namespace.parser_threads
+        )
+        app.start()
+        start_time = time.perf_counter()
+        results = run(app, contents, namespace.requests, namespace.concurrency)
+        secs = time.perf_counter() - start_time
+        app.stop()
+        _print_result(name, results, secs)
+
+
+def _check_app(content: bytes) -> None:
+    app = WebhookApp(update_loader=get_deserialized_data, update_processor=_process_update, max_queue_size=1)
+    _check(_send_wsgi_request(app, content)[0] == HTTPStatus.OK, "first update must be accepted")
+    _check(
+        _send_wsgi_request(app, content)[0] == HTTPStatus.SERVICE_UNAVAILABLE,
+        "full queue must return 503"
+    )
+    _check(
+        asyncio.run(_send_asgi_request(app, content))[0] == HTTPStatus.SERVICE_UNAVAILABLE,
+        "full queue must return 503 over ASGI"
+    )
+
+    app = WebhookApp(update_loader=get_deserialized_data, update_processor=_process_update, secret_token=SECRET_TOKEN)
+    _check(
+        _send_wsgi_request(app, content, secret_token="wrong")[0] == HTTPStatus.FORBIDDEN,
+        "bad secret token must return 403"
+    )
+    _check(
+        asyncio.run(_send_asgi_request(app, content, secret_token="wrong"))[0] == HTTPStatus.FORBIDDEN,
+        "bad secret token must return 403 over ASGI"
+    )
+
+    loaded_contents = []
+    loaded_event = Event()
+
+    def load_update(content_: bytes) -> None:
+        loaded_contents.append((content_, current_thread()))
+        loaded_event.set()
+
+    app = WebhookApp(update_loader=load_update, update_processor=_process_update)
+    app.start()
+    _send_wsgi_request(app, content)
+    _check(loaded_event.wait(5), "update was not loaded")
+    app.stop()
+    loaded_content, thread = loaded_contents[0]
+    _check(loaded_content == content, "update loader must receive the request body")
+    _check(thread is not main_thread(), "update must be loaded on a parser thread")
+
+
+def _run_wsgi(
+    app: WebhookApp,
+    contents: list[bytes],
+    requests: int,
+    concurrency: int
+) -> list[tuple[int, float]]:
+    results = [[] for _ in range(concurrency)]
+
+    def send_requests(index: int) -> None:
+        for i in range(index, requests, concurrency):
+            results[index].append(_send_wsgi_request(app, contents[i % len(contents)]))
+
+    threads = [Thread(target=send_requests, args=(i,)) for i in range(concurrency)]
+
+    for i in threads:
+        i.start()
+
+    for i in threads:
+        i.join()
+
+    return [j for i in results for j in i]
+
+
+def _run_asgi(
+    app: WebhookApp,
+    contents: list[bytes],
+    requests: int,
+    concurrency: int
+) -> list[tuple[int, float]]:
+    async def send_requests(index: int) -> list[tuple[int, float]]:
+        return [
+            await _send_asgi_request(app, contents[i % len(contents)])
+            for i in range(index, requests, concurrency)
+        ]
+
+    async def run() -> list[tuple[int, float]]:
+        results = await asyncio.gather(*(send_requests(i) for i in range(concurrency)))
+
+        return [j for i in results for j in i]
+
+    return asyncio.run(run())
+
+
+def _send_wsgi_request(
+    app: WebhookApp,
+    content: bytes,
+    *,
+    secret_token: Optional[str] = SECRET_TOKEN
+) -> tuple[int, float]:
+    environ = {
+        "REQUEST_METHOD": "POST",
+        "CONTENT_LENGTH": str(len(content)),
+        "wsgi.input": io.BytesIO(content)
+    }
+    statuses = []
+
+    if secret_token is not None:
+        environ["HTTP_X_TELEGRAM_BOT_API_SECRET_TOKEN"] = secret_token
+
+    start_time = time.perf_counter()
+    app(environ, lambda status, headers: statuses.append(int(status.split()[0])))
+
+    return statuses[0], time.perf_counter() - start_time
+
+
+async def _send_asgi_request(
+    app: WebhookApp,
+    content: bytes,
+    *,
+    secret_token: Optional[str] = SECRET_TOKEN
+) -> tuple[int, float]:
+    scope = {
+        "type": "http",
+        "method": "POST",
+        "headers": [(b"content-length", str(len(content)).encode())]
+    }
+    statuses = []
+
+    if secret_token is not None:
+        scope["headers"].append((b"x-telegram-bot-api-secret-token", secret_token.encode()))
+
+    async def receive() -> dict[str, Any]:
+        return {"type": "http.request", "body": content, "more_body": False}
+
+    async def send(message: dict[str, Any]) -> None:
+        if message["type"] == "http.response.start":
+            statuses.append(message["status"])
+
+    start_time = time.perf_counter()
+    await app.asgi(scope, receive, send)
+
+    return statuses[0], time.perf_counter() - start_time
+
+
+def _process_update(update: Any) -> None:
+    pass
+
+
+def _check(condition: bool, message: str) -> None:
+    if not condition:
+        raise RuntimeError(f"Webhook app check failed: {message}!")
+
+
+def _print_result(name: str, results: list[tuple[int, float]], secs: float) -> None:
+    latencies = [i[1] for i in results]
+    percentiles = statistics.quantiles(latencies, n=100)
+    rejected = sum(i[0] != HTTPStatus.OK for i in results)
+    print(
+        f"{name}: {len(results) / secs:.0f} req/s, "
+        f"ack p50 {percentiles[49] * 1e6:.1f}us, p99 {percentiles[98] * 1e6:.1f}us, "
+        f"{rejected} rejected"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,23 +1,49 @@
-from .bot import Bot, get_bot, UpdateContentType, MessageContentType, set_up_bot, Webhook
+from .bot import (
+    AbstractBot,
+    Bot,
+    get_bot,
+    AsyncBot,
+    get_async_bot,
+    UpdateContentType,
+    MessageContentType,
+    set_up_bot,
+    Webhook,
+    SendScheduler,
+    send_priority,
+    Broadcaster,
+    BroadcastMessage,
+    AbstractTransport,
+    RequestsTransport,
+    HTTPXTransport,
+    TransportStats,
+    AbstractAsyncTransport,
+    AiohttpTransport
+)
 from .dispatcher import (
     Dispatcher,
+    AsyncDispatcher,
     Event,
     EventType,
     Aborting,
     ABORTING,
     MediaGroup,
     MediaGroupContentType,
+    OverflowPolicy,
     AbstractEventHandler,
     AbstractErrorHandler,
     AbstractEventFilterFactory,
     AbstractEventFilter,
     AbstractEventBaseFilter,
     AbstractEventFilterCache,
+    AbstractEventFilterIndex,
+    EventFilterOptimizer,
+    EventFilterStats,
     AbstractErrorFilterFactory,
     AbstractErrorFilter,
     AbstractErrorBaseFilter,
     AbstractErrorFilterCache,
     Middleware,
+    WebhookApp,
     RateLimit,
     Limit,
     Router,
@@ -34,7 +60,9 @@ from .utils import (
     Group,
     AbstractCallbackDataBuilder,
     TaskExecutor,
+    AbstractTaskStore,
     ThreadPool,
+    ThreadPoolStats,
     Env,
     get_html_text,
     get_markdown_text,
@@ -44,30 +72,49 @@ from .utils import (
 
 
 __all__ = [
+    "AbstractBot",
     "Bot",
     "get_bot",
+    "AsyncBot",
+    "get_async_bot",
     "UpdateContentType",
     "MessageContentType",
     "set_up_bot",
     "Webhook",
+    "SendScheduler",
+    "send_priority",
+    "Broadcaster",
+    "BroadcastMessage",
+    "AbstractTransport",
+    "RequestsTransport",
+    "HTTPXTransport",
+    "TransportStats",
+    "AbstractAsyncTransport",
+    "AiohttpTransport",
     "Dispatcher",
+    "AsyncDispatcher",
     "Event",
     "EventType",
     "Aborting",
     "ABORTING",
     "MediaGroup",
     "MediaGroupContentType",
+    "OverflowPolicy",
     "AbstractEventHandler",
     "AbstractErrorHandler",
     "AbstractEventFilterFactory",
     "AbstractEventFilter",
     "AbstractEventBaseFilter",
     "AbstractEventFilterCache",
+    "AbstractEventFilterIndex",
+    "EventFilterOptimizer",
+    "EventFilterStats",
     "AbstractErrorFilterFactory",
     "AbstractErrorFilter",
     "AbstractErrorBaseFilter",
     "AbstractErrorFilterCache",
     "Middleware",
+    "WebhookApp",
     "RateLimit",
     "Limit",
     "Router",
@@ -82,7 +129,9 @@ __all__ = [
     "Group",
     "AbstractCallbackDataBuilder",
     "TaskExecutor",
+    "AbstractTaskStore",
     "ThreadPool",
+    "ThreadPoolStats",
     "Env",
     "get_html_text",
     "get_markdown_text",
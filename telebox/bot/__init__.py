@@ -1,13 +1,37 @@
+from .abstract_bot import AbstractBot
 from .bot import Bot, get_bot
+from .async_bot import AsyncBot, get_async_bot
 from .enums import UpdateContentType, MessageContentType
-from .utils import set_up_bot, Webhook
+from .utils import set_up_bot, Webhook, SendScheduler, send_priority
+from .broadcasting import Broadcaster, BroadcastMessage
+from .transports import (
+    AbstractTransport,
+    RequestsTransport,
+    HTTPXTransport,
+    TransportStats,
+    AbstractAsyncTransport,
+    AiohttpTransport
+)
 
 
 __all__ = [
+    "AbstractBot",
     "Bot",
     "get_bot",
+    "AsyncBot",
+    "get_async_bot",
     "UpdateContentType",
     "MessageContentType",
     "set_up_bot",
-    "Webhook"
+    "Webhook",
+    "SendScheduler",
+    "send_priority",
+    "Broadcaster",
+    "BroadcastMessage",
+    "AbstractTransport",
+    "RequestsTransport",
+    "HTTPXTransport",
+    "TransportStats",
+    "AbstractAsyncTransport",
+    "AiohttpTransport"
 ]
@@ -0,0 +1,373 @@
+from abc import ABC, abstractmethod
+from typing import Union, Optional, Any, IO
+from datetime import datetime
+from dataclasses import is_dataclass
+import secrets
+from http import HTTPStatus
+
+from telebox.bot.utils.converters import DataclassConverter, get_timestamp
+from telebox.bot.transports.transport import TransportResponse
+from telebox.bot.errors import get_request_error, BotError
+from telebox.bot.consts import chat_member_statuses
+from telebox.bot.enums.input_file_type import InputFileType
+from telebox.bot.types.types.response_parameters import ResponseParameters
+from telebox.bot.types.types.update import Update
+from telebox.bot.types.types.user import User
+from telebox.bot.types.types.input_file import InputFile
+from telebox.bot.types.types.inline_query_result import InlineQueryResult
+from telebox.bot.types.types.chat_member_owner import ChatMemberOwner
+from telebox.bot.types.types.chat_member_administrator import ChatMemberAdministrator
+from telebox.bot.types.types.chat_member_member import ChatMemberMember
+from telebox.bot.types.types.chat_member_restricted import ChatMemberRestricted
+from telebox.bot.types.types.chat_member_left import ChatMemberLeft
+from telebox.bot.types.types.chat_member_banned import ChatMemberBanned
+from telebox.bot.types.types.inline_query_result_article import InlineQueryResultArticle
+from telebox.bot.types.types.inline_query_result_photo import InlineQueryResultPhoto
+from telebox.bot.types.types.inline_query_result_gif import InlineQueryResultGif
+from telebox.bot.types.types.inline_query_result_mpeg4_gif import InlineQueryResultMpeg4Gif
+from telebox.bot.types.types.inline_query_result_video import InlineQueryResultVideo
+from telebox.bot.types.types.inline_query_result_audio import InlineQueryResultAudio
+from telebox.bot.types.types.inline_query_result_voice import InlineQueryResultVoice
+from telebox.bot.types.types.inline_query_result_document import InlineQueryResultDocument
+from telebox.bot.types.types.inline_query_result_location import InlineQueryResultLocation
+from telebox.bot.types.types.inline_query_result_venue import InlineQueryResultVenue
+from telebox.bot.types.types.inline_query_result_contact import InlineQueryResultContact
+from telebox.bot.types.types.inline_query_result_cached_photo import InlineQueryResultCachedPhoto
+from telebox.bot.types.types.inline_query_result_cached_gif import InlineQueryResultCachedGif
+from telebox.bot.types.types.inline_query_result_cached_mpeg4_gif import (
+    InlineQueryResultCachedMpeg4Gif
+)
+from telebox.bot.types.types.inline_query_result_cached_sticker import (
+    InlineQueryResultCachedSticker
+)
+from telebox.bot.types.types.inline_query_result_cached_document import (
+    InlineQueryResultCachedDocument
+)
+from telebox.bot.types.types.inline_query_result_cached_video import InlineQueryResultCachedVideo
+from telebox.bot.types.types.inline_query_result_cached_voice import InlineQueryResultCachedVoice
+from telebox.bot.types.types.inline_query_result_cached_audio import InlineQueryResultCachedAudio
+from telebox.bot.types.types.input_text_message_content import InputTextMessageContent
+from telebox.utils.not_set import NotSet, NOT_SET
+from telebox.utils.serialization import (
+    get_serialized_data,
+    get_serialized_bytes,
+    get_deserialized_data
+)
+
+
+API_URL = "https://api.telegram.org"
+_CHAT_MEMBER_TYPES = {
+    chat_member_statuses.CREATOR: ChatMemberOwner,
+    chat_member_statuses.ADMINISTRATOR: ChatMemberAdministrator,
+    chat_member_statuses.MEMBER: ChatMemberMember,
+    chat_member_statuses.RESTRICTED: ChatMemberRestricted,
+    chat_member_statuses.LEFT: ChatMemberLeft,
+    chat_member_statuses.KICKED: ChatMemberBanned
+}
+
+
+class AbstractBot(ABC):
+
+    def __init__(
+        self,
+        token: str,
+        *,
+        api_url: str = API_URL,
+        parse_mode: Union[str, NotSet] = NOT_SET,
+        timeout_secs: Union[int, float, None] = 300,
+        retries: int = 0,
+        retry_delay_secs: Union[int, float] = 0,
+        wait_on_rate_limit: bool = False,
+        use_cache: bool = True,
+        lazy_updates: bool = False,
+        converter: Optional[DataclassConverter] = None
+    ):
+        if retries < 0:
+            raise ValueError("Number of retries cannot be less than zero!")
+
+        self.token = token
+        self.api_url = api_url.lower().rstrip("/")
+        self._parse_mode = parse_mode
+        self._timeout_secs = timeout_secs
+        self._retries = retries
+        self._retry_delay_secs = retry_delay_secs
+        self._wait_on_rate_limit = wait_on_rate_limit
+        self._use_cache = use_cache
+        self._lazy_updates = lazy_updates
+        self._converter = converter if converter is not None else DataclassConverter()
+        self._user: Optional[User] = None
+        self._cached_file_ids: dict[tuple[str, str], str] = {}
+
+    @property
+    def user(self) -> User:
+        if self._user is None:
+            raise BotError(
+                "Bot user was not loaded! To use this property, you need to call "
+                "bot.get_me method at least once!"
+            )
+
+        return self._user
+
+    def load_update(self, data: dict[str, Any]) -> Update:
+        if self._lazy_updates:
+            return self._converter.get_lazy_object(data=data, class_=Update)
+
+        return self._converter.get_object(data=data, class_=Update)
+
+    @abstractmethod
+    def _send_request(
+        self,
+        method: str,
+        *,
+        parameters: Optional[dict[str, Any]] = None,
+        timeout_secs: Union[int, float, None] = None
+    ) -> Any:
+        pass
+
+    def _set_cached_file_id(self, file: Union[InputFile, str], file_id: str) -> None:
+        if (
+            isinstance(file, InputFile)
+            and (file.type is InputFileType.PATH)
+            and ((file.file, file.name) not in self._cached_file_ids)
+        ):
+            self._cached_file_ids[(file.file, file.name)] = file_id
+
+    def _get_api_url(self, method: str) -> str:
+        return f"{self.api_url}/bot{self.token}/{method}"
+
+    def _get_parse_mode(
+        self,
+        parse_mode: Union[str, None, NotSet],
+        *,
+        with_entities: bool
+    ) -> Optional[str]:
+        if parse_mode is not NOT_SET:
+            return parse_mode
+        elif self._parse_mode is not NOT_SET and not with_entities:
+            return self._parse_mode
+
+    def _get_file(
+        self,
+        file: Union[InputFile, str]
+    ) -> Union[InputFile, str]:
+        if (
+            self._use_cache
+            and isinstance(file, InputFile)
+            and (file.type is InputFileType.PATH)
+        ):
+            return self._cached_file_ids.get((file.file, file.name), file)
+
+        return file
+
+    def _prepare_request_content(
+        self,
+        parameters: dict[str, Any]
+    ) -> tuple[Optional[dict[str, Any]], Optional[bytes], list[IO]]:
+        values: dict[str, Any] = {}
+        attached_files: dict[str, Any] = {}
+        opened_files: list[IO] = []
+
+        for name, value in parameters.items():
+            values[name] = self._prepare_parameter_value(
+                value,
+                multipart_fields=attached_files,
+                opened_files=opened_files,
+                attach_files=False
+            )
+
+        if attached_files or any(isinstance(i, tuple) for i in values.values()):
+            return _get_multipart_fields(values, attached_files), None, opened_files
+
+        return None, get_serialized_bytes(values), opened_files
+
+    def _prepare_parameter_value(
+        self,
+        value: Any,
+        multipart_fields: dict[str, Any],
+        opened_files: list[IO],
+        attach_files: bool = True
+    ) -> Any:
+        if isinstance(value, InputFile):
+            if value.type is InputFileType.FILE:
+                file = value.file
+            elif value.type is InputFileType.PATH:
+                file = value.file.open("rb")
+                opened_files.append(file)
+            else:
+                raise ValueError("Incorrect file!")
+
+            if attach_files:
+                while True:
+                    name = secrets.token_urlsafe(8)
+
+                    if name not in multipart_fields:
+                        break
+
+                multipart_fields[name] = (value.name, file)
+
+                return f"attach://{name}"
+
+            return value.name, file
+        elif is_dataclass(value):
+            return {
+                name: self._prepare_parameter_value(
+                    value_,
+                    multipart_fields=multipart_fields,
+                    opened_files=opened_files
+                )
+                for name, value_ in self._converter.get_data(value).items()
+                if value_ is not None
+            }
+        elif isinstance(value, datetime):
+            return get_timestamp(value)
+        elif isinstance(value, list):
+            return [
+                self._prepare_parameter_value(
+                    i,
+                    multipart_fields=multipart_fields,
+                    opened_files=opened_files
+                )
+                for i in value
+            ]
+
+        return value
+
+    def _process_response(
+        self,
+        response: TransportResponse,
+        method: str,
+        parameters: dict[str, Any]
+    ) -> Any:
+        try:
+            data = get_deserialized_data(response.content)
+        except ValueError:
+            raise get_request_error(
+                method=method,
+                parameters=parameters,
+                status_code=response.status_code,
+                description=response.content.decode("UTF-8", "replace")
+            ) from None
+
+        return self._get_response_result(
+            data=data,
+            status_code=response.status_code,
+            method=method,
+            parameters=parameters
+        )
+
+    def _get_response_result(
+        self,
+        data: dict[str, Any],
+        status_code: int,
+        method: str,
+        parameters: dict[str, Any]
+    ) -> Any:
+        if not data["ok"] or (status_code != HTTPStatus.OK):
+            try:
+                response_parameter_data = data["parameters"]
+            except KeyError:
+                response_parameters = None
+            else:
+                response_parameters = self._converter.get_object(
+                    data=response_parameter_data,
+                    class_=ResponseParameters
+                )
+
+            raise get_request_error(
+                method=method,
+                parameters=parameters,
+                status_code=status_code,
+                description=data["description"],
+                response_parameters=response_parameters
+            )
+
+        return data["result"]
+
+    def _get_prepared_inline_query_result(
+        self,
+        result: InlineQueryResult
+    ) -> InlineQueryResult:
+        if isinstance(
+            result,
+            (
+                InlineQueryResultArticle,
+                InlineQueryResultPhoto,
+                InlineQueryResultGif,
+                InlineQueryResultMpeg4Gif,
+                InlineQueryResultVideo,
+                InlineQueryResultAudio,
+                InlineQueryResultVoice,
+                InlineQueryResultDocument,
+                InlineQueryResultLocation,
+                InlineQueryResultVenue,
+                InlineQueryResultContact,
+                InlineQueryResultCachedPhoto,
+                InlineQueryResultCachedGif,
+                InlineQueryResultCachedMpeg4Gif,
+                InlineQueryResultCachedSticker,
+                InlineQueryResultCachedDocument,
+                InlineQueryResultCachedVideo,
+                InlineQueryResultCachedVoice,
+                InlineQueryResultCachedAudio
+            )
+        ):
+            class_ = type(result)
+            data = self._converter.get_data(result)
+
+            if (
+                (data.get("input_message_content") is not None)
+                and isinstance(result.input_message_content, InputTextMessageContent)
+            ):
+                data["input_message_content"]["parse_mode"] = self._get_parse_mode(
+                    parse_mode=data["input_message_content"].get("parse_mode", NOT_SET),
+                    with_entities=bool(
+                        data["input_message_content"].get("entities")
+                    )
+                )
+
+            if isinstance(
+                result,
+                (
+                    InlineQueryResultPhoto,
+                    InlineQueryResultGif,
+                    InlineQueryResultMpeg4Gif,
+                    InlineQueryResultVideo,
+                    InlineQueryResultAudio,
+                    InlineQueryResultVoice,
+                    InlineQueryResultDocument,
+                    InlineQueryResultCachedPhoto,
+                    InlineQueryResultCachedGif,
+                    InlineQueryResultCachedMpeg4Gif,
+                    InlineQueryResultCachedDocument,
+                    InlineQueryResultCachedVideo,
+                    InlineQueryResultCachedVoice,
+                    InlineQueryResultCachedAudio
+                )
+            ):
+                data["parse_mode"] = self._get_parse_mode(
+                    parse_mode=data.get("parse_mode", NOT_SET),
+                    with_entities=bool(
+                        data.get("caption_entities")
+                    )
+                )
+
+            return self._converter.get_object(data=data, class_=class_)
+
+        return result
+
+
+def _get_multipart_fields(
+    values: dict[str, Any],
+    attached_files: dict[str, Any]
+) -> dict[str, Any]:
+    fields = attached_files
+
+    for name, value in values.items():
+        if isinstance(value, (dict, list)):
+            value = get_serialized_data(value)
+        elif not isinstance(value, (str, tuple)):
+            value = str(value)
+
+        fields[name] = value
+
+    return fields
@@ -1,18 +1,15 @@
-from typing import Union, Optional, Any, Literal, IO, BinaryIO
+from typing import Union, Optional, Any, Literal, BinaryIO
 import time
 from datetime import datetime
-from dataclasses import is_dataclass
-import secrets
-from http import HTTPStatus
-
-from requests import Session, Response, RequestException
-from requests_toolbelt import MultipartEncoder
-
-from telebox.bot.utils.converters import DataclassConverter, get_timestamp
-from telebox.bot.errors import get_request_error, BotError, RetryAfterError, InternalServerError
-from telebox.bot.consts import chat_member_statuses
-from telebox.bot.enums.input_file_type import InputFileType
-from telebox.bot.types.types.response_parameters import ResponseParameters
+
+from requests import Session
+
+from telebox.bot.abstract_bot import AbstractBot, API_URL, _CHAT_MEMBER_TYPES
+from telebox.bot.utils.converters import DataclassConverter
+from telebox.bot.utils.send_scheduler.send_scheduler import SendScheduler
+from telebox.bot.transports.transport import AbstractTransport
+from telebox.bot.transports.requests_transport import RequestsTransport
+from telebox.bot.errors import RetryAfterError, InternalServerError
 from telebox.bot.types.types.update import Update
 from telebox.bot.types.types.webhook_info import WebhookInfo
 from telebox.bot.types.types.user import User
@@ -55,10 +52,6 @@ from telebox.bot.types.types.game_high_score import GameHighScore
 from telebox.bot.types.types.chat_member import ChatMember
 from telebox.bot.types.types.chat_member_owner import ChatMemberOwner
 from telebox.bot.types.types.chat_member_administrator import ChatMemberAdministrator
-from telebox.bot.types.types.chat_member_member import ChatMemberMember
-from telebox.bot.types.types.chat_member_restricted import ChatMemberRestricted
-from telebox.bot.types.types.chat_member_left import ChatMemberLeft
-from telebox.bot.types.types.chat_member_banned import ChatMemberBanned
 from telebox.bot.types.types.inline_query_results_button import InlineQueryResultsButton
 from telebox.bot.types.types.reaction_type import ReactionType
 from telebox.bot.types.types.reply_parameters import ReplyParameters
@@ -69,53 +62,15 @@ from telebox.bot.types.types.input_poll_option import InputPollOption
 from telebox.bot.types.types.chat_full_info import ChatFullInfo
 from telebox.bot.types.types.star_transactions import StarTransactions
 from telebox.bot.types.types.input_paid_media import InputPaidMedia
-from telebox.bot.types.types.inline_query_result_article import InlineQueryResultArticle
-from telebox.bot.types.types.inline_query_result_photo import InlineQueryResultPhoto
-from telebox.bot.types.types.inline_query_result_gif import InlineQueryResultGif
-from telebox.bot.types.types.inline_query_result_mpeg4_gif import InlineQueryResultMpeg4Gif
-from telebox.bot.types.types.inline_query_result_video import InlineQueryResultVideo
-from telebox.bot.types.types.inline_query_result_audio import InlineQueryResultAudio
-from telebox.bot.types.types.inline_query_result_voice import InlineQueryResultVoice
-from telebox.bot.types.types.inline_query_result_document import InlineQueryResultDocument
-from telebox.bot.types.types.inline_query_result_location import InlineQueryResultLocation
-from telebox.bot.types.types.inline_query_result_venue import InlineQueryResultVenue
-from telebox.bot.types.types.inline_query_result_contact import InlineQueryResultContact
-from telebox.bot.types.types.inline_query_result_cached_photo import InlineQueryResultCachedPhoto
-from telebox.bot.types.types.inline_query_result_cached_gif import InlineQueryResultCachedGif
-from telebox.bot.types.types.inline_query_result_cached_mpeg4_gif import (
-    InlineQueryResultCachedMpeg4Gif
-)
-from telebox.bot.types.types.inline_query_result_cached_sticker import (
-    InlineQueryResultCachedSticker
-)
-from telebox.bot.types.types.inline_query_result_cached_document import (
-    InlineQueryResultCachedDocument
-)
-from telebox.bot.types.types.inline_query_result_cached_video import InlineQueryResultCachedVideo
-from telebox.bot.types.types.inline_query_result_cached_voice import InlineQueryResultCachedVoice
-from telebox.bot.types.types.inline_query_result_cached_audio import InlineQueryResultCachedAudio
-from telebox.bot.types.types.input_text_message_content import InputTextMessageContent
 from telebox.bot.context import Context
 from telebox.utils.not_set import NotSet, NOT_SET
-from telebox.utils.serialization import get_serialized_data
-
 
-API_URL = "https://api.telegram.org"
-_CHAT_MEMBER_TYPES = {
-    chat_member_statuses.CREATOR: ChatMemberOwner,
-    chat_member_statuses.ADMINISTRATOR: ChatMemberAdministrator,
-    chat_member_statuses.MEMBER: ChatMemberMember,
-    chat_member_statuses.RESTRICTED: ChatMemberRestricted,
-    chat_member_statuses.LEFT: ChatMemberLeft,
-    chat_member_statuses.KICKED: ChatMemberBanned
-}
 
-
-class Bot:
+class Bot(AbstractBot):
 
     def __init__(
         self,
-        session: Session,
+        session: Union[Session, AbstractTransport],
         token: str,
         *,
         api_url: str = API_URL,
@@ -124,34 +79,37 @@ class Bot:
         retries: int = 0,
         retry_delay_secs: Union[int, float] = 0,
         wait_on_rate_limit: bool = False,
-        use_cache: bool = True
+        use_cache: bool = True,
+        lazy_updates: bool = False,
+        converter: Optional[DataclassConverter] = None,
+        send_scheduler: Optional[SendScheduler] = None
     ):
-        if retries < 0:
-            raise ValueError("Number of retries cannot be less than zero!")
+        super().__init__(
+            token,
+            api_url=api_url,
+            parse_mode=parse_mode,
+            timeout_secs=timeout_secs,
+            retries=retries,
+            retry_delay_secs=retry_delay_secs,
+            wait_on_rate_limit=wait_on_rate_limit,
+            use_cache=use_cache,
+            lazy_updates=lazy_updates,
+            converter=converter
+        )
+
+        if isinstance(session, AbstractTransport):
+            self.transport = session
+            self.session = getattr(session, "session", None)
+        else:
+            self.transport = RequestsTransport(session)
+            self.session = session
 
-        self.session = session
-        self.token = token
-        self.api_url = api_url.lower().rstrip("/")
-        self._parse_mode = parse_mode
-        self._timeout_secs = timeout_secs
-        self._retries = retries
-        self._retry_delay_secs = retry_delay_secs
-        self._wait_on_rate_limit = wait_on_rate_limit
-        self._use_cache = use_cache
         self.context = Context(self)
-        self._converter = DataclassConverter()
-        self._user: Optional[User] = None
-        self._cached_file_ids: dict[tuple[str, str], str] = {}
+        self._send_scheduler = send_scheduler
 
     @property
-    def user(self) -> User:
-        if self._user is None:
-            raise BotError(
-                "Bot user was not loaded! To use this property, you need to call "
-                "bot.get_me method at least once!"
-            )
-
-        return self._user
+    def send_scheduler(self) -> Optional[SendScheduler]:
+        return self._send_scheduler
 
     def get_updates(
         self,
@@ -163,19 +121,36 @@ class Bot:
         allowed_updates: Optional[list[str]] = None
     ) -> list[Update]:
         return [
-            self._converter.get_object(data=i, class_=Update)
-            for i in self._send_request(
-                method="getUpdates",
-                parameters={
-                    "offset": offset,
-                    "limit": limit,
-                    "timeout": timeout,
-                    "allowed_updates": allowed_updates
-                },
-                timeout_secs=timeout_secs
+            self.load_update(i)
+            for i in self.get_raw_updates(
+                timeout_secs=timeout_secs,
+                offset=offset,
+                limit=limit,
+                timeout=timeout,
+                allowed_updates=allowed_updates
             )
         ]
 
+    def get_raw_updates(
+        self,
+        *,
+        timeout_secs: Union[int, float, None] = None,
+        offset: Optional[int] = None,
+        limit: Optional[int] = None,
+        timeout: Optional[int] = None,
+        allowed_updates: Optional[list[str]] = None
+    ) -> list[dict[str, Any]]:
+        return self._send_request(
+            method="getUpdates",
+            parameters={
+                "offset": offset,
+                "limit": limit,
+                "timeout": timeout,
+                "allowed_updates": allowed_updates
+            },
+            timeout_secs=timeout_secs
+        )
+
     def set_webhook(
         self,
         url: str,
@@ -3225,13 +3200,12 @@ class Bot:
         chunk_size: int = 64 * 1024
     ) -> None:
         if self.api_url == API_URL:
-            with self.session.get(
-                url=f"{API_URL}/file/bot{self.token}/{path}",
-                stream=True,
-                timeout=timeout_secs or self._timeout_secs
-            ) as response:
-                for chunk in response.iter_content(chunk_size=chunk_size):
-                    file.write(chunk)
+            self.transport.download_file(
+                f"{API_URL}/file/bot{self.token}/{path}",
+                file,
+                timeout_secs=timeout_secs or self._timeout_secs,
+                chunk_size=chunk_size
+            )
         else:
             with open(path, "rb") as local_file:
                 while True:
@@ -3242,14 +3216,6 @@ class Bot:
 
                     file.write(chunk)
 
-    def _set_cached_file_id(self, file: Union[InputFile, str], file_id: str) -> None:
-        if (
-            isinstance(file, InputFile)
-            and (file.type is InputFileType.PATH)
-            and ((file.file, file.name) not in self._cached_file_ids)
-        ):
-            self._cached_file_ids[(file.file, file.name)] = file_id
-
     def _send_request(
         self,
         method: str,
@@ -3264,251 +3230,59 @@ class Bot:
         }
 
         if parameters:
-            data, opened_files = self._prepare_multipart_encoder(parameters)
-            headers = {
-                "Content-Type": data.content_type
-            }
+            fields, json_data, opened_files = self._prepare_request_content(parameters)
         else:
-            data = headers = None
+            fields = json_data = None
             opened_files = []
 
         url = self._get_api_url(method)
         timeout_secs = timeout_secs or self._timeout_secs
+        retry_error_types = (*self.transport.error_types, InternalServerError)
         retries = 0
 
+        if (self._send_scheduler is not None) and self._send_scheduler.check_method(method):
+            send_scheduler = self._send_scheduler
+            chat_id = parameters.get("chat_id")
+        else:
+            send_scheduler = chat_id = None
+
         try:
             while True:
+                if send_scheduler is not None:
+                    send_scheduler.acquire(chat_id)
+
                 try:
                     return self._process_response(
-                        response=self.session.post(
+                        response=self.transport.send_request(
                             url,
-                            data=data,  # NOQA
-                            headers=headers,
-                            timeout=timeout_secs
+                            fields=fields,
+                            json_data=json_data,
+                            timeout_secs=timeout_secs
                         ),
                         method=method,
                         parameters=parameters
                     )
-                except (RequestException, InternalServerError):
+                except retry_error_types:
                     if retries == self._retries:
                         raise
 
                     retries += 1
                     time.sleep(self._retry_delay_secs)
                 except RetryAfterError as error:
+                    if send_scheduler is not None:
+                        send_scheduler.process_retry_after(chat_id, error.retry_after)
+
                     if not self._wait_on_rate_limit:
                         raise
 
                     retries = 0
-                    time.sleep(error.retry_after)
+
+                    if send_scheduler is None:
+                        time.sleep(error.retry_after)
         finally:
             for i in opened_files:
                 i.close()
 
-    def _get_api_url(self, method: str) -> str:
-        return f"{self.api_url}/bot{self.token}/{method}"
-
-    def _get_parse_mode(
-        self,
-        parse_mode: Union[str, None, NotSet],
-        *,
-        with_entities: bool
-    ) -> Optional[str]:
-        if parse_mode is not NOT_SET:
-            return parse_mode
-        elif self._parse_mode is not NOT_SET and not with_entities:
-            return self._parse_mode
-
-    def _get_file(
-        self,
-        file: Union[InputFile, str]
-    ) -> Union[InputFile, str]:
-        if (
-            self._use_cache
-            and isinstance(file, InputFile)
-            and (file.type is InputFileType.PATH)
-        ):
-            return self._cached_file_ids.get((file.file, file.name), file)
-
-        return file
-
-    def _prepare_multipart_encoder(
-        self,
-        parameters: dict[str, Any]
-    ) -> tuple[MultipartEncoder, list[IO]]:
-        fields: dict[str, Any] = {}
-        opened_files: list[IO] = []
-
-        for name, value in parameters.items():
-            value = self._prepare_parameter_value(
-                value,
-                multipart_fields=fields,
-                opened_files=opened_files,
-                attach_files=False
-            )
-
-            if isinstance(value, (dict, list)):
-                value = get_serialized_data(value)
-            elif not isinstance(value, (str, tuple)):
-                value = str(value)
-
-            fields[name] = value
-
-        return MultipartEncoder(fields), opened_files
-
-    def _prepare_parameter_value(
-        self,
-        value: Any,
-        multipart_fields: dict[str, Any],
-        opened_files: list[IO],
-        attach_files: bool = True
-    ) -> Any:
-        if isinstance(value, InputFile):
-            if value.type is InputFileType.FILE:
-                file = value.file
-            elif value.type is InputFileType.PATH:
-                file = value.file.open("rb")
-                opened_files.append(file)
-            else:
-                raise ValueError("Incorrect file!")
-
-            if attach_files:
-                while True:
-                    name = secrets.token_urlsafe(8)
-
-                    if name not in multipart_fields:
-                        break
-
-                multipart_fields[name] = (value.name, file)
-
-                return f"attach://{name}"
-
-            return value.name, file
-        elif is_dataclass(value):
-            return {
-                name: self._prepare_parameter_value(
-                    value_,
-                    multipart_fields=multipart_fields,
-                    opened_files=opened_files
-                )
-                for name, value_ in self._converter.get_data(value).items()
-                if value_ is not None
-            }
-        elif isinstance(value, datetime):
-            return get_timestamp(value)
-        elif isinstance(value, list):
-            return [
-                self._prepare_parameter_value(
-                    i,
-                    multipart_fields=multipart_fields,
-                    opened_files=opened_files
-                )
-                for i in value
-            ]
-
-        return value
-
-    def _process_response(
-        self,
-        response: Response,
-        method: str,
-        parameters: dict[str, Any]
-    ) -> Any:
-        data = response.json()
-
-        if not data["ok"] or (response.status_code != HTTPStatus.OK):
-            try:
-                response_parameter_data = data["parameters"]
-            except KeyError:
-                response_parameters = None
-            else:
-                response_parameters = self._converter.get_object(
-                    data=response_parameter_data,
-                    class_=ResponseParameters
-                )
-
-            raise get_request_error(
-                method=method,
-                parameters=parameters,
-                status_code=response.status_code,
-                description=data["description"],
-                response_parameters=response_parameters
-            )
-
-        return data["result"]
-
-    def _get_prepared_inline_query_result(
-        self,
-        result: InlineQueryResult
-    ) -> InlineQueryResult:
-        if isinstance(
-            result,
-            (
-                InlineQueryResultArticle,
-                InlineQueryResultPhoto,
-                InlineQueryResultGif,
-                InlineQueryResultMpeg4Gif,
-                InlineQueryResultVideo,
-                InlineQueryResultAudio,
-                InlineQueryResultVoice,
-                InlineQueryResultDocument,
-                InlineQueryResultLocation,
-                InlineQueryResultVenue,
-                InlineQueryResultContact,
-                InlineQueryResultCachedPhoto,
-                InlineQueryResultCachedGif,
-                InlineQueryResultCachedMpeg4Gif,
-                InlineQueryResultCachedSticker,
-                InlineQueryResultCachedDocument,
-                InlineQueryResultCachedVideo,
-                InlineQueryResultCachedVoice,
-                InlineQueryResultCachedAudio
-            )
-        ):
-            class_ = type(result)
-            data = self._converter.get_data(result)
-
-            if (
-                (data.get("input_message_content") is not None)
-                and isinstance(result.input_message_content, InputTextMessageContent)
-            ):
-                data["input_message_content"]["parse_mode"] = self._get_parse_mode(
-                    parse_mode=data["input_message_content"].get("parse_mode", NOT_SET),
-                    with_entities=bool(
-                        data["input_message_content"].get("entities")
-                    )
-                )
-
-            if isinstance(
-                result,
-                (
-                    InlineQueryResultPhoto,
-                    InlineQueryResultGif,
-                    InlineQueryResultMpeg4Gif,
-                    InlineQueryResultVideo,
-                    InlineQueryResultAudio,
-                    InlineQueryResultVoice,
-                    InlineQueryResultDocument,
-                    InlineQueryResultCachedPhoto,
-                    InlineQueryResultCachedGif,
-                    InlineQueryResultCachedMpeg4Gif,
-                    InlineQueryResultCachedDocument,
-                    InlineQueryResultCachedVideo,
-                    InlineQueryResultCachedVoice,
-                    InlineQueryResultCachedAudio
-                )
-            ):
-                data["parse_mode"] = self._get_parse_mode(
-                    parse_mode=data.get("parse_mode", NOT_SET),
-                    with_entities=bool(
-                        data.get("caption_entities")
-                    )
-                )
-
-            return self._converter.get_object(data=data, class_=class_)
-
-        return result
-
 
 class BotContext:
 
@@ -3523,7 +3297,10 @@ class BotContext:
         retries: int = 0,
         retry_delay_secs: Union[int, float] = 0,
         wait_on_rate_limit: bool = False,
-        use_cache: bool = True
+        use_cache: bool = True,
+        lazy_updates: bool = False,
+        converter: Optional[DataclassConverter] = None,
+        send_scheduler: Optional[SendScheduler] = None
     ):
         self._token = token
         self._get_me = get_me
@@ -3534,12 +3311,15 @@ class BotContext:
         self._retry_delay_secs = retry_delay_secs
         self._wait_on_rate_limit = wait_on_rate_limit
         self._use_cache = use_cache
-        self._session: Optional[Session] = None
+        self._lazy_updates = lazy_updates
+        self._converter = converter
+        self._send_scheduler = send_scheduler
+        self._transport: Optional[RequestsTransport] = None
 
     def __enter__(self) -> Bot:
-        self._session = Session()
+        self._transport = RequestsTransport()
         bot = Bot(
-            self._session,
+            self._transport,
             token=self._token,
             api_url=self._api_url,
             parse_mode=self._parse_mode,
@@ -3547,7 +3327,10 @@ class BotContext:
             retries=self._retries,
             retry_delay_secs=self._retry_delay_secs,
             wait_on_rate_limit=self._wait_on_rate_limit,
-            use_cache=self._use_cache
+            use_cache=self._use_cache,
+            lazy_updates=self._lazy_updates,
+            converter=self._converter,
+            send_scheduler=self._send_scheduler
         )
 
         if self._get_me:
@@ -3556,7 +3339,7 @@ class BotContext:
         return bot
 
     def __exit__(self, exc_type, exc_val, exc_tb):
-        self._session.close()
+        self._transport.close()
 
 
 def get_bot(
@@ -3569,7 +3352,10 @@ def get_bot(
     retries: int = 0,
     retry_delay_secs: Union[int, float] = 0,
     wait_on_rate_limit: bool = False,
-    use_cache: bool = True
+    use_cache: bool = True,
+    lazy_updates: bool = False,
+    converter: Optional[DataclassConverter] = None,
+    send_scheduler: Optional[SendScheduler] = None
 ) -> BotContext:
     return BotContext(
         token,
@@ -3580,5 +3366,8 @@ def get_bot(
         retries=retries,
         retry_delay_secs=retry_delay_secs,
         wait_on_rate_limit=wait_on_rate_limit,
-        use_cache=use_cache
+        use_cache=use_cache,
+        lazy_updates=lazy_updates,
+        converter=converter,
+        send_scheduler=send_scheduler
     )
@@ -0,0 +1,15 @@
+from .broadcaster import Broadcaster
+from .broadcast_message import BroadcastMessage
+from .broadcast_stats import BroadcastStats
+from .checkpoint import BroadcastCheckpoint, BroadcastFailure
+from .fake_api_server import FakeAPIServer
+
+
+__all__ = [
+    "Broadcaster",
+    "BroadcastMessage",
+    "BroadcastStats",
+    "BroadcastCheckpoint",
+    "BroadcastFailure",
+    "FakeAPIServer"
+]
@@ -0,0 +1,14 @@
+from dataclasses import dataclass, field
+from typing import Union, Any, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from telebox.bot.bot import Bot
+
+
+@dataclass(frozen=True)
+class BroadcastMessage:
+    method: str
+    kwargs: dict[str, Any] = field(default_factory=dict)
+
+    def send(self, bot: "Bot", chat_id: Union[int, str]) -> Any:
+        return getattr(bot, self.method)(chat_id=chat_id, **self.kwargs)
@@ -0,0 +1,17 @@
+from dataclasses import dataclass
+
+
+@dataclass
+class BroadcastStats:
+    sent: int = 0
+    failed: int = 0
+    blocked: int = 0
+    elapsed_secs: float = 0
+
+    @property
+    def processed(self) -> int:
+        return self.sent + self.failed + self.blocked
+
+    @property
+    def throughput(self) -> float:
+        return self.processed / self.elapsed_secs if self.elapsed_secs else 0
@@ -0,0 +1,303 @@
+import logging
+from typing import Optional, Union, Callable, Iterable, Any, TYPE_CHECKING
+from threading import Thread, Lock
+from queue import Queue
+import itertools
+import os
+import time
+
+if TYPE_CHECKING:
+    from telebox.bot.bot import Bot
+from telebox.bot.errors import RequestError, RetryAfterError, ForbiddenError
+from telebox.bot.transports.requests_transport import RequestsTransport
+from telebox.bot.utils.send_scheduler.send_scheduler import SendScheduler
+from telebox.bot.broadcasting.broadcast_message import BroadcastMessage
+from telebox.bot.broadcasting.broadcast_stats import BroadcastStats
+from telebox.bot.broadcasting.checkpoint import BroadcastCheckpoint, BroadcastFailure
+from telebox.bot.broadcasting.fake_api_server import FakeAPIServer
+
+
+logger = logging.getLogger(__name__)
+
+
+class Broadcaster:
+
+    def __init__(
+        self,
+        bot: "Bot",
+        *,
+        workers: int = 10,
+        send_scheduler: Optional[SendScheduler] = None,
+        checkpoint_path: Union[str, os.PathLike, None] = None,
+        checkpoint_interval: int = 1000,
+        report_interval_secs: Union[int, float] = 10,
+        report_callback: Optional[Callable[[BroadcastStats], Any]] = None
+    ):
+        if workers < 1:
+            raise ValueError("Number of workers cannot be less than one!")
+
+        if checkpoint_interval < 1:
+            raise ValueError("Checkpoint interval cannot be less than one!")
+
+        self.bot = bot
+        self._workers = workers
+        self._send_scheduler = send_scheduler if send_scheduler is not None else SendScheduler()
+        self._checkpoint = BroadcastCheckpoint(checkpoint_path) if checkpoint_path is not None else None
+        self._checkpoint_interval = checkpoint_interval
+        self._report_interval_secs = report_interval_secs
+        self._report_callback = report_callback
+        self._lock = Lock()
+        self._stats = BroadcastStats()
+        self._failures: dict[Union[int, str], BroadcastFailure] = {}
+        self._position = 0
+        self._completed_positions: set[int] = set()
+        self._saved_position = 0
+        self._start_time = 0.0
+        self._initial_elapsed_secs = 0.0
+        self._last_report_time = 0.0
+        self._error: Optional[Exception] = None
+
+    @property
+    def failures(self) -> list[BroadcastFailure]:
+        with self._lock:
+            return list(self._failures.values())
+
+    def get_stats(self) -> BroadcastStats:
+        with self._lock:
+            return self._get_stats()
+
+    def run(
+        self,
+        chat_ids: Iterable[Union[int, str]],
+        message: BroadcastMessage,
+        *,
+        dry_run: bool = False,
+        blocked_chat_ids: Optional[Iterable[Union[int, str]]] = None
+    ) -> BroadcastStats:
+        if not dry_run:
+            return self._run(chat_ids, message)
+
+        from telebox.bot.bot import Bot
+
+        with FakeAPIServer(blocked_chat_ids=blocked_chat_ids) as server:
+            transport = RequestsTransport()
+
+            try:
+                # A separate broadcaster keeps the state, checkpoint and scheduler
+                # of real broadcasts untouched.
+                broadcaster = Broadcaster(
+                    Bot(transport, self.bot.token, api_url=server.api_url),
+                    workers=self._workers,
+                    report_interval_secs=self._report_interval_secs,
+                    report_callback=self._report_callback
+                )
+
+                return broadcaster.run(chat_ids, message)
+            finally:
+                transport.close()
+
+    def _run(self, chat_ids: Iterable[Union[int, str]], message: BroadcastMessage) -> BroadcastStats:
+        self._load_checkpoint()
+        self._error = None
+        self._start_time = self._last_report_time = time.monotonic()
+        logger.info("Broadcast started from position %r.", self._position)
+        chat_queue: Queue[Optional[tuple[int, Union[int, str]]]] = Queue(maxsize=self._workers * 2)
+        # Sending is already throttled by the bot if it has its own scheduler.
+        send_scheduler = self._send_scheduler if self.bot.send_scheduler is None else None
+        threads = [
+            Thread(
+                target=self._process_chats,
+                args=(message, chat_queue, send_scheduler),
+                daemon=True
+            )
+            for _ in range(self._workers)
+        ]
+
+        for i in threads:
+            i.start()
+
+        try:
+            for i in itertools.islice(enumerate(chat_ids), self._position, None):
+                if self._error is not None:
+                    break
+
+                chat_queue.put(i)
+        finally:
+            for _ in threads:
+                chat_queue.put(None)
+
+            for i in threads:
+                i.join()
+
+            with self._lock:
+                self._save_checkpoint()
+                stats = self._get_stats()
+
+        if self._error is not None:
+            raise self._error
+
+        logger.info(
+            "Broadcast finished: sent=%r, failed=%r, blocked=%r, throughput=%.2f/s.",
+            stats.sent,
+            stats.failed,
+            stats.blocked,
+            stats.throughput
+        )
+
+        return stats
+
+    def _process_chats(
+        self,
+        message: BroadcastMessage,
+        chat_queue: "Queue[Optional[tuple[int, Union[int, str]]]]",
+        send_scheduler: Optional[SendScheduler]
+    ) -> None:
+        while True:
+            item = chat_queue.get()
+
+            if item is None:
+                return
+
+            # Chats are still taken from the queue after an error, so the run is not blocked.
+            if self._error is not None:
+                continue
+
+            # noinspection PyBroadException
+            try:
+                self._process_chat(message, send_scheduler, *item)
+            except Exception as error:
+                logger.exception("An error occurred while completing a broadcast to chat %r!", item[1])
+
+                with self._lock:
+                    if self._error is None:
+                        self._error = error
+
+    def _process_chat(
+        self,
+        message: BroadcastMessage,
+        send_scheduler: Optional[SendScheduler],
+        position: int,
+        chat_id: Union[int, str]
+    ) -> None:
+        failure = self._failures.get(chat_id)
+
+        if failure is not None:
+            self._set_completion(position, failure, is_recorded=True)
+            return
+
+        while True:
+            if send_scheduler is not None:
+                send_scheduler.acquire(chat_id)
+
+            # noinspection PyBroadException
+            try:
+                message.send(self.bot, chat_id)
+            except RetryAfterError as error:
+                if send_scheduler is not None:
+                    send_scheduler.process_retry_after(chat_id, error.retry_after)
+
+                continue
+            except RequestError as error:
+                failure = BroadcastFailure(
+                    chat_id=chat_id,
+                    error=type(error).__name__,
+                    description=error.description,
+                    blocked=isinstance(error, ForbiddenError)
+                )
+            except Exception as error:
+                logger.exception("An error occurred while broadcasting to chat %r!", chat_id)
+                failure = BroadcastFailure(
+                    chat_id=chat_id,
+                    error=type(error).__name__,
+                    description=str(error),
+                    blocked=False
+                )
+
+            break
+
+        self._set_completion(position, failure)
+
+    def _set_completion(
+        self,
+        position: int,
+        failure: Optional[BroadcastFailure] = None,
+        *,
+        is_recorded: bool = False
+    ) -> None:
+        with self._lock:
+            if failure is None:
+                self._stats.sent += 1
+            else:
+                if failure.blocked:
+                    self._stats.blocked += 1
+                else:
+                    self._stats.failed += 1
+
+                if not is_recorded:
+                    self._failures[failure.chat_id] = failure
+
+                    if self._checkpoint is not None:
+                        self._checkpoint.add_failure(failure)
+
+            self._completed_positions.add(position)
+
+            while self._position in self._completed_positions:
+                self._completed_positions.remove(self._position)
+                self._position += 1
+
+            if (
+                (self._checkpoint is not None)
+                and (self._position - self._saved_position >= self._checkpoint_interval)
+            ):
+                self._save_checkpoint()
+
+            now = time.monotonic()
+
+            if now - self._last_report_time >= self._report_interval_secs:
+                self._last_report_time = now
+                self._report()
+
+    def _report(self) -> None:
+        stats = self._get_stats()
+        logger.info(
+            "Broadcast progress: sent=%r, failed=%r, blocked=%r, throughput=%.2f/s.",
+            stats.sent,
+            stats.failed,
+            stats.blocked,
+            stats.throughput
+        )
+
+        if self._report_callback is not None:
+            # noinspection PyBroadException
+            try:
+                self._report_callback(stats)
+            except Exception:
+                logger.exception("An error occurred in broadcast report callback!")
+
+    def _get_stats(self) -> BroadcastStats:
+        return BroadcastStats(
+            sent=self._stats.sent,
+            failed=self._stats.failed,
+            blocked=self._stats.blocked,
+            elapsed_secs=self._initial_elapsed_secs + time.monotonic() - self._start_time
+        )
+
+    def _load_checkpoint(self) -> None:
+        self._completed_positions.clear()
+
+        if self._checkpoint is None:
+            self._position = self._saved_position = 0
+            self._stats = BroadcastStats()
+            self._failures = {}
+            self._initial_elapsed_secs = 0
+        else:
+            state = self._checkpoint.load()
+            self._position = self._saved_position = state.position
+            self._stats = state.stats
+            self._failures = state.failures
+            self._initial_elapsed_secs = state.stats.elapsed_secs
+
+    def _save_checkpoint(self) -> None:
+        if self._checkpoint is not None:
+            self._checkpoint.save(self._position, self._get_stats())
+            self._saved_position = self._position
@@ -0,0 +1,81 @@
+from dataclasses import dataclass, field
+from typing import Union
+from pathlib import Path
+import os
+
+from telebox.bot.broadcasting.broadcast_stats import BroadcastStats
+from telebox.utils.serialization import get_serialized_bytes, get_deserialized_data
+
+
+@dataclass
+class BroadcastFailure:
+    chat_id: Union[int, str]
+    error: str
+    description: str
+    blocked: bool
+
+
+@dataclass
+class CheckpointState:
+    position: int = 0
+    stats: BroadcastStats = field(default_factory=BroadcastStats)
+    failures: dict[Union[int, str], BroadcastFailure] = field(default_factory=dict)
+
+
+class BroadcastCheckpoint:
+
+    def __init__(self, path: Union[str, os.PathLike]):
+        self.path = Path(path)
+        self.failures_path = self.path.with_name(f"{self.path.name}.failures")
+
+    def load(self) -> CheckpointState:
+        if not self.path.exists():
+            return CheckpointState()
+
+        data = get_deserialized_data(self.path.read_bytes())
+        state = CheckpointState(
+            position=data["position"],
+            stats=BroadcastStats(
+                sent=data["sent"],
+                failed=data["failed"],
+                blocked=data["blocked"],
+                elapsed_secs=data["elapsed_secs"]
+            )
+        )
+
+        if self.failures_path.exists():
+            with self.failures_path.open("rb") as file:
+                for i in file:
+                    failure = BroadcastFailure(**get_deserialized_data(i))
+                    state.failures[failure.chat_id] = failure
+
+        return state
+
+    def save(self, position: int, stats: BroadcastStats) -> None:
+        temp_path = self.path.with_name(f"{self.path.name}.tmp")
+
+        with temp_path.open("wb") as file:
+            file.write(
+                get_serialized_bytes({
+                    "position": position,
+                    "sent": stats.sent,
+                    "failed": stats.failed,
+                    "blocked": stats.blocked,
+                    "elapsed_secs": stats.elapsed_secs
+                })
+            )
+            file.flush()
+            os.fsync(file.fileno())
+
+        os.replace(temp_path, self.path)
+
+    def add_failure(self, failure: BroadcastFailure) -> None:
+        with self.failures_path.open("ab") as file:
+            file.write(
+                get_serialized_bytes({
+                    "chat_id": failure.chat_id,
+                    "error": failure.error,
+                    "description": failure.description,
+                    "blocked": failure.blocked
+                }) + b"\n"
+            )
@@ -0,0 +1,156 @@
+import logging
+from typing import Optional, Union, Iterable, Any
+from http import HTTPStatus
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from threading import Thread, Lock
+from email.parser import BytesParser
+from email.policy import HTTP
+import itertools
+import time
+
+from telebox.utils.serialization import get_serialized_bytes, get_deserialized_data
+
+
+logger = logging.getLogger(__name__)
+_BLOCKED_DESCRIPTION = "Forbidden: bot was blocked by the user"
+
+
+class FakeAPIServer:
+
+    def __init__(
+        self,
+        *,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        blocked_chat_ids: Optional[Iterable[Union[int, str]]] = None,
+        response_delay_secs: Union[int, float] = 0
+    ):
+        self.blocked_chat_ids = set(blocked_chat_ids or ())
+        self.response_delay_secs = response_delay_secs
+        self.requests = 0
+        self._message_ids = itertools.count(1)
+        self._lock = Lock()
+        self._server = ThreadingHTTPServer((host, port), _get_request_handler(self))
+        self._server.daemon_threads = True
+        self._thread: Optional[Thread] = None
+
+    def __enter__(self):
+        self.start()
+
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.stop()
+
+    @property
+    def api_url(self) -> str:
+        host, port = self._server.server_address[:2]
+
+        return f"http://{host}:{port}"
+
+    def start(self) -> None:
+        self._thread = Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        logger.info("Fake API server started on %s.", self.api_url)
+
+    def stop(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+        self._thread = None
+        logger.info("Fake API server stopped.")
+
+    def get_response(self, method: str, parameters: dict[str, Any]) -> tuple[int, dict[str, Any]]:
+        with self._lock:
+            self.requests += 1
+            message_id = next(self._message_ids)
+
+        if self.response_delay_secs:
+            time.sleep(self.response_delay_secs)
+
+        chat_id = parameters.get("chat_id", 0)
+
+        if chat_id in self.blocked_chat_ids:
+            return HTTPStatus.FORBIDDEN, {
+                "ok": False,
+                "error_code": HTTPStatus.FORBIDDEN,
+                "description": _BLOCKED_DESCRIPTION
+            }
+
+        if method.lower().startswith(("send", "forward", "copy")):
+            result = {
+                "message_id": message_id,
+                "date": int(time.time()),
+                "chat": {
+                    "id": chat_id,
+                    "type": "private" if isinstance(chat_id, int) and (chat_id > 0) else "supergroup"
+                }
+            }
+        else:
+            result = True
+
+        return HTTPStatus.OK, {"ok": True, "result": result}
+
+
+def _get_request_handler(server: FakeAPIServer) -> type[BaseHTTPRequestHandler]:
+
+    class RequestHandler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_POST(self) -> None:  # NOQA
+            content = self.rfile.read(int(self.headers.get("Content-Length") or 0))
+            content_type = self.headers.get("Content-Type", "")
+
+            if not content:
+                parameters = {}
+            elif content_type.startswith("application/json"):
+                parameters = get_deserialized_data(content)
+            elif content_type.startswith("multipart/form-data"):
+                parameters = _get_multipart_parameters(content_type, content)
+            else:
+                parameters = None
+
+            if parameters is None:
+                status_code, data = HTTPStatus.BAD_REQUEST, {
+                    "ok": False,
+                    "error_code": HTTPStatus.BAD_REQUEST,
+                    "description": f"Bad Request: unsupported content type {content_type!r}"
+                }
+            else:
+                status_code, data = server.get_response(self.path.rsplit("/", 1)[-1], parameters)
+
+            body = get_serialized_bytes(data)
+            self.send_response(status_code)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format_: str, *args: Any) -> None:  # NOQA
+            logger.debug(format_, *args)
+
+    return RequestHandler
+
+
+def _get_multipart_parameters(content_type: str, content: bytes) -> dict[str, Any]:
+    message = BytesParser(policy=HTTP).parsebytes(
+        b"Content-Type: " + content_type.encode("latin-1") + b"\r\n\r\n" + content
+    )
+    parameters = {}
+
+    for part in message.iter_parts():
+        name = part.get_param("name", header="Content-Disposition")
+
+        if (name is None) or (part.get_filename() is not None):
+            continue
+
+        value = part.get_content()
+
+        # Multipart fields are strings, so scalars such as chat IDs are restored from JSON.
+        try:
+            value = get_deserialized_data(value)
+        except ValueError:
+            pass
+
+        parameters[name] = value
+
+    return parameters
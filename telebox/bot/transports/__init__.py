@@ -0,0 +1,16 @@
+from .transport import AbstractTransport, TransportResponse, TransportStats
+from .requests_transport import RequestsTransport
+from .httpx_transport import HTTPXTransport
+from .async_transport import AbstractAsyncTransport
+from .aiohttp_transport import AiohttpTransport
+
+
+__all__ = [
+    "AbstractTransport",
+    "TransportResponse",
+    "TransportStats",
+    "RequestsTransport",
+    "HTTPXTransport",
+    "AbstractAsyncTransport",
+    "AiohttpTransport"
+]
@@ -0,0 +1,103 @@
+from typing import Any, Optional, Union, BinaryIO, TYPE_CHECKING
+import asyncio
+
+from telebox.bot.transports.transport import TransportResponse, JSON_HEADERS
+from telebox.bot.transports.async_transport import AbstractAsyncTransport
+if TYPE_CHECKING:
+    from aiohttp import ClientSession, FormData
+
+
+class AiohttpTransport(AbstractAsyncTransport):
+
+    def __init__(
+        self,
+        session: Optional["ClientSession"] = None,
+        *,
+        limit: int = 100
+    ):
+        try:
+            import aiohttp
+        except ImportError:
+            raise ImportError(
+                "To use async bot you need to install «aiohttp»:"
+                "\npip install -U telebox[async]"
+            ) from None
+
+        super().__init__()
+        self.error_types = (aiohttp.ClientError, asyncio.TimeoutError)
+        self.timeout_error_types = (asyncio.TimeoutError,)
+
+        self._limit = limit
+        self.session = (
+            session
+            if session is not None
+            else aiohttp.ClientSession(connector=aiohttp.TCPConnector(limit=limit))
+        )
+
+    @property
+    def pool_size(self) -> int:
+        connector = self.session.connector
+
+        return connector.limit if connector is not None else self._limit
+
+    async def download_file(
+        self,
+        url: str,
+        file: BinaryIO,
+        *,
+        timeout_secs: Union[int, float, None] = None,
+        chunk_size: int = 64 * 1024
+    ) -> None:
+        from aiohttp import ClientTimeout
+
+        async with self.session.get(url, timeout=ClientTimeout(total=timeout_secs)) as response:
+            async for chunk in response.content.iter_chunked(chunk_size):
+                file.write(chunk)
+
+    async def close(self) -> None:
+        await self.session.close()
+
+    async def _send_request(
+        self,
+        url: str,
+        *,
+        fields: Optional[dict[str, Any]],
+        json_data: Optional[bytes],
+        timeout_secs: Union[int, float, None]
+    ) -> TransportResponse:
+        from aiohttp import ClientTimeout
+
+        if fields:
+            data = _get_form_data(fields)
+            headers = None
+        elif json_data is not None:
+            data = json_data
+            headers = JSON_HEADERS
+        else:
+            data = headers = None
+
+        async with self.session.post(
+            url,
+            data=data,
+            headers=headers,
+            timeout=ClientTimeout(total=timeout_secs)
+        ) as response:
+            return TransportResponse(
+                status_code=response.status,
+                content=await response.read()
+            )
+
+
+def _get_form_data(fields: dict[str, Any]) -> "FormData":
+    from aiohttp import FormData
+
+    form_data = FormData()
+
+    for name, value in fields.items():
+        if isinstance(value, tuple):
+            file_name, file = value
+            form_data.add_field(name, file, filename=file_name)
+        else:
+            form_data.add_field(name, value)
+
+    return form_data
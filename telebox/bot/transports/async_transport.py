@@ -0,0 +1,78 @@
+from abc import ABC, abstractmethod
+from typing import Any, Optional, Union, BinaryIO
+
+from telebox.bot.transports.transport import TransportResponse, TransportStats
+
+
+class AbstractAsyncTransport(ABC):
+    error_types: tuple[type[Exception], ...] = ()
+    timeout_error_types: tuple[type[Exception], ...] = ()
+
+    def __init__(self):
+        self._in_flight_requests = 0
+        self._peak_in_flight_requests = 0
+        self._total_requests = 0
+
+    @property
+    @abstractmethod
+    def pool_size(self) -> int:
+        pass
+
+    async def send_request(
+        self,
+        url: str,
+        *,
+        fields: Optional[dict[str, Any]] = None,
+        json_data: Optional[bytes] = None,
+        timeout_secs: Union[int, float, None] = None
+    ) -> TransportResponse:
+        self._in_flight_requests += 1
+        self._total_requests += 1
+        self._peak_in_flight_requests = max(
+            self._peak_in_flight_requests,
+            self._in_flight_requests
+        )
+
+        try:
+            return await self._send_request(
+                url,
+                fields=fields,
+                json_data=json_data,
+                timeout_secs=timeout_secs
+            )
+        finally:
+            self._in_flight_requests -= 1
+
+    @abstractmethod
+    async def download_file(
+        self,
+        url: str,
+        file: BinaryIO,
+        *,
+        timeout_secs: Union[int, float, None] = None,
+        chunk_size: int = 64 * 1024
+    ) -> None:
+        pass
+
+    def get_stats(self) -> TransportStats:
+        return TransportStats(
+            pool_size=self.pool_size,
+            in_flight_requests=self._in_flight_requests,
+            peak_in_flight_requests=self._peak_in_flight_requests,
+            total_requests=self._total_requests
+        )
+
+    @abstractmethod
+    async def close(self) -> None:
+        pass
+
+    @abstractmethod
+    async def _send_request(
+        self,
+        url: str,
+        *,
+        fields: Optional[dict[str, Any]],
+        json_data: Optional[bytes],
+        timeout_secs: Union[int, float, None]
+    ) -> TransportResponse:
+        pass
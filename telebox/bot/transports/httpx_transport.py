@@ -0,0 +1,110 @@
+from typing import Any, Optional, Union, BinaryIO, TYPE_CHECKING
+
+from telebox.bot.transports.transport import AbstractTransport, TransportResponse, JSON_HEADERS
+if TYPE_CHECKING:
+    from httpx import Client
+
+
+class HTTPXTransport(AbstractTransport):
+
+    def __init__(
+        self,
+        client: Optional["Client"] = None,
+        *,
+        max_connections: int = 100,
+        max_keepalive_connections: int = 20,
+        keepalive_expiry_secs: Union[int, float, None] = 5,
+        http2: bool = True
+    ):
+        try:
+            import httpx
+        except ImportError:
+            raise ImportError(
+                "To use HTTPX transport you need to install «httpx»:"
+                "\npip install -U telebox[http2]"
+            ) from None
+
+        super().__init__()
+        self.error_types = (httpx.HTTPError,)
+        self.timeout_error_types = (httpx.TimeoutException,)
+
+        self._max_connections = max_connections
+        self._max_keepalive_connections = max_keepalive_connections
+        self._keepalive_expiry_secs = keepalive_expiry_secs
+        self._http2 = http2
+        self._owns_client = client is None
+        self.client = client if client is not None else self._get_client()
+
+    @property
+    def pool_size(self) -> int:
+        return self._max_connections
+
+    def download_file(
+        self,
+        url: str,
+        file: BinaryIO,
+        *,
+        timeout_secs: Union[int, float, None] = None,
+        chunk_size: int = 64 * 1024
+    ) -> None:
+        with self.client.stream("GET", url, timeout=timeout_secs) as response:
+            for chunk in response.iter_bytes(chunk_size=chunk_size):
+                file.write(chunk)
+
+    def reset(self) -> None:
+        super().reset()
+
+        if self._owns_client:
+            self.client = self._get_client()
+
+    def close(self) -> None:
+        self.client.close()
+
+    def _get_client(self) -> "Client":
+        import httpx
+
+        return httpx.Client(
+            http2=self._http2,
+            limits=httpx.Limits(
+                max_connections=self._max_connections,
+                max_keepalive_connections=self._max_keepalive_connections,
+                keepalive_expiry=self._keepalive_expiry_secs
+            )
+        )
+
+    def _send_request(
+        self,
+        url: str,
+        *,
+        fields: Optional[dict[str, Any]],
+        json_data: Optional[bytes],
+        timeout_secs: Union[int, float, None]
+    ) -> TransportResponse:
+        if json_data is not None:
+            response = self.client.post(
+                url,
+                content=json_data,
+                headers=JSON_HEADERS,
+                timeout=timeout_secs
+            )
+        else:
+            data = {}
+            files = {}
+
+            for name, value in (fields or {}).items():
+                if isinstance(value, tuple):
+                    files[name] = value
+                else:
+                    data[name] = value
+
+            response = self.client.post(
+                url,
+                data=data or None,
+                files=files or None,
+                timeout=timeout_secs
+            )
+
+        return TransportResponse(
+            status_code=response.status_code,
+            content=response.content
+        )
@@ -0,0 +1,123 @@
+from typing import Any, Optional, Union, BinaryIO
+import socket
+
+from requests import Session, RequestException
+from requests.adapters import HTTPAdapter
+from requests.exceptions import Timeout
+from requests_toolbelt import MultipartEncoder
+from urllib3.connection import HTTPConnection
+
+from telebox.bot.transports.transport import AbstractTransport, TransportResponse, JSON_HEADERS
+
+
+class RequestsTransport(AbstractTransport):
+    error_types = (RequestException,)
+    timeout_error_types = (Timeout,)
+
+    def __init__(
+        self,
+        session: Optional[Session] = None,
+        *,
+        pool_connections: int = 10,
+        pool_maxsize: int = 100,
+        pool_block: bool = False,
+        keep_alive: bool = True,
+        tcp_nodelay: bool = True
+    ):
+        super().__init__()
+
+        if session is None:
+            session = Session()
+            adapter = _SocketOptionsHTTPAdapter(
+                socket_options=_get_socket_options(tcp_nodelay=tcp_nodelay),
+                pool_connections=pool_connections,
+                pool_maxsize=pool_maxsize,
+                pool_block=pool_block
+            )
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+
+            if not keep_alive:
+                session.headers["Connection"] = "close"
+
+        self.session = session
+
+    @property
+    def pool_size(self) -> int:
+        # Pool options are only applied to the default session, so the size is
+        # read from the adapter that is actually mounted.
+        adapter = self.session.get_adapter("https://")
+
+        return getattr(adapter, "_pool_maxsize", 0)
+
+    def download_file(
+        self,
+        url: str,
+        file: BinaryIO,
+        *,
+        timeout_secs: Union[int, float, None] = None,
+        chunk_size: int = 64 * 1024
+    ) -> None:
+        with self.session.get(url=url, stream=True, timeout=timeout_secs) as response:
+            for chunk in response.iter_content(chunk_size=chunk_size):
+                file.write(chunk)
+
+    def reset(self) -> None:
+        super().reset()
+        self.session.close()
+
+    def close(self) -> None:
+        self.session.close()
+
+    def _send_request(
+        self,
+        url: str,
+        *,
+        fields: Optional[dict[str, Any]],
+        json_data: Optional[bytes],
+        timeout_secs: Union[int, float, None]
+    ) -> TransportResponse:
+        if fields:
+            data = MultipartEncoder(fields)
+            headers = {
+                "Content-Type": data.content_type
+            }
+        elif json_data is not None:
+            data = json_data
+            headers = JSON_HEADERS
+        else:
+            data = headers = None
+
+        response = self.session.post(
+            url,
+            data=data,  # NOQA
+            headers=headers,
+            timeout=timeout_secs
+        )
+
+        return TransportResponse(
+            status_code=response.status_code,
+            content=response.content
+        )
+
+
+class _SocketOptionsHTTPAdapter(HTTPAdapter):
+
+    def __init__(self, socket_options: list[tuple[int, int, int]], **kwargs):
+        self._socket_options = socket_options
+        super().__init__(**kwargs)
+
+    def init_poolmanager(self, *args, **kwargs) -> None:
+        kwargs["socket_options"] = self._socket_options
+        super().init_poolmanager(*args, **kwargs)
+
+
+def _get_socket_options(*, tcp_nodelay: bool) -> list[tuple[int, int, int]]:
+    socket_options = [
+        i
+        for i in HTTPConnection.default_socket_options
+        if i[:2] != (socket.IPPROTO_TCP, socket.TCP_NODELAY)
+    ]
+    socket_options.append((socket.IPPROTO_TCP, socket.TCP_NODELAY, int(tcp_nodelay)))
+
+    return socket_options
@@ -0,0 +1,109 @@
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from typing import Any, Optional, Union, BinaryIO
+from threading import Lock
+
+
+JSON_HEADERS = {
+    "Content-Type": "application/json"
+}
+
+
+@dataclass
+class TransportResponse:
+    status_code: int
+    content: bytes
+
+
+@dataclass
+class TransportStats:
+    pool_size: int
+    in_flight_requests: int
+    peak_in_flight_requests: int
+    total_requests: int
+
+    @property
+    def saturation(self) -> float:
+        return self.in_flight_requests / self.pool_size if self.pool_size else 0.0
+
+
+class AbstractTransport(ABC):
+    error_types: tuple[type[Exception], ...] = ()
+    timeout_error_types: tuple[type[Exception], ...] = ()
+
+    def __init__(self):
+        self._in_flight_requests = 0
+        self._peak_in_flight_requests = 0
+        self._total_requests = 0
+        self._stats_lock = Lock()
+
+    @property
+    @abstractmethod
+    def pool_size(self) -> int:
+        pass
+
+    def send_request(
+        self,
+        url: str,
+        *,
+        fields: Optional[dict[str, Any]] = None,
+        json_data: Optional[bytes] = None,
+        timeout_secs: Union[int, float, None] = None
+    ) -> TransportResponse:
+        with self._stats_lock:
+            self._in_flight_requests += 1
+            self._total_requests += 1
+            self._peak_in_flight_requests = max(
+                self._peak_in_flight_requests,
+                self._in_flight_requests
+            )
+
+        try:
+            return self._send_request(
+                url,
+                fields=fields,
+                json_data=json_data,
+                timeout_secs=timeout_secs
+            )
+        finally:
+            with self._stats_lock:
+                self._in_flight_requests -= 1
+
+    @abstractmethod
+    def download_file(
+        self,
+        url: str,
+        file: BinaryIO,
+        *,
+        timeout_secs: Union[int, float, None] = None,
+        chunk_size: int = 64 * 1024
+    ) -> None:
+        pass
+
+    def get_stats(self) -> TransportStats:
+        with self._stats_lock:
+            return TransportStats(
+                pool_size=self.pool_size,
+                in_flight_requests=self._in_flight_requests,
+                peak_in_flight_requests=self._peak_in_flight_requests,
+                total_requests=self._total_requests
+            )
+
+    def reset(self) -> None:
+        self._stats_lock = Lock()
+        self._in_flight_requests = 0
+
+    @abstractmethod
+    def close(self) -> None:
+        pass
+
+    @abstractmethod
+    def _send_request(
+        self,
+        url: str,
+        *,
+        fields: Optional[dict[str, Any]],
+        json_data: Optional[bytes],
+        timeout_secs: Union[int, float, None]
+    ) -> TransportResponse:
+        pass
@@ -1,9 +1,14 @@
+from typing import TypeVar, Callable
 import dataclasses
 from dataclasses import dataclass
 
 
+TypeClass = TypeVar("TypeClass", bound=type)
+
+
 @dataclass
 class Type:
+    __slots__ = ()
 
     def __repr__(self) -> str:
         values = {}
@@ -20,3 +25,22 @@ class Type:
         )
 
         return f"{type_name}({values})"
+
+
+def with_slots(*names: str) -> Callable[[TypeClass], TypeClass]:
+    def decorator(class_: TypeClass) -> TypeClass:
+        field_names = tuple(i.name for i in dataclasses.fields(class_))
+        namespace = dict(class_.__dict__)
+        namespace["__slots__"] = field_names + names
+
+        for name in field_names:
+            namespace.pop(name, None)
+
+        namespace.pop("__dict__", None)
+        namespace.pop("__weakref__", None)
+        slotted_class = type(class_)(class_.__name__, class_.__bases__, namespace)
+        slotted_class.__qualname__ = class_.__qualname__
+
+        return slotted_class
+
+    return decorator
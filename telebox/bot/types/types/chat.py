@@ -1,11 +1,12 @@
 from dataclasses import dataclass
 from typing import Literal, Optional
 
-from telebox.bot.types.type import Type
+from telebox.bot.types.type import Type, with_slots
 from telebox.bot.utils.users import get_full_name
 from telebox.bot.utils.deep_links import get_username_link
 
 
+@with_slots()
 @dataclass(repr=False)
 class Chat(Type):
     id: int
@@ -9,7 +9,7 @@ from telebox.bot.utils.formatters.formatters.html import HTMLFormatter
 from telebox.bot.utils.formatters.formatters.markdown import MarkdownFormatter
 from telebox.bot.utils.ids import get_unprefixed_chat_id
 from telebox.bot.enums.message_content_type import MessageContentType
-from telebox.bot.types.type import Type
+from telebox.bot.types.type import Type, with_slots
 from telebox.bot.types.types.user import User
 from telebox.bot.types.types.message_entity import MessageEntity
 from telebox.bot.types.types.animation import Animation
@@ -73,6 +73,7 @@ _html_formatter = HTMLFormatter()
 _markdown_formatter = MarkdownFormatter()
 
 
+@with_slots("_content", "_content_type")
 @dataclass(repr=False)
 class Message(Type):
     message_id: int
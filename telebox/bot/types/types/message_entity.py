@@ -1,10 +1,11 @@
 from dataclasses import dataclass
 from typing import Optional
 
-from telebox.bot.types.type import Type
+from telebox.bot.types.type import Type, with_slots
 from telebox.bot.types.types.user import User
 
 
+@with_slots()
 @dataclass(repr=False)
 class MessageEntity(Type):
     type: str
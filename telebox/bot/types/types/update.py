@@ -2,7 +2,7 @@ from dataclasses import dataclass
 from typing import Optional, Union
 
 from telebox.bot.enums.update_content_type import UpdateContentType
-from telebox.bot.types.type import Type
+from telebox.bot.types.type import Type, with_slots
 from telebox.bot.types.types.message import Message
 from telebox.bot.types.types.message_reaction_updated import MessageReactionUpdated
 from telebox.bot.types.types.message_reaction_count_updated import MessageReactionCountUpdated
@@ -39,6 +39,7 @@ UpdateContent = Union[
 ]
 
 
+@with_slots("_content", "_content_type")
 @dataclass(repr=False)
 class Update(Type):
     update_id: int
@@ -24,6 +24,8 @@ from .users import get_full_name
 from .ids import get_prefixed_chat_id, get_unprefixed_chat_id
 from .web_apps import check_web_app_init_data, get_web_app_init_data
 from .utils import set_up_bot, Webhook
+from .converters import DataclassConverter, GeneratedDataclassConverter
+from .send_scheduler import SendScheduler, send_priority
 
 
 __all__ = [
@@ -54,5 +56,9 @@ __all__ = [
     "check_web_app_init_data",
     "get_web_app_init_data",
     "set_up_bot",
-    "Webhook"
+    "Webhook",
+    "DataclassConverter",
+    "GeneratedDataclassConverter",
+    "SendScheduler",
+    "send_priority"
 ]
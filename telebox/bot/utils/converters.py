@@ -1,6 +1,9 @@
-from typing import Type, TypeVar, Any, Optional, Callable
+from typing import Type, TypeVar, Any, Optional, Callable, Union, Literal, get_origin, get_args
 from datetime import datetime as datetime_, timezone
+from enum import Enum
+from threading import Lock, RLock
 import dataclasses
+import itertools
 
 from dataclass_factory import Factory, Schema
 
@@ -258,11 +261,163 @@ class DataclassConverter:
     ) -> DataclassObject:
         return _dataclass_factory.load(data, class_)
 
+    # noinspection PyMethodMayBeStatic
+    def get_lazy_object(
+        self,
+        data: dict[str, Any],
+        class_: Type[DataclassObject]
+    ) -> DataclassObject:
+        return _get_lazy_object(data, class_)
+
     # noinspection PyMethodMayBeStatic
     def get_data(self, object_: Any) -> dict[str, Any]:
         return _dataclass_factory.dump(object_)
 
 
+class GeneratedDataclassConverter(DataclassConverter):
+
+    def get_object(
+        self,
+        data: dict[str, Any],
+        class_: Type[DataclassObject]
+    ) -> DataclassObject:
+        loader = _generated_loaders.get(class_)
+
+        if loader is None:
+            loader = _get_generated_loader(class_)
+
+        return loader(data)
+
+    def get_data(self, object_: Any) -> dict[str, Any]:
+        return _dump_value(object_)
+
+
+class _LazyField:
+
+    def __init__(
+        self,
+        name: str,
+        key: str,
+        loader: Callable[[Any], Any],
+        default: Any,
+        default_factory: Optional[Callable[[], Any]] = None
+    ):
+        self._name = name
+        self._key = key
+        self._loader = loader
+        self._default = default
+        self._default_factory = default_factory
+
+    def __get__(self, instance: Any, owner: type) -> Any:
+        if instance is None:
+            return self
+
+        value = instance._lazy_data.get(self._key)
+
+        if value is not None:
+            value = self._loader(value)
+        elif self._default_factory is not None:
+            value = self._default_factory()
+        else:
+            value = self._default
+
+        instance.__dict__[self._name] = value
+
+        return value
+
+
+def _get_lazy_object(data: dict[str, Any], class_: Type[DataclassObject]) -> DataclassObject:
+    lazy_class = _lazy_classes.get(class_)
+
+    if lazy_class is None:
+        lazy_class = _get_lazy_class(class_)
+
+    object_ = object.__new__(lazy_class)
+    object_._lazy_data = data
+    post_init = getattr(lazy_class, "__post_init__", None)
+
+    if post_init is not None:
+        post_init(object_)
+
+    return object_
+
+
+def _get_lazy_class(class_: type) -> type:
+    with _lazy_class_lock:
+        lazy_class = _lazy_classes.get(class_)
+
+        if lazy_class is None:
+            fields = dataclasses.fields(class_)
+            namespace = {
+                "__module__": class_.__module__,
+                "__qualname__": class_.__qualname__,
+                # Dataclass equality requires the same class, so lazy objects are compared as their base class.
+                "__eq__": _get_lazy_equality_function(
+                    class_,
+                    tuple(i.name for i in fields if i.compare)
+                ),
+                "__hash__": class_.__hash__
+            }
+
+            for field in fields:
+                namespace[field.name] = _LazyField(
+                    name=field.name,
+                    key=field.name[:-1] if field.name.endswith("_") else field.name,
+                    loader=_get_lazy_loader(field.type),
+                    default=field.default if field.default is not dataclasses.MISSING else None,
+                    default_factory=(
+                        field.default_factory
+                        if field.default_factory is not dataclasses.MISSING
+                        else None
+                    )
+                )
+
+            lazy_class = _lazy_classes[class_] = type(class_.__name__, (class_,), namespace)
+
+        return lazy_class
+
+
+def _get_lazy_equality_function(class_: type, field_names: tuple[str, ...]) -> Callable[[Any, Any], bool]:
+    def __eq__(self, other: Any) -> bool:
+        if type(other) not in (class_, type(self)):
+            return NotImplemented
+
+        return (
+            tuple(getattr(self, i) for i in field_names)
+            == tuple(getattr(other, i) for i in field_names)
+        )
+
+    return __eq__
+
+
+def _get_lazy_loader(type_: Any) -> Callable[[Any], Any]:
+    origin = get_origin(type_)
+
+    if origin is Union:
+        args = tuple(i for i in get_args(type_) if i is not type(None))
+
+        if len(args) == 1:
+            return _get_lazy_loader(args[0])
+    elif origin is Literal:
+        return _load_raw_value
+    elif origin is list:
+        item_loader = _get_lazy_loader(get_args(type_)[0])
+
+        return lambda value: [item_loader(i) for i in value]
+    elif type_ in _RAW_VALUE_TYPES:
+        return _load_raw_value
+    elif type_ is datetime_:
+        return get_datetime
+    elif isinstance(type_, type) and dataclasses.is_dataclass(type_):
+        return lambda value: _get_lazy_object(value, type_)
+
+    return lambda value: _dataclass_factory.load(value, type_)
+
+
+def _load_raw_value(value: Any) -> Any:
+    return value
+
+
 def _get_dataclass_factory() -> Factory:
     schemas = {
         datetime_: Schema(
@@ -280,11 +435,12 @@ def _get_dataclass_factory() -> Factory:
     }
 
     for class_ in _DEFAULT_POST_SERIALIZATION_CLASSES:
-        for field in dataclasses.fields(class_):
-            if field.default not in frozenset((None, dataclasses.MISSING)):
-                schemas[class_] = Schema(
-                    post_serialize=_get_post_default_serializer(field.name, field.default)
-                )
+        field = _get_post_default_field(class_)
+
+        if field is not None:
+            schemas[class_] = Schema(
+                post_serialize=_get_post_default_serializer(field.name, field.default)
+            )
 
     return Factory(
         default_schema=Schema(
@@ -294,6 +450,16 @@ def _get_dataclass_factory() -> Factory:
     )
 
 
+def _get_post_default_field(class_: type) -> Optional[dataclasses.Field]:
+    post_default_field = None
+
+    for field in dataclasses.fields(class_):
+        if field.default not in frozenset((None, dataclasses.MISSING)):
+            post_default_field = field
+
+    return post_default_field
+
+
 def _get_post_default_serializer(
     key: str,
     value: Any
@@ -307,3 +473,323 @@ def _get_post_default_serializer(
 
 
 _dataclass_factory = _get_dataclass_factory()
+_RAW_VALUE_TYPES = frozenset((str, int, float, bool))
+_lazy_classes: dict[type, type] = {}
+_lazy_class_lock = Lock()
+
+
+def _get_generated_loader(type_: Any) -> Callable[[Any], Any]:
+    with _generation_lock:
+        loader = _generated_loaders.get(type_)
+
+        if loader is None:
+            if isinstance(type_, type) and dataclasses.is_dataclass(type_):
+                loader = _generated_namespace[_get_loader_name(type_)]
+            else:
+                name = _get_generated_name("load", type_)
+                loader = _get_compiled_function(
+                    name=name,
+                    code=f"def {name}(data):\n    return {_get_load_expression(type_, 'data')}"
+                )
+
+            _generated_loaders[type_] = loader
+
+        return loader
+
+
+def _get_generated_dumper(class_: type) -> Callable[[Any], dict[str, Any]]:
+    with _generation_lock:
+        dumper = _generated_dumpers.get(class_)
+
+        if dumper is None:
+            name = _get_generated_name("dump", class_)
+            dumper = _generated_dumpers[class_] = _get_compiled_function(
+                name=name,
+                code=_get_dumper_code(class_, name)
+            )
+
+        return dumper
+
+
+def _get_loader_name(class_: type) -> str:
+    name = _generated_loader_names.get(class_)
+
+    if name is None:
+        name = _generated_loader_names[class_] = _get_generated_name("load", class_)
+        _get_compiled_function(
+            name=name,
+            code=_get_loader_code(class_, name)
+        )
+
+    return name
+
+
+def _get_loader_code(class_: type, name: str) -> str:
+    keys = set()
+    converters = {}
+    renamed_keys = {}
+
+    for field in dataclasses.fields(class_):
+        if not field.init:
+            continue
+
+        key = field.name[:-1] if field.name.endswith("_") else field.name
+        keys.add(key)
+
+        if not _check_raw_type(field.type):
+            converters[key] = _get_field_converter(field.type)
+
+        if key != field.name:
+            renamed_keys[key] = field.name
+
+    keys_name = _get_namespace_name(frozenset(keys))
+    # Payloads contain only a few of the declared fields, so only present keys are processed
+    # and the defaults of the others are set by the dataclass itself.
+    lines = [
+        f"def {name}(data):",
+        f"    if data.keys() <= {keys_name}:",
+        "        kwargs = dict(data)",
+        "    else:",
+        f"        kwargs = {{key: value for key, value in data.items() if key in {keys_name}}}"
+    ]
+
+    if converters:
+        lines.extend((
+            f"    for key in {_get_namespace_name(frozenset(converters))}.intersection(kwargs):",
+            "        value = kwargs[key]",
+            "        if value is not None:",
+            f"            kwargs[key] = {_get_namespace_name(converters)}[key](value)"
+        ))
+
+    for key, field_name in renamed_keys.items():
+        lines.extend((
+            f"    if {key!r} in kwargs:",
+            f"        kwargs[{field_name!r}] = kwargs.pop({key!r})"
+        ))
+
+    lines.append(f"    return {_get_namespace_name(class_)}(**kwargs)")
+
+    return "\n".join(lines)
+
+
+def _get_field_converter(type_: Any) -> Callable[[Any], Any]:
+    if get_origin(type_) is Union:
+        members = tuple(i for i in get_args(type_) if i is not type(None))
+
+        # None values are never passed to converters.
+        if len(members) == 1:
+            type_ = members[0]
+
+    if isinstance(type_, type) and dataclasses.is_dataclass(type_):
+        loader = _generated_namespace.get(_get_loader_name(type_))
+
+        if loader is not None:
+            return loader
+
+    # The loader of a recursive type is not compiled yet, so it is referenced by name.
+    name = _get_generated_name("load", type_)
+
+    return _get_compiled_function(
+        name=name,
+        code=f"def {name}(data):\n    return {_get_load_expression(type_, 'data')}"
+    )
+
+
+def _get_dumper_code(class_: type, name: str) -> str:
+    lines = [f"def {name}(object_):", "    data = {}"]
+
+    for number, field in enumerate(dataclasses.fields(class_)):
+        key = field.name[:-1] if field.name.endswith("_") else field.name
+        value_name = f"v{number}"
+        expression = _get_dump_expression(field.type, value_name)
+        lines.append(f"    {value_name} = object_.{field.name}")
+
+        if field.default is None:
+            lines.append(f"    if {value_name} is not None:")
+            lines.append(f"        data[{key!r}] = {expression}")
+        elif field.default is not dataclasses.MISSING:
+            lines.append(f"    if {value_name} != {_get_namespace_name(field.default)}:")
+            lines.append(f"        data[{key!r}] = {expression}")
+        else:
+            lines.append(f"    data[{key!r}] = {expression}")
+
+    if class_ in _DEFAULT_POST_SERIALIZATION_CLASSES:
+        field = _get_post_default_field(class_)
+
+        if field is not None:
+            lines.append(f"    data[{field.name!r}] = {_get_namespace_name(field.default)}")
+
+    lines.append("    return data")
+
+    return "\n".join(lines)
+
+
+def _get_load_expression(type_: Any, value_name: str, depth: int = 0) -> str:
+    origin = get_origin(type_)
+
+    if _check_raw_type(type_):
+        return value_name
+    elif origin is Union:
+        args = get_args(type_)
+        members = tuple(i for i in args if i is not type(None))
+
+        if len(members) == 1:
+            expression = _get_load_expression(members[0], value_name, depth)
+        else:
+            expression = f"{_get_namespace_name(_get_union_loader(members))}({value_name})"
+
+        if (len(members) < len(args)) and (expression != value_name):
+            expression = f"(None if {value_name} is None else {expression})"
+
+        return expression
+    elif origin is list:
+        item_name = f"i{depth}"
+        item_expression = _get_load_expression(get_args(type_)[0], item_name, depth + 1)
+
+        if item_expression == item_name:
+            return value_name
+
+        return f"[{item_expression} for {item_name} in {value_name}]"
+    elif type_ is datetime_:
+        return f"get_datetime({value_name})"
+    elif isinstance(type_, type) and dataclasses.is_dataclass(type_):
+        return f"{_get_loader_name(type_)}({value_name})"
+    elif isinstance(type_, type) and issubclass(type_, Enum):
+        return f"{_get_namespace_name(type_)}({value_name})"
+
+    return f"_dataclass_factory.load({value_name}, {_get_namespace_name(type_)})"
+
+
+def _get_dump_expression(type_: Any, value_name: str) -> str:
+    if _check_raw_type(type_):
+        return value_name
+    elif type_ is datetime_:
+        return f"get_timestamp({value_name})"
+    elif get_origin(type_) is Union:
+        members = tuple(i for i in get_args(type_) if i is not type(None))
+
+        if len(members) == 1:
+            return _get_dump_expression(members[0], value_name)
+
+    return f"_dump_value({value_name})"
+
+
+def _get_union_loader(members: tuple[Any, ...]) -> Callable[[Any], Any]:
+    if all(_check_raw_type(i) for i in members):
+        return _load_raw_value
+    elif not all(isinstance(i, type) and dataclasses.is_dataclass(i) for i in members):
+        union = Union[members]
+
+        return lambda value: _dataclass_factory.load(value, union)
+
+    names = tuple(_get_loader_name(i) for i in members)
+    discriminator = _get_union_discriminator(members)
+
+    def _load_union(value: dict[str, Any]) -> Any:
+        if discriminator is not None:
+            key, discriminator_names = discriminator
+            name = discriminator_names.get(value.get(key))
+
+            if name is not None:
+                return _generated_namespace[name](value)
+
+        error = None
+
+        # Members are tried in order, as dataclass_factory does.
+        for name in names:
+            try:
+                return _generated_namespace[name](value)
+            except (KeyError, TypeError, ValueError) as error_:
+                error = error_
+
+        raise error
+
+    return _load_union
+
+
+def _get_union_discriminator(members: tuple[type, ...]) -> Optional[tuple[str, dict[str, str]]]:
+    for field in dataclasses.fields(members[0]):
+        if not isinstance(field.default, str):
+            continue
+
+        names = {}
+
+        for class_ in members:
+            member_fields = {i.name: i for i in dataclasses.fields(class_)}
+            member_field = member_fields.get(field.name)
+
+            if (
+                (member_field is None)
+                or (not isinstance(member_field.default, str))
+                or (member_field.default in names)
+            ):
+                break
+
+            names[member_field.default] = _get_loader_name(class_)
+        else:
+            return field.name, names
+
+
+def _check_raw_type(type_: Any) -> bool:
+    return (
+        (get_origin(type_) in _RAW_ORIGINS)
+        or (type_ in _RAW_VALUE_TYPES)
+        or (type_ in _PASSED_TYPES)
+    )
+
+
+def _dump_value(value: Any) -> Any:
+    dumper = _generated_dumpers.get(type(value))
+
+    if dumper is not None:
+        return dumper(value)
+    elif isinstance(value, (list, tuple)):
+        return [_dump_value(i) for i in value]
+    elif isinstance(value, dict):
+        return {key: _dump_value(value_) for key, value_ in value.items()}
+    elif isinstance(value, datetime_):
+        return get_timestamp(value)
+    elif isinstance(value, Enum):
+        return value.value
+    elif dataclasses.is_dataclass(value) and not isinstance(value, type):
+        return _get_generated_dumper(type(value))(value)
+
+    return value
+
+
+def _get_generated_name(prefix: str, type_: Any) -> str:
+    return f"{prefix}_{getattr(type_, '__name__', 'union')}_{next(_generated_name_counter)}"
+
+
+def _get_namespace_name(object_: Any) -> str:
+    name = _generated_namespace_names.get(id(object_))
+
+    if name is None:
+        name = _generated_namespace_names[id(object_)] = f"c{next(_generated_name_counter)}"
+        _generated_namespace[name] = object_
+
+    return name
+
+
+def _get_compiled_function(name: str, code: str) -> Callable[..., Any]:
+    exec(code, _generated_namespace)  # noqa
+
+    return _generated_namespace[name]
+
+
+_PASSED_TYPES = frozenset((Any, InputFile, NotSet, dict))
+_RAW_ORIGINS = frozenset((Literal, dict))
+_generated_name_counter = itertools.count()
+_generated_loaders: dict[Any, Callable[[Any], Any]] = {}
+_generated_loader_names: dict[type, str] = {}
+_generated_dumpers: dict[type, Callable[[Any], Any]] = {
+    InputFile: _load_raw_value
+}
+_generated_namespace_names: dict[int, str] = {}
+_generated_namespace: dict[str, Any] = {
+    "_dataclass_factory": _dataclass_factory,
+    "_dump_value": _dump_value,
+    "get_datetime": get_datetime,
+    "get_timestamp": get_timestamp
+}
+_generation_lock = RLock()
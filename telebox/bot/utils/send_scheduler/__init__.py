@@ -0,0 +1,8 @@
+from .send_scheduler import SendScheduler, send_priority, send_priority_context
+
+
+__all__ = [
+    "SendScheduler",
+    "send_priority",
+    "send_priority_context"
+]
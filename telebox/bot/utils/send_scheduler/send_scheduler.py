@@ -0,0 +1,145 @@
+from typing import Optional, Union, Iterator
+from contextvars import ContextVar
+from threading import Condition
+import contextlib
+import heapq
+import itertools
+import time
+
+from telebox.bot.utils.send_scheduler.token_bucket import TokenBucket
+
+
+SCHEDULED_METHOD_PREFIXES = ("send", "forward", "copy", "edit", "stop")
+_BUCKET_CLEANUP_INTERVAL = 1000
+send_priority_context = ContextVar("send_priority_context", default=0)
+
+
+class SendScheduler:
+
+    def __init__(
+        self,
+        *,
+        global_rate: Union[int, float] = 30,
+        global_burst: Union[int, float] = 30,
+        group_rate: Union[int, float] = 20 / 60,
+        group_burst: Union[int, float] = 20,
+        private_rate: Union[int, float] = 1,
+        private_burst: Union[int, float] = 1
+    ):
+        if min(global_rate, group_rate, private_rate) <= 0:
+            raise ValueError("Rate must be greater than zero!")
+
+        if min(global_burst, group_burst, private_burst) < 1:
+            raise ValueError("Burst cannot be less than one!")
+
+        self._global_rate = global_rate
+        self._global_burst = global_burst
+        self._group_rate = group_rate
+        self._group_burst = group_burst
+        self._private_rate = private_rate
+        self._private_burst = private_burst
+        self._waiter_numbers = itertools.count()
+        self.reset()
+
+    def reset(self, processes: int = 1) -> None:
+        if processes < 1:
+            raise ValueError("Number of processes cannot be less than one!")
+
+        # Chats are bound to one process each, so only the global rate is shared.
+        self._global_bucket = TokenBucket(
+            self._global_rate / processes,
+            max(self._global_burst / processes, 1),
+            time.monotonic()
+        )
+        self._chat_buckets: dict[Union[int, str], TokenBucket] = {}
+        self._waiters: list[tuple[int, int]] = []
+        self._reservations = 0
+        self._condition = Condition()
+
+    # noinspection PyMethodMayBeStatic
+    def check_method(self, method: str) -> bool:
+        return method.startswith(SCHEDULED_METHOD_PREFIXES)
+
+    def acquire(
+        self,
+        chat_id: Union[int, str, None] = None,
+        *,
+        priority: Optional[int] = None
+    ) -> None:
+        if priority is None:
+            priority = send_priority_context.get()
+
+        if chat_id is not None:
+            with self._condition:
+                delay = self._get_chat_bucket(chat_id).reserve(time.monotonic())
+
+            if delay:
+                time.sleep(delay)
+
+        waiter = (-priority, next(self._waiter_numbers))
+
+        with self._condition:
+            heapq.heappush(self._waiters, waiter)
+            self._condition.notify_all()
+
+            try:
+                while True:
+                    if self._waiters[0] == waiter:
+                        delay = self._global_bucket.get_delay(time.monotonic())
+
+                        if not delay:
+                            self._global_bucket.reserve(time.monotonic())
+                            break
+
+                        self._condition.wait(delay)
+                    else:
+                        self._condition.wait()
+            finally:
+                self._waiters.remove(waiter)
+                heapq.heapify(self._waiters)
+                self._condition.notify_all()
+
+    def process_retry_after(
+        self,
+        chat_id: Union[int, str, None],
+        retry_after: Union[int, float]
+    ) -> None:
+        with self._condition:
+            if chat_id is not None:
+                bucket = self._get_chat_bucket(chat_id)
+            else:
+                bucket = self._global_bucket
+
+            bucket.pause(time.monotonic(), retry_after)
+            self._condition.notify_all()
+
+    def _get_chat_bucket(self, chat_id: Union[int, str]) -> TokenBucket:
+        now = time.monotonic()
+        self._reservations += 1
+
+        if self._reservations % _BUCKET_CLEANUP_INTERVAL == 0:
+            for id_, bucket in tuple(self._chat_buckets.items()):
+                if bucket.check_full(now):
+                    del self._chat_buckets[id_]
+
+        bucket = self._chat_buckets.get(chat_id)
+
+        if bucket is None:
+            if isinstance(chat_id, int) and (chat_id > 0):
+                bucket = TokenBucket(self._private_rate, self._private_burst, now)
+            else:
+                bucket = TokenBucket(self._group_rate, self._group_burst, now)
+
+            self._chat_buckets[chat_id] = bucket
+
+        return bucket
+
+
+@contextlib.contextmanager
+def send_priority(priority: int) -> Iterator[None]:
+    token = send_priority_context.set(priority)
+
+    try:
+        yield
+    finally:
+        send_priority_context.reset(token)
@@ -0,0 +1,39 @@
+from typing import Union
+
+
+class TokenBucket:
+
+    def __init__(self, rate: Union[int, float], capacity: Union[int, float], time: float):
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._time = time
+
+    def get_delay(self, time: float) -> float:
+        self._refill(time)
+
+        return max(
+            self._time + max(1 - self._tokens, 0) / self.rate - time,
+            0
+        )
+
+    def reserve(self, time: float) -> float:
+        delay = self.get_delay(time)
+        self._tokens -= 1
+
+        return delay
+
+    def pause(self, time: float, secs: Union[int, float]) -> None:
+        self._refill(time)
+        self._tokens = min(self._tokens, 0)
+        self._time = max(self._time, time + secs)
+
+    def check_full(self, time: float) -> bool:
+        self._refill(time)
+
+        return self._tokens >= self.capacity
+
+    def _refill(self, time: float) -> None:
+        if time > self._time:
+            self._tokens = min(self._tokens + (time - self._time) * self.rate, self.capacity)
+            self._time = time
@@ -1,5 +1,6 @@
 from .dispatcher import Dispatcher, Event
-from .enums import EventType, MediaGroupContentType
+from .async_dispatcher import AsyncDispatcher
+from .enums import EventType, MediaGroupContentType, OverflowPolicy
 from .types import Aborting, ABORTING
 from .handlers import AbstractEventHandler, AbstractErrorHandler
 from .filters import (
@@ -7,12 +8,16 @@ from .filters import (
     AbstractEventFilter,
     AbstractEventBaseFilter,
     AbstractEventFilterCache,
+    AbstractEventFilterIndex,
+    EventFilterOptimizer,
+    EventFilterStats,
     AbstractErrorFilterFactory,
     AbstractErrorFilter,
     AbstractErrorBaseFilter,
     AbstractErrorFilterCache
 )
 from .middlewares import Middleware
+from .utils.webhook_app import WebhookApp
 from .utils import (
     MediaGroup,
     RateLimit,
@@ -28,9 +33,11 @@ from .utils import (
 
 __all__ = [
     "Dispatcher",
+    "AsyncDispatcher",
     "Event",
     "EventType",
     "MediaGroupContentType",
+    "OverflowPolicy",
     "Aborting",
     "ABORTING",
     "AbstractEventHandler",
@@ -39,11 +46,15 @@ __all__ = [
     "AbstractEventFilter",
     "AbstractEventBaseFilter",
     "AbstractEventFilterCache",
+    "AbstractEventFilterIndex",
+    "EventFilterOptimizer",
+    "EventFilterStats",
     "AbstractErrorFilterFactory",
     "AbstractErrorFilter",
     "AbstractErrorBaseFilter",
     "AbstractErrorFilterCache",
     "Middleware",
+    "WebhookApp",
     "MediaGroup",
     "RateLimit",
     "Limit",
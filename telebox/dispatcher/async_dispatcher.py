@@ -0,0 +1,361 @@
+import logging
+from typing import Optional, Union, Any, NoReturn, TYPE_CHECKING
+from queue import SimpleQueue as Queue
+import asyncio
+import inspect
+
+if TYPE_CHECKING:
+    from telebox.bot.async_bot import AsyncBot
+from telebox.bot.types.types.message import Message
+from telebox.dispatcher.dispatcher import (
+    Dispatcher,
+    _get_media_group_event_info,
+    _EVENT_PROCESSING_LOG_TEMPLATES
+)
+from telebox.dispatcher.enums.event_type import EventType
+from telebox.dispatcher.enums.processing_status import ProcessingStatus
+from telebox.dispatcher.utils.rate_limiter.rate_limit import RateLimit
+from telebox.dispatcher.utils.media_group_container import MediaGroupContainer, MAX_MEDIA_GROUP_SIZE
+from telebox.dispatcher.utils.events import event_context, event_handler_context, error_handler_context
+from telebox.dispatcher.types.event_info import EventInfo
+from telebox.dispatcher.types.aborting import ABORTING
+from telebox.dispatcher.errors import DispatcherError
+
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncDispatcher(Dispatcher):
+
+    def __init__(
+        self,
+        bot: "AsyncBot",
+        *,
+        rate_limit: Optional[RateLimit] = None,
+        media_group_gathering_secs: Union[int, float] = 3
+    ):
+        super().__init__(
+            bot,  # NOQA
+            rate_limit=rate_limit,
+            media_group_gathering_secs=media_group_gathering_secs
+        )
+        self._event_queue: Optional[asyncio.Queue[EventInfo]] = None
+        self._processing_chat_ids: set[int] = set()
+        self._chat_queues: dict[int, Queue[EventInfo]] = {}
+        self._unprocessed_events = 0
+        self._all_events_processed_event: Optional[asyncio.Event] = None
+        self._media_group_timers: dict[str, asyncio.TimerHandle] = {}
+        self._workers: list[asyncio.Task] = []
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    async def run_polling(  # NOQA
+        self,
+        workers: int = 100,
+        *,
+        error_delay_secs: Union[int, float] = 5,
+        limit: Optional[int] = None,
+        timeout: Optional[int] = 10,
+        allowed_updates: Optional[list[str]] = None
+    ) -> None:
+        if self._polling_is_used:
+            raise DispatcherError("Polling cannot be run twice!")
+
+        if error_delay_secs < 0:
+            raise ValueError("Error delay seconds cannot be negative!")
+
+        if workers < 1:
+            raise ValueError("Number of workers cannot be less than one!")
+
+        self._polling_is_used = True
+        offset_update_id = None
+        self._start_workers(workers)
+        logger.info("Polling started.")
+
+        try:
+            while not self._polling_stopping_event.is_set():
+                # noinspection PyBroadException
+                try:
+                    updates = await self.bot.get_updates(
+                        timeout_secs=timeout + 1 if timeout else None,
+                        offset=offset_update_id,
+                        limit=limit,
+                        timeout=timeout,
+                        allowed_updates=allowed_updates
+                    )
+                except asyncio.TimeoutError:
+                    logger.error("Timeout for requesting updates has expired!")
+                except Exception:
+                    logger.exception("An error occurred while receiving updates!")
+                    await asyncio.sleep(error_delay_secs)
+                else:
+                    for i in updates:
+                        self._process_update(i)
+
+                    if updates:
+                        offset_update_id = updates[-1].update_id + 1
+        finally:
+            self._polling_stopping_event.clear()
+            logger.info("Polling stopped.")
+            await self._finish_update_processing()
+            self._polling_is_used = False
+
+    def run_server(self, *args, **kwargs) -> NoReturn:
+        raise DispatcherError("Server is not supported by async dispatcher!")
+
+    def get_webhook_app(self, *args, **kwargs) -> NoReturn:
+        raise DispatcherError("Server is not supported by async dispatcher!")
+
+    async def drop_pending_updates(  # NOQA
+        self,
+        *,
+        timeout_secs: Union[int, float, None] = None,
+        with_delete_webhook: bool = True
+    ) -> None:
+        logger.debug("Dropping pending updates...")
+
+        if with_delete_webhook:
+            await self.bot.delete_webhook(timeout_secs=timeout_secs, drop_pending_updates=True)
+        else:
+            updates = await self.bot.get_updates(
+                timeout_secs=timeout_secs,
+                offset=-1
+            )
+
+            if updates:
+                await self.bot.get_updates(
+                    timeout_secs=timeout_secs,
+                    offset=updates[-1].update_id + 1
+                )
+
+        logger.info("Pending updates dropped.")
+
+    def _start_workers(self, workers: int) -> None:
+        self._loop = asyncio.get_running_loop()
+        self._event_queue = asyncio.Queue()
+        self._all_events_processed_event = asyncio.Event()
+        self._all_events_processed_event.set()
+        self._workers = [
+            asyncio.create_task(self._run_event_processing())
+            for _ in range(workers)
+        ]
+
+    def _add_media_group_message(self, event: Message, event_type: EventType) -> None:
+        container = self._media_group_containers.get(event.media_group_id)
+
+        if container is None:
+            container = self._media_group_containers[event.media_group_id] = MediaGroupContainer(
+                event=event,
+                event_type=event_type
+            )
+            self._media_group_timers[event.media_group_id] = self._loop.call_later(
+                self._media_group_gathering_secs,
+                self._add_media_group_to_queue,
+                event.media_group_id
+            )
+        else:
+            container.add_event(event)
+
+        if len(container.events) >= MAX_MEDIA_GROUP_SIZE:
+            self._media_group_timers[event.media_group_id].cancel()
+            self._add_media_group_to_queue(event.media_group_id)
+
+    def _add_media_group_to_queue(self, media_group_id: str) -> None:
+        self._media_group_timers.pop(media_group_id, None)
+        container = self._media_group_containers.pop(media_group_id, None)
+
+        if container is not None:
+            self._add_event_to_queue(
+                _get_media_group_event_info(container)
+            )
+
+    async def _finish_update_processing(self) -> None:  # NOQA
+        logger.info("Finishing update processing...")
+
+        for media_group_id, timer in tuple(self._media_group_timers.items()):
+            timer.cancel()
+            self._add_media_group_to_queue(media_group_id)
+
+        await self._all_events_processed_event.wait()
+
+        for i in self._workers:
+            i.cancel()
+
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
+        self._event_queue = None
+        self._loop = None
+        logger.info("Update processing finished.")
+
+    def _add_event_to_queue(self, event: EventInfo) -> None:
+        self._unprocessed_events += 1
+        self._all_events_processed_event.clear()
+        self._event_queue.put_nowait(event)
+        logger.debug("Event added to queue: %r.", event.event)
+
+    def _set_event_completion(self) -> None:
+        self._unprocessed_events -= 1
+
+        if not self._unprocessed_events:
+            self._all_events_processed_event.set()
+
+    def _set_chat_event_completion(self, chat_id: int) -> None:
+        chat_events = self._chat_queues.get(chat_id)
+
+        if chat_events is None:
+            self._processing_chat_ids.remove(chat_id)
+
+            return
+
+        next_event = chat_events.get_nowait()
+        next_event.from_chat_queue = True
+
+        if chat_events.empty():
+            del self._chat_queues[chat_id]
+
+        self._event_queue.put_nowait(next_event)
+
+    async def _run_event_processing(self) -> NoReturn:  # NOQA
+        while True:
+            event = await self._event_queue.get()
+            await self._process_event(event)
+
+    async def _process_event(self, event: EventInfo) -> None:
+        logger.debug("Event processing started: %r.", event.event)
+
+        try:
+            event_context.set(event.event)
+
+            if not event.middleware_pre_processed:
+                for i in self._middlewares:
+                    result = await _get_awaited_result(
+                        i.pre_process_event(
+                            event=event.event,
+                            event_type=event.event_type
+                        )
+                    )
+
+                    if result is ABORTING:
+                        event.processing_status = ProcessingStatus.ABORTED
+                        return
+
+                event.middleware_pre_processed = True
+
+            event_handler = self._get_event_handler(event.event, event.event_type)
+
+            if event_handler is None:
+                event.processing_status = ProcessingStatus.HANDLER_NOT_FOUND
+                return
+
+            if event_handler.with_chat_queue and (event.chat_id is not None):
+                event.with_chat_queue = True
+
+                if not event.from_chat_queue:
+                    if event.chat_id in self._processing_chat_ids:
+                        chat_events = self._chat_queues.get(event.chat_id)
+
+                        if chat_events is None:
+                            chat_events = self._chat_queues[event.chat_id] = Queue()
+
+                        chat_events.put_nowait(event)
+                        event.processing_status = ProcessingStatus.ADDED_TO_CHAT_QUEUE
+                        return
+                    else:
+                        self._processing_chat_ids.add(event.chat_id)
+
+            event_handler_context.set(event_handler.handler)
+
+            if (
+                (event_handler.rate_limiter is not None)
+                and event_handler.rate_limiter.process_call(event.chat_id, event.user_id)
+            ):
+                event.processing_status = ProcessingStatus.RATE_LIMIT_EXCEEDED
+                return
+
+            for i in self._middlewares:
+                result = await _get_awaited_result(
+                    i.process_event(
+                        event=event.event,
+                        event_type=event.event_type,
+                        handler=event_handler.handler
+                    )
+                )
+
+                if result is ABORTING:
+                    event.processing_status = ProcessingStatus.ABORTED
+                    return
+
+            result = await _get_awaited_result(
+                event_handler.handler.process_event(event.event)
+            )
+
+            if result is ABORTING:
+                event.processing_status = ProcessingStatus.ABORTED
+                return
+
+            for i in self._middlewares:
+                result = await _get_awaited_result(
+                    i.post_process_event(
+                        event=event.event,
+                        event_type=event.event_type,
+                        handler=event_handler.handler
+                    )
+                )
+
+                if result is ABORTING:
+                    event.processing_status = ProcessingStatus.ABORTED
+                    return
+        except Exception as error:
+            event.processing_status = ProcessingStatus.ERROR_OCCURRED
+            await self._process_event_error(error, event)
+        finally:
+            if event.processing_status is not ProcessingStatus.ERROR_OCCURRED:
+                logger.debug(
+                    _EVENT_PROCESSING_LOG_TEMPLATES[event.processing_status],
+                    event.event
+                )
+
+            if event.processing_status is ProcessingStatus.ADDED_TO_CHAT_QUEUE:
+                event.processing_status = ProcessingStatus.PROCESSING
+            else:
+                if event.with_chat_queue:
+                    self._set_chat_event_completion(chat_id=event.chat_id)
+
+                self._set_event_completion()
+
+    async def _process_event_error(self, error: Exception, event: EventInfo) -> None:  # NOQA
+        # noinspection PyBroadException
+        try:
+            for i in self._middlewares:
+                await _get_awaited_result(
+                    i.pre_process_error(error, event.event, event.event_type)
+                )
+
+            error_handler = self._get_error_handler(error, event.event)
+
+            if error_handler is None:
+                raise error
+
+            error_handler_context.set(error_handler.handler)
+
+            for i in self._middlewares:
+                await _get_awaited_result(
+                    i.process_error(error, event.event, event.event_type)
+                )
+
+            await _get_awaited_result(
+                error_handler.handler.process_error(error, event.event)
+            )
+
+            for i in self._middlewares:
+                await _get_awaited_result(
+                    i.post_process_error(error, event.event, event.event_type)
+                )
+        except Exception:
+            logger.exception("An error occurred while processing an event %r!", event.event)
+
+
+async def _get_awaited_result(result: Any) -> Any:
+    if inspect.isawaitable(result):
+        return await result
+
+    return result
@@ -1,34 +1,41 @@
 import logging
-from typing import Optional, Union, NoReturn, Callable, TYPE_CHECKING
+from typing import Optional, Union, Any, NoReturn, TYPE_CHECKING
 from pathlib import Path
-from collections import deque
-from queue import SimpleQueue as Queue
+from queue import Queue as BoundedQueue
 from threading import Thread, RLock, Condition, Event as ThreadingEvent
+from multiprocessing.connection import Connection
 import contextlib
+import functools
+import heapq
+import signal
 import time
 
-from requests.exceptions import Timeout as RequestTimeoutError
-
 if TYPE_CHECKING:
     from telebox.bot.bot import Bot
 from telebox.bot.types.types.update import Update
 from telebox.bot.types.types.message import Message
-from telebox.bot.utils.converters import DataclassConverter
 from telebox.dispatcher.typing import Event
 from telebox.dispatcher.utils.media_group import MediaGroup
 from telebox.dispatcher.enums.event_type import EventType
 from telebox.dispatcher.enums.processing_status import ProcessingStatus
+from telebox.dispatcher.enums.overflow_policy import OverflowPolicy
 from telebox.dispatcher.handlers.event import AbstractEventHandler
 from telebox.dispatcher.handlers.error import AbstractErrorHandler
 from telebox.dispatcher.filters.events.filter import AbstractEventBaseFilter
 from telebox.dispatcher.filters.errors.filter import AbstractErrorBaseFilter
 from telebox.dispatcher.filters.events.filters.none import NoneFilter
+from telebox.dispatcher.filters.events.optimizer import EventFilterOptimizer
 from telebox.dispatcher.filters.errors.filters.none import NoneErrorFilter
 from telebox.dispatcher.middlewares.middleware import Middleware
 from telebox.dispatcher.utils.rate_limiter.rate_limiter import RateLimiter
 from telebox.dispatcher.utils.rate_limiter.rate_limit import RateLimit
-from telebox.dispatcher.utils.media_group_container import MediaGroupContainer
+from telebox.dispatcher.utils.media_group_container import MediaGroupContainer, MAX_MEDIA_GROUP_SIZE
 from telebox.dispatcher.utils.router import Router
+from telebox.dispatcher.utils.event_queue import EventQueue
+from telebox.dispatcher.utils.event_handler_index import EventHandlerIndex
+from telebox.dispatcher.utils.webhook_app import WebhookApp
+from telebox.dispatcher.utils.process_pool import UpdateProcessPool
+from telebox.dispatcher.utils.update_offset import UpdateOffset
 from telebox.dispatcher.utils.events import (
     event_context,
     event_handler_context,
@@ -41,7 +48,7 @@ from telebox.dispatcher.types.event_handler_info import EventHandlerInfo
 from telebox.dispatcher.types.error_handler_info import ErrorHandlerInfo
 from telebox.dispatcher.types.aborting import ABORTING
 from telebox.dispatcher.errors import DispatcherError
-from telebox.utils.thread_pool import ThreadPool
+from telebox.utils.thread_pool import ThreadPool, ThreadPoolStats
 from telebox.utils.not_set import NotSet, NOT_SET
 from telebox.utils.serialization import get_deserialized_data
 
@@ -49,14 +56,15 @@ from telebox.utils.serialization import get_deserialized_data
 logger = logging.getLogger(__name__)
 _none_filter = NoneFilter()
 _none_error_filter = NoneErrorFilter()
-_MEDIA_GROUP_GATHERING_DELAY_SECS = 0.1
 _DROPPED_UNKNOWN_UPDATE_MESSAGE = "Update dropped because it contains an unknown content type: %r."
+_WORKER_REBALANCE_INTERVAL_SECS = 1
 _EVENT_PROCESSING_LOG_TEMPLATES = {
     ProcessingStatus.PROCESSING: "Event processing finished: %r.",
     ProcessingStatus.ABORTED: "Event processing aborted: %r.",
     ProcessingStatus.HANDLER_NOT_FOUND: "No handler found for event: %r.",
     ProcessingStatus.RATE_LIMIT_EXCEEDED: "Rate limit exceeded for event: %r.",
-    ProcessingStatus.ADDED_TO_CHAT_QUEUE: "Event added to chat queue: %r."
+    ProcessingStatus.ADDED_TO_CHAT_QUEUE: "Event added to chat queue: %r.",
+    ProcessingStatus.DROPPED: "Event dropped: %r."
 }
 
 
@@ -67,30 +75,43 @@ class Dispatcher:
         bot: "Bot",
         *,
         rate_limit: Optional[RateLimit] = None,
-        media_group_gathering_secs: Union[int, float] = 3
+        media_group_gathering_secs: Union[int, float] = 3,
+        event_queue_shards: int = 1,
+        max_queue_size: Optional[int] = None,
+        max_chat_queue_size: Optional[int] = None,
+        max_event_age_secs: Union[int, float, None] = None,
+        overflow_policy: OverflowPolicy = OverflowPolicy.BLOCK,
+        event_type_priorities: Optional[dict[EventType, int]] = None,
+        event_type_weights: Optional[dict[EventType, int]] = None,
+        filter_optimizer: Optional[EventFilterOptimizer] = None
     ):
         self.bot = bot
         self._rate_limit = rate_limit
+        self._filter_optimizer = filter_optimizer
         self._media_group_gathering_secs = media_group_gathering_secs
         self._polling_is_used = False
         self._server_is_used = False
-        self._events: deque[EventInfo] = deque()
-        self._processing_chat_ids: set[int] = set()
-        self._chat_queues: dict[int, Queue[EventInfo]] = {}
-        self._unprocessed_events = 0
-        self._event_lock = RLock()
-        self._new_event_condition = Condition(self._event_lock)
-        self._all_events_processed_condition = Condition(self._event_lock)
+        self._events = EventQueue(
+            event_queue_shards,
+            max_size=max_queue_size,
+            max_chat_size=max_chat_queue_size,
+            max_event_age_secs=max_event_age_secs,
+            overflow_policy=overflow_policy,
+            event_type_priorities=event_type_priorities,
+            event_type_weights=event_type_weights,
+            drop_callback=self._process_dropped_event
+        )
         self._thread_pool: Optional[ThreadPool] = None
-        self._busy_threads = 0
-        self._busy_thread_lock = RLock()
-        self._event_handlers: dict[EventType, list[EventHandlerInfo]] = {i: [] for i in EventType}
+        self._process_pool: Optional[UpdateProcessPool] = None
+        self._event_handlers: dict[EventType, EventHandlerIndex] = {i: EventHandlerIndex() for i in EventType}
         self._error_handlers: list[ErrorHandlerInfo] = []
         self._middlewares: list[Middleware] = []
         self.router = Router(self)
         self._media_group_gathering_thread: Optional[Thread] = None
         self._media_group_containers: dict[str, MediaGroupContainer] = {}
+        self._media_group_deadlines: list[tuple[float, str]] = []
         self._media_group_message_lock = RLock()
+        self._media_group_condition = Condition(self._media_group_message_lock)
         self._polling_stopping_event = ThreadingEvent()
 
     @property
@@ -101,6 +122,10 @@ class Dispatcher:
     def server_is_used(self) -> bool:
         return self._server_is_used
 
+    @property
+    def dropped_events(self) -> int:
+        return self._events.dropped_events
+
     def add_message_handler(
         self,
         handler: AbstractEventHandler,
@@ -666,6 +691,11 @@ class Dispatcher:
     def check_middleware(self, middleware: Middleware) -> bool:
         return middleware in self._middlewares
 
+    def get_thread_pool_stats(self) -> Optional[ThreadPoolStats]:
+        thread_pool = self._thread_pool
+
+        return thread_pool.get_stats() if thread_pool is not None else None
+
     def run_polling(
         self,
         min_threads: int = 5,
@@ -674,7 +704,11 @@ class Dispatcher:
         error_delay_secs: Union[int, float] = 5,
         limit: Optional[int] = None,
         timeout: Optional[int] = 10,
-        allowed_updates: Optional[list[str]] = None
+        allowed_updates: Optional[list[str]] = None,
+        pipelined: bool = False,
+        max_pending_batches: int = 4,
+        thread_idle_timeout_secs: Union[int, float, None] = 60,
+        processes: int = 1
     ) -> None:
         if self._polling_is_used:
             raise DispatcherError("Polling cannot be run twice!")
@@ -685,34 +719,30 @@ class Dispatcher:
         if error_delay_secs < 0:
             raise ValueError("Error delay seconds cannot be negative!")
 
+        if max_pending_batches < 1:
+            raise ValueError("Maximum number of pending batches cannot be less than one!")
+
+        self._check_threads(min_threads)
+        _check_processes(processes)
         self._polling_is_used = True
-        offset_update_id = None
-        self._start_media_group_gathering_thread()
-        self._start_thread_pool(min_threads, max_threads)
+        self._start_update_processing(min_threads, max_threads, thread_idle_timeout_secs, processes)
         logger.info("Polling started.")
 
-        with contextlib.suppress(KeyboardInterrupt):
-            while not self._polling_stopping_event.is_set():
-                # noinspection PyBroadException
-                try:
-                    updates = self.bot.get_updates(
-                        timeout_secs=timeout + 1 if timeout else None,
-                        offset=offset_update_id,
-                        limit=limit,
-                        timeout=timeout,
-                        allowed_updates=allowed_updates
-                    )
-                except RequestTimeoutError:
-                    logger.error("Timeout for requesting updates has expired!")
-                except Exception:
-                    logger.exception("An error occurred while receiving updates!")
-                    time.sleep(error_delay_secs)
-                else:
-                    for i in updates:
-                        self._process_update(i)
-
-                    if updates:
-                        offset_update_id = updates[-1].update_id + 1
+        if pipelined or (self._process_pool is not None):
+            self._run_pipelined_polling(
+                max_pending_batches=max_pending_batches,
+                error_delay_secs=error_delay_secs,
+                limit=limit,
+                timeout=timeout,
+                allowed_updates=allowed_updates
+            )
+        else:
+            self._run_serial_polling(
+                error_delay_secs=error_delay_secs,
+                limit=limit,
+                timeout=timeout,
+                allowed_updates=allowed_updates
+            )
 
         self._polling_stopping_event.clear()
         logger.info("Polling stopped.")
@@ -736,7 +766,11 @@ class Dispatcher:
         path: Optional[str] = None,
         secret_token: Optional[str] = None,
         certificate_path: Union[str, Path, None] = None,
-        private_key_path: Union[str, Path, None] = None
+        private_key_path: Union[str, Path, None] = None,
+        thread_idle_timeout_secs: Union[int, float, None] = 60,
+        max_queue_size: int = 1000,
+        parser_threads: int = 1,
+        processes: int = 1
     ) -> None:
         try:
             import cherrypy
@@ -746,13 +780,15 @@ class Dispatcher:
                 "\npip install -U telebox[server]"
             ) from None
 
-        if self._server_is_used:
-            raise DispatcherError("Server cannot be run twice!")
-
-        if self._polling_is_used:
-            raise DispatcherError("Server cannot be run while polling is used!")
-
-        self._server_is_used = True
+        webhook_app = self.get_webhook_app(
+            min_threads,
+            max_threads,
+            secret_token=secret_token,
+            max_queue_size=max_queue_size,
+            parser_threads=parser_threads,
+            thread_idle_timeout_secs=thread_idle_timeout_secs,
+            processes=processes
+        )
         cherrypy.config.update({
             "server.socket_host": host,
             "server.socket_port": port,
@@ -768,12 +804,6 @@ class Dispatcher:
                 "server.ssl_private_key": str(private_key_path),
             })
 
-        server_root = _get_server_root(
-            update_processor=self._process_update,
-            secret_token=secret_token
-        )
-        self._start_media_group_gathering_thread()
-        self._start_thread_pool(min_threads, max_threads)
         path = (path or "").rstrip()
 
         if not path.startswith("/"):
@@ -782,12 +812,48 @@ class Dispatcher:
         cherrypy.log.error_log.propagate = False
         cherrypy.log.access_log.propagate = False
         logger.info("Server started.")
-        cherrypy.tree.mount(server_root, path)
+        cherrypy.tree.graft(webhook_app, path)
         cherrypy.engine.start()
         cherrypy.engine.block()
         logger.info("Server stopped.")
-        self._finish_update_processing()
-        self._server_is_used = False
+        webhook_app.stop()
+
+    def get_webhook_app(
+        self,
+        min_threads: int = 5,
+        max_threads: int = 25,
+        *,
+        secret_token: Optional[str] = None,
+        max_queue_size: int = 1000,
+        parser_threads: int = 1,
+        thread_idle_timeout_secs: Union[int, float, None] = 60,
+        processes: int = 1
+    ) -> WebhookApp:
+        if self._server_is_used:
+            raise DispatcherError("Server cannot be run twice!")
+
+        if self._polling_is_used:
+            raise DispatcherError("Server cannot be run while polling is used!")
+
+        self._check_threads(min_threads)
+        _check_processes(processes)
+        webhook_app = WebhookApp(
+            update_loader=self._load_webhook_update if processes == 1 else _get_raw_update,
+            update_processor=(
+                self._process_update
+                if processes == 1
+                else self._send_webhook_update_to_process
+            ),
+            secret_token=secret_token,
+            max_queue_size=max_queue_size,
+            parser_threads=parser_threads,
+            stop_callback=self._finish_server
+        )
+        self._server_is_used = True
+        self._start_update_processing(min_threads, max_threads, thread_idle_timeout_secs, processes)
+        webhook_app.start()
+
+        return webhook_app
 
     def stop_server(self) -> None:
         if not self._server_is_used:
@@ -822,6 +888,141 @@ class Dispatcher:
 
         logger.info("Pending updates dropped.")
 
+    def _run_serial_polling(
+        self,
+        *,
+        error_delay_secs: Union[int, float],
+        limit: Optional[int],
+        timeout: Optional[int],
+        allowed_updates: Optional[list[str]]
+    ) -> None:
+        offset_update_id = None
+
+        with contextlib.suppress(KeyboardInterrupt):
+            while not self._polling_stopping_event.is_set():
+                # noinspection PyBroadException
+                try:
+                    updates = self.bot.get_updates(
+                        timeout_secs=timeout + 1 if timeout else None,
+                        offset=offset_update_id,
+                        limit=limit,
+                        timeout=timeout,
+                        allowed_updates=allowed_updates
+                    )
+                except self.bot.transport.timeout_error_types:
+                    logger.error("Timeout for requesting updates has expired!")
+                except Exception:
+                    logger.exception("An error occurred while receiving updates!")
+                    time.sleep(error_delay_secs)
+                else:
+                    for i in updates:
+                        self._process_update(i)
+
+                    if updates:
+                        offset_update_id = updates[-1].update_id + 1
+
+    def _run_pipelined_polling(
+        self,
+        *,
+        max_pending_batches: int,
+        error_delay_secs: Union[int, float],
+        limit: Optional[int],
+        timeout: Optional[int],
+        allowed_updates: Optional[list[str]]
+    ) -> None:
+        batches: BoundedQueue[Optional[list[dict[str, Any]]]] = BoundedQueue(max_pending_batches)
+        offset = UpdateOffset()
+        fetching_thread = Thread(
+            target=self._run_update_fetching,
+            kwargs={
+                "batches": batches,
+                "offset": offset,
+                "error_delay_secs": error_delay_secs,
+                "limit": limit,
+                "timeout": timeout,
+                "allowed_updates": allowed_updates
+            },
+            daemon=True
+        )
+        fetching_thread.start()
+
+        try:
+            self._run_update_loading(batches, offset)
+        except KeyboardInterrupt:
+            self._polling_stopping_event.set()
+            offset.close()
+            self._run_update_loading(batches, offset)
+
+        fetching_thread.join()
+
+    def _run_update_fetching(
+        self,
+        batches: BoundedQueue,
+        offset: UpdateOffset,
+        *,
+        error_delay_secs: Union[int, float],
+        limit: Optional[int],
+        timeout: Optional[int],
+        allowed_updates: Optional[list[str]]
+    ) -> None:
+        last_update_id = None
+
+        try:
+            while not self._polling_stopping_event.is_set():
+                # Only updates that have already been enqueued are confirmed by the offset.
+                offset_update_id = offset.value
+
+                # noinspection PyBroadException
+                try:
+                    updates = self.bot.get_raw_updates(
+                        timeout_secs=timeout + 1 if timeout else None,
+                        offset=offset_update_id,
+                        limit=limit,
+                        timeout=timeout,
+                        allowed_updates=allowed_updates
+                    )
+                except self.bot.transport.timeout_error_types:
+                    logger.error("Timeout for requesting updates has expired!")
+                except Exception:
+                    logger.exception("An error occurred while receiving updates!")
+                    self._polling_stopping_event.wait(error_delay_secs)
+                else:
+                    if last_update_id is not None:
+                        # Unconfirmed updates are returned again, so the fetched ones are skipped.
+                        updates = [i for i in updates if i["update_id"] > last_update_id]
+
+                    if updates:
+                        batches.put(updates)
+                        last_update_id = updates[-1]["update_id"]
+                    elif (last_update_id is not None) and (
+                        (offset_update_id is None) or (offset_update_id <= last_update_id)
+                    ):
+                        offset.wait_change(offset_update_id)
+        finally:
+            batches.put(None)
+
+    def _run_update_loading(self, batches: BoundedQueue, offset: UpdateOffset) -> None:
+        while True:
+            updates = batches.get()
+
+            if updates is None:
+                break
+
+            for i in updates:
+                if self._process_pool is not None:
+                    self._send_update_to_process(i)
+                    continue
+
+                # noinspection PyBroadException
+                try:
+                    update = self.bot.load_update(i)
+                except Exception:
+                    logger.exception("An error occurred while loading an update %r!", i)
+                else:
+                    self._process_update(update)
+
+            offset.confirm(updates[-1]["update_id"])
+
     def _add_event_handler(
         self,
         handler: AbstractEventHandler,
@@ -835,9 +1036,12 @@ class Dispatcher:
         if not filter_.check_event_type(event_type):
             raise DispatcherError(f"{event_type!r} is not supported by this filter!")
 
+        if self._filter_optimizer is not None:
+            self._filter_optimizer.add_filter(filter_)
+
         rate_limit = self._get_rate_limit(rate_limit)
         rate_limiter = RateLimiter(rate_limit) if rate_limit is not None else None
-        self._event_handlers[event_type].append(
+        self._event_handlers[event_type].add(
             EventHandlerInfo(
                 handler=handler,
                 filter=filter_,
@@ -871,7 +1075,7 @@ class Dispatcher:
     def _get_event_handler(self, event: Event, event_type: EventType) -> Optional[EventHandlerInfo]:
         results = {}
 
-        for i in self._event_handlers[event_type]:
+        for i in self._event_handlers[event_type].get_candidates(event):
             if i.filter.get_result(event, results):
                 return i
 
@@ -888,6 +1092,10 @@ class Dispatcher:
     ) -> Optional[RateLimit]:
         return rate_limit if rate_limit is not NOT_SET else self._rate_limit
 
+    def _finish_server(self) -> None:
+        self._finish_update_processing()
+        self._server_is_used = False
+
     def _start_media_group_gathering_thread(self) -> None:
         self._media_group_gathering_thread = Thread(
             target=self._run_media_group_gathering,
@@ -895,15 +1103,103 @@ class Dispatcher:
         )
         self._media_group_gathering_thread.start()
 
-    def _start_thread_pool(self, min_threads: int, max_threads: int) -> None:
+    def _check_threads(self, min_threads: int) -> None:
+        if min_threads < self._events.shards:
+            raise ValueError("Minimum number of threads cannot be less than number of shards!")
+
+    def _start_thread_pool(
+        self,
+        min_threads: int,
+        max_threads: int,
+        idle_timeout_secs: Union[int, float, None]
+    ) -> None:
         self._thread_pool = ThreadPool(
             min_threads=min_threads,
             max_threads=max_threads,
             target=self._run_event_processing,
-            with_barrier=True
+            with_barrier=True,
+            idle_timeout_secs=idle_timeout_secs,
+            get_queue_size=lambda: self._events.size
         )
         self._thread_pool.start_threads()
 
+    def _start_update_processing(
+        self,
+        min_threads: int,
+        max_threads: int,
+        thread_idle_timeout_secs: Union[int, float, None],
+        processes: int
+    ) -> None:
+        if processes == 1:
+            self._start_media_group_gathering_thread()
+            self._start_thread_pool(min_threads, max_threads, thread_idle_timeout_secs)
+        else:
+            self._process_pool = UpdateProcessPool(
+                processes=processes,
+                target=functools.partial(
+                    self._run_update_process,
+                    processes=processes,
+                    min_threads=min_threads,
+                    max_threads=max_threads,
+                    thread_idle_timeout_secs=thread_idle_timeout_secs
+                )
+            )
+            self._process_pool.start()
+
+    def _run_update_process(
+        self,
+        connection: Connection,
+        *,
+        processes: int,
+        min_threads: int,
+        max_threads: int,
+        thread_idle_timeout_secs: Union[int, float, None]
+    ) -> None:
+        signal.signal(signal.SIGINT, signal.SIG_IGN)
+        self._process_pool = None
+        self._events = self._events.get_empty_copy()
+        self.bot.transport.reset()
+
+        if self.bot.send_scheduler is not None:
+            self.bot.send_scheduler.reset(processes)
+
+        self._start_media_group_gathering_thread()
+        self._start_thread_pool(min_threads, max_threads, thread_idle_timeout_secs)
+
+        while True:
+            try:
+                content = connection.recv_bytes()
+            except EOFError:
+                break
+
+            if not content:
+                break
+
+            # noinspection PyBroadException
+            try:
+                update = self.bot.load_update(
+                    get_deserialized_data(content)
+                )
+            except Exception:
+                logger.exception("An error occurred while loading an update %r!", content)
+            else:
+                self._process_update(update)
+
+        self._finish_update_processing()
+
+    def _send_update_to_process(self, data: dict[str, Any], content: Optional[bytes] = None) -> None:
+        logger.debug("Update sent to process: %r.", data)
+        self._process_pool.put(data, content)
+
+    def _send_webhook_update_to_process(self, content: bytes) -> None:
+        # The chat ID is needed to choose a process, but the original content is sent.
+        self._send_update_to_process(get_deserialized_data(content), content)
+
+    def _load_webhook_update(self, content: bytes) -> Update:
+        return self.bot.load_update(
+            get_deserialized_data(content)
+        )
+
     def _process_update(self, update: Update) -> None:
         logger.debug("Update received: %r.", update)
         event = update.content
@@ -922,16 +1218,7 @@ class Dispatcher:
             (event_type in frozenset((EventType.MESSAGE, EventType.CHANNEL_POST)))
             and (event.media_group_id is not None)
         ):
-            event: Message
-
-            with self._media_group_message_lock:
-                if event.media_group_id not in self._media_group_containers:
-                    self._media_group_containers[event.media_group_id] = MediaGroupContainer(
-                        event=event,
-                        event_type=event_type
-                    )
-                else:
-                    self._media_group_containers[event.media_group_id].add_event(event)
+            self._add_media_group_message(event, event_type)
 
             return
 
@@ -944,106 +1231,125 @@ class Dispatcher:
             )
         )
 
+    def _add_media_group_message(self, event: Message, event_type: EventType) -> None:
+        with self._media_group_condition:
+            container = self._media_group_containers.get(event.media_group_id)
+
+            if container is None:
+                container = self._media_group_containers[event.media_group_id] = MediaGroupContainer(
+                    event=event,
+                    event_type=event_type
+                )
+            else:
+                container.add_event(event)
+
+            if len(container.events) < MAX_MEDIA_GROUP_SIZE:
+                heapq.heappush(
+                    self._media_group_deadlines,
+                    (container.time + self._media_group_gathering_secs, event.media_group_id)
+                )
+
+                if self._media_group_deadlines[0][1] == event.media_group_id:
+                    self._media_group_condition.notify()
+
+                return
+
+            del self._media_group_containers[event.media_group_id]
+
+        self._add_event_to_queue(
+            _get_media_group_event_info(container)
+        )
+
     def _finish_update_processing(self) -> None:
         logger.info("Finishing update processing...")
-        self._wait_events()
-        self._media_group_gathering_thread = None
-        self._thread_pool = None
+
+        if self._process_pool is not None:
+            self._process_pool.stop()
+            self._process_pool = None
+        else:
+            self._events.wait_events()
+            self._media_group_gathering_thread = None
+            self._thread_pool = None
+
         logger.info("Update processing finished.")
 
     def _run_media_group_gathering(self) -> NoReturn:
         while True:
-            with self._media_group_message_lock:
-                for media_group_id in tuple(self._media_group_containers):
-                    secs = time.monotonic() - self._media_group_containers[media_group_id].time
-
-                    if secs > self._media_group_gathering_secs:
-                        container = self._media_group_containers.pop(media_group_id)
-                        event = MediaGroup(container.events)
-
-                        if container.event_type is EventType.MESSAGE:
-                            event_type = EventType.MEDIA_GROUP
-                        elif container.event_type is EventType.CHANNEL_POST:
-                            event_type = EventType.CHANNEL_MEDIA_GROUP
-                        else:
-                            raise RuntimeError(
-                                f"Unknown message type {container.event_type!r}!"
-                            )
-
-                        self._add_event_to_queue(
-                            EventInfo(
-                                event=event,
-                                event_type=event_type,
-                                chat_id=get_event_chat_id(event),
-                                user_id=get_event_user_id(event)
-                            )
+            containers = []
+
+            with self._media_group_condition:
+                while not containers:
+                    now = time.monotonic()
+
+                    while self._media_group_deadlines and (self._media_group_deadlines[0][0] <= now):
+                        deadline, media_group_id = heapq.heappop(self._media_group_deadlines)
+                        container = self._media_group_containers.get(media_group_id)
+
+                        if (
+                            (container is not None)
+                            and (container.time + self._media_group_gathering_secs == deadline)
+                        ):
+                            del self._media_group_containers[media_group_id]
+                            containers.append(container)
+
+                    if not containers:
+                        self._media_group_condition.wait(
+                            self._media_group_deadlines[0][0] - now if self._media_group_deadlines else None
                         )
 
-            time.sleep(_MEDIA_GROUP_GATHERING_DELAY_SECS)
+            for i in containers:
+                self._add_event_to_queue(
+                    _get_media_group_event_info(i)
+                )
 
     def _add_event_to_queue(self, event: EventInfo) -> None:
-        with self._new_event_condition:
-            self._events.append(event)
-            self._unprocessed_events += 1
+        if self._events.put(event):
             logger.debug("Event added to queue: %r.", event.event)
-            self._new_event_condition.notify()
-
-    def _get_event_from_queue(self) -> EventInfo:
-        with self._new_event_condition:
-            while not self._events:
-                self._new_event_condition.wait()
-
-            return self._events.popleft()
 
-    def _wait_events(self) -> None:
-        with self._all_events_processed_condition:
-            while self._unprocessed_events:
-                self._all_events_processed_condition.wait()
-
-    def _set_event_completion(self) -> None:
-        with self._all_events_processed_condition:
-            self._unprocessed_events -= 1
-
-            if not self._unprocessed_events:
-                self._all_events_processed_condition.notify_all()
-
-    def _set_chat_event_completion(self, chat_id: int) -> None:
-        with self._new_event_condition:
-            chat_events = self._chat_queues.get(chat_id)
-
-            if chat_events is None:
-                self._processing_chat_ids.remove(chat_id)
-
-                return
+    def _run_event_processing(self) -> None:
+        thread_pool = self._thread_pool
+        shard = self._events.register_worker()
+        next_event = None
+        idle_start_time = None
 
-            next_event = chat_events.get_nowait()
-            next_event.from_chat_queue = True
+        while True:
+            if next_event is not None:
+                event = next_event
+                next_event = None
+            else:
+                if idle_start_time is None:
+                    idle_start_time = time.monotonic()
+
+                event = self._events.get(shard, self._get_event_timeout_secs(idle_start_time))
+
+            if event is None:
+                # An idle worker moves to a shard whose workers cannot keep up.
+                new_shard = self._events.move_worker(shard)
+
+                if new_shard != shard:
+                    shard = new_shard
+                    idle_start_time = None
+                elif (
+                    (thread_pool.idle_timeout_secs is not None)
+                    and (time.monotonic() - idle_start_time >= thread_pool.idle_timeout_secs)
+                ):
+                    idle_start_time = None
 
-            if chat_events.empty():
-                del self._chat_queues[chat_id]
+                    if self._events.unregister_worker(shard):
+                        if thread_pool.check_thread_retirement():
+                            return
 
-            self._events.append(next_event)
-            self._new_event_condition.notify()
+                        shard = self._events.register_worker()
 
-    def _process_busy_threads(self) -> None:
-        with self._busy_thread_lock:
-            self._busy_threads += 1
+                continue
 
-            if (
-                (self._busy_threads == self._thread_pool.threads)
-                and (self._thread_pool.threads < self._thread_pool.max_threads)
-            ):
-                self._thread_pool.create_thread()
-                logger.debug("Additional event processing thread created.")
+            idle_start_time = None
 
-    def _run_event_processing(self) -> NoReturn:
-        while True:
-            event = self._get_event_from_queue()
             logger.debug("Event processing started: %r.", event.event)
 
             try:
                 event_context.set(event.event)
-                self._process_busy_threads()
+                thread_pool.set_thread_busy()
                 event.busy_threads_processed = True
 
                 if not event.middleware_pre_processed:
@@ -1071,19 +1377,11 @@ class Dispatcher:
                 if event_handler.with_chat_queue and (event.chat_id is not None):
                     event.with_chat_queue = True
 
-                    if not event.from_chat_queue:
-                        with self._event_lock:
-                            if event.chat_id in self._processing_chat_ids:
-                                chat_events = self._chat_queues.get(event.chat_id)
-
-                                if chat_events is None:
-                                    chat_events = self._chat_queues[event.chat_id] = Queue()
+                    if (not event.from_chat_queue) and self._events.add_chat_event(shard, event):
+                        if event.processing_status is not ProcessingStatus.DROPPED:
+                            event.processing_status = ProcessingStatus.ADDED_TO_CHAT_QUEUE
 
-                                chat_events.put_nowait(event)
-                                event.processing_status = ProcessingStatus.ADDED_TO_CHAT_QUEUE
-                                continue
-                            else:
-                                self._processing_chat_ids.add(event.chat_id)
+                        continue
 
                 event_handler_context.set(event_handler.handler)
 
@@ -1132,8 +1430,10 @@ class Dispatcher:
                 self._process_event_error(error, event)
             finally:
                 if event.busy_threads_processed:
-                    with self._busy_thread_lock:
-                        self._busy_threads -= 1
+                    thread_pool.set_thread_idle()
+
+                if event.processing_status is ProcessingStatus.DROPPED:
+                    continue
 
                 if event.processing_status is not ProcessingStatus.ERROR_OCCURRED:
                     logger.debug(
@@ -1146,9 +1446,36 @@ class Dispatcher:
                     continue
 
                 if event.with_chat_queue:
-                    self._set_chat_event_completion(chat_id=event.chat_id)
+                    # The next event of the chat is processed by the same thread right away.
+                    next_event = self._events.set_chat_event_completion(shard, event.chat_id)
+
+                self._events.set_event_completion(shard, event.chat_id)
+
+    def _get_event_timeout_secs(self, idle_start_time: float) -> Union[int, float, None]:
+        timeout_secs = self._thread_pool.idle_timeout_secs
+
+        if timeout_secs is not None:
+            timeout_secs = max(idle_start_time + timeout_secs - time.monotonic(), 0)
+
+        if self._events.shards == 1:
+            return timeout_secs
+        elif timeout_secs is None:
+            return _WORKER_REBALANCE_INTERVAL_SECS
 
-                self._set_event_completion()
+        return min(timeout_secs, _WORKER_REBALANCE_INTERVAL_SECS)
+
+    def _process_dropped_event(self, event: EventInfo) -> None:
+        logger.debug(
+            _EVENT_PROCESSING_LOG_TEMPLATES[ProcessingStatus.DROPPED],
+            event.event
+        )
+
+        # noinspection PyBroadException
+        try:
+            for i in self._middlewares:
+                i.process_dropped_event(event.event, event.event_type)
+        except Exception:
+            logger.exception("An error occurred while processing a dropped event %r!", event.event)
 
     def _process_event_error(self, error: Exception, event: EventInfo) -> None:
         # noinspection PyBroadException
@@ -1186,42 +1513,30 @@ def _get_error_filter(
     return filter_ if filter_ is not None else _none_error_filter
 
 
-def _get_server_root(
-    update_processor: Callable[[Update], None],
-    secret_token: Optional[str] = None
-):
-    import cherrypy
+def _get_media_group_event_info(container: MediaGroupContainer) -> EventInfo:
+    event = MediaGroup(container.events)
 
-    class ServerRoot:
-
-        def __init__(self):
-            self._update_processor = update_processor
-            self._secret_token = secret_token
-            self._dataclass_converter = DataclassConverter()
-
-        @cherrypy.expose
-        def index(self) -> str:
-            if self._secret_token is not None:
-                secret_token_ = cherrypy.request.headers.get("X-Telegram-Bot-Api-Secret-Token")
-
-                if secret_token_ != self._secret_token:
-                    raise cherrypy.HTTPError(403)
+    if container.event_type is EventType.MESSAGE:
+        event_type = EventType.MEDIA_GROUP
+    elif container.event_type is EventType.CHANNEL_POST:
+        event_type = EventType.CHANNEL_MEDIA_GROUP
+    else:
+        raise RuntimeError(
+            f"Unknown message type {container.event_type!r}!"
+        )
 
-            content_length = cherrypy.request.headers.get("Content-Length")
+    return EventInfo(
+        event=event,
+        event_type=event_type,
+        chat_id=get_event_chat_id(event),
+        user_id=get_event_user_id(event)
+    )
 
-            if content_length is None:
-                raise cherrypy.HTTPError(403)
 
-            update = self._dataclass_converter.get_object(
-                data=get_deserialized_data(
-                    cherrypy.request.body.read(
-                        int(content_length)
-                    )
-                ),
-                class_=Update
-            )
-            self._update_processor(update)
+def _check_processes(processes: int) -> None:
+    if processes < 1:
+        raise ValueError("Number of processes cannot be less than one!")
 
-            return ""
 
-    return ServerRoot()
+def _get_raw_update(content: bytes) -> bytes:
+    return content
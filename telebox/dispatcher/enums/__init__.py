@@ -1,8 +1,10 @@
 from .event_type import EventType
 from .media_group_content_type import MediaGroupContentType
+from .overflow_policy import OverflowPolicy
 
 
 __all__ = [
     "EventType",
-    "MediaGroupContentType"
+    "MediaGroupContentType",
+    "OverflowPolicy"
 ]
@@ -0,0 +1,8 @@
+from enum import Enum
+
+
+class OverflowPolicy(Enum):
+    BLOCK = "block"
+    DROP_OLDEST = "drop_oldest"
+    DROP_NEWEST = "drop_newest"
+    PRIORITY = "priority"
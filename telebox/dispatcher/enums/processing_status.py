@@ -8,3 +8,4 @@ class ProcessingStatus(IntEnum):
     RATE_LIMIT_EXCEEDED = 4
     ERROR_OCCURRED = 5
     ADDED_TO_CHAT_QUEUE = 6
+    DROPPED = 7
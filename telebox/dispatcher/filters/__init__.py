@@ -3,6 +3,9 @@ from .events import (
     AbstractEventFilter,
     AbstractEventBaseFilter,
     AbstractEventFilterCache,
+    AbstractEventFilterIndex,
+    EventFilterOptimizer,
+    EventFilterStats,
     CallbackKeyFilterFactory,
     CashtagFilterFactory,
     ChatStateFilterFactory,
@@ -46,6 +49,9 @@ __all__ = [
     "AbstractEventFilter",
     "AbstractEventBaseFilter",
     "AbstractEventFilterCache",
+    "AbstractEventFilterIndex",
+    "EventFilterOptimizer",
+    "EventFilterStats",
     "CallbackKeyFilterFactory",
     "CashtagFilterFactory",
     "ChatStateFilterFactory",
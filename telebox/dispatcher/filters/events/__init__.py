@@ -1,6 +1,8 @@
 from .factory import AbstractEventFilterFactory
 from .filter import AbstractEventFilter, AbstractEventBaseFilter
 from .cache import AbstractEventFilterCache
+from .index import AbstractEventFilterIndex
+from .optimizer import EventFilterOptimizer, EventFilterStats
 from .factories import (
     CallbackKeyFilterFactory,
     CashtagFilterFactory,
@@ -37,6 +39,9 @@ __all__ = [
     "AbstractEventFilter",
     "AbstractEventBaseFilter",
     "AbstractEventFilterCache",
+    "AbstractEventFilterIndex",
+    "EventFilterOptimizer",
+    "EventFilterStats",
     "CallbackKeyFilterFactory",
     "CashtagFilterFactory",
     "ChatStateFilterFactory",
@@ -1,8 +1,10 @@
-from typing import Any, Iterable
+from dataclasses import dataclass
+from typing import Optional, Any, Iterable
 
 from telebox.dispatcher.filters.events.factory import AbstractEventFilterFactory
 from telebox.dispatcher.filters.events.filter import AbstractEventFilter
 from telebox.dispatcher.filters.events.cache import AbstractEventFilterCache
+from telebox.dispatcher.filters.events.index import AbstractEventFilterIndex
 from telebox.dispatcher.enums.event_type import EventType
 from telebox.utils.callback_data_builders.builder import AbstractCallbackDataBuilder
 from telebox.bot.types.types.callback_query import CallbackQuery
@@ -18,11 +20,20 @@ class CallbackKeyFilterCache(AbstractEventFilterCache):
             return self._builder.get_key(event.data)
 
 
+@dataclass(frozen=True)
+class CallbackKeyFilterIndex(AbstractEventFilterIndex):
+    cache: CallbackKeyFilterCache
+
+    def get_key(self, event: CallbackQuery) -> Any:
+        return self.cache.get(event)
+
+
 class CallbackKeyFilter(AbstractEventFilter):
 
     def __init__(self, keys: Iterable[Any], cache: CallbackKeyFilterCache):
         self._keys = set(keys)
         self._cache = cache
+        self._index = CallbackKeyFilterIndex(cache)
 
     def get_event_types(self) -> set[EventType]:
         return {EventType.CALLBACK_QUERY}
@@ -35,6 +46,9 @@ class CallbackKeyFilter(AbstractEventFilter):
 
         return key is not None
 
+    def get_index_keys(self) -> Optional[tuple[CallbackKeyFilterIndex, frozenset[Any]]]:
+        return (self._index, frozenset(self._keys)) if self._keys else None
+
 
 class CallbackKeyFilterFactory(AbstractEventFilterFactory):
 
@@ -1,8 +1,10 @@
+from dataclasses import dataclass
 from typing import Optional, Union, Iterable
 
 from telebox.dispatcher.filters.events.factory import AbstractEventFilterFactory
 from telebox.dispatcher.filters.events.filter import AbstractEventFilter
 from telebox.dispatcher.filters.events.cache import AbstractEventFilterCache
+from telebox.dispatcher.filters.events.index import AbstractEventFilterIndex
 from telebox.dispatcher.enums.event_type import EventType
 from telebox.dispatcher.utils.media_group import MediaGroup
 from telebox.bot.types.types.message import Message
@@ -19,6 +21,18 @@ class CommandFilterCache(AbstractEventFilterCache):
                 return message.get_entity_text(i)
 
 
+@dataclass(frozen=True)
+class CommandFilterIndex(AbstractEventFilterIndex):
+    cache: CommandFilterCache
+    ignore_case: bool
+
+    def get_key(self, event: Union[Message, MediaGroup]) -> Optional[str]:
+        command = self.cache.get(event)
+
+        if command is not None:
+            return _get_normalized_command(command, self.ignore_case)
+
+
 class CommandFilter(AbstractEventFilter):
 
     def __init__(
@@ -42,6 +56,7 @@ class CommandFilter(AbstractEventFilter):
 
         self._ignore_case = ignore_case
         self._cache = cache
+        self._index = CommandFilterIndex(cache, ignore_case)
 
     def get_event_types(self) -> set[EventType]:
         return {
@@ -57,16 +72,13 @@ class CommandFilter(AbstractEventFilter):
             if not self._commands:
                 return True
 
-            if self._ignore_case:
-                command = command.lower()
-            elif "@" in command:
-                command, username = command.split("@", 1)
-                command = f"{command}@{username.lower()}"
-
-            return command in self._commands
+            return _get_normalized_command(command, self._ignore_case) in self._commands
 
         return False
 
+    def get_index_keys(self) -> Optional[tuple[CommandFilterIndex, frozenset[str]]]:
+        return (self._index, frozenset(self._commands)) if self._commands else None
+
 
 class CommandFilterFactory(AbstractEventFilterFactory):
 
@@ -76,3 +88,14 @@ class CommandFilterFactory(AbstractEventFilterFactory):
 
     def get(self, *commands: str, ignore_case: bool = True) -> CommandFilter:
         return CommandFilter(commands, self._username, ignore_case, self._cache)
+
+
+def _get_normalized_command(command: str, ignore_case: bool) -> str:
+    if ignore_case:
+        return command.lower()
+    elif "@" in command:
+        command, username = command.split("@", 1)
+
+        return f"{command}@{username.lower()}"
+
+    return command
@@ -1,9 +1,16 @@
 from abc import ABC, abstractmethod
+from typing import Optional, Hashable, TYPE_CHECKING
 
 from telebox.dispatcher.enums.event_type import EventType
+from telebox.dispatcher.filters.events.index import AbstractEventFilterIndex
+if TYPE_CHECKING:
+    from telebox.dispatcher.filters.events.optimizer import EventFilterOptimizer
 
 
 class AbstractEventBaseFilter(ABC):
+    # Filters that rely on the filters before them (e.g. a reply check guarding
+    # a replied message check) set it to False to keep their place.
+    reorderable = True
 
     def __invert__(self):
         return InversionEventFilter(self)
@@ -32,6 +39,9 @@ class AbstractEventBaseFilter(ABC):
     def get_result(self, event, results: dict["AbstractEventBaseFilter", bool]) -> bool:
         pass
 
+    def get_index_keys(self) -> Optional[tuple[AbstractEventFilterIndex, frozenset[Hashable]]]:
+        return None
+
 
 class AbstractEventFilter(AbstractEventBaseFilter, ABC):
 
@@ -77,6 +87,7 @@ class ConjunctionEventFilter(AbstractEventBaseFilter):
 
     def __init__(self, *filters: AbstractEventBaseFilter):
         self.filters = filters
+        self.optimizer: Optional["EventFilterOptimizer"] = None
 
     def __repr__(self):
         return f"{type(self).__name__}({', '.join(repr(i) for i in self.filters)})"
@@ -96,13 +107,26 @@ class ConjunctionEventFilter(AbstractEventBaseFilter):
         return all(i.check_event_type(event_type) for i in self.filters)
 
     def get_result(self, event, results: dict[AbstractEventBaseFilter, bool]) -> bool:
+        if self.optimizer is not None:
+            return self.optimizer.get_result(self, event, results)
+
         return all(i.get_result(event, results) for i in self.filters)
 
+    def get_index_keys(self) -> Optional[tuple[AbstractEventFilterIndex, frozenset[Hashable]]]:
+        index_keys = [
+            i
+            for i in (j.get_index_keys() for j in self.filters)
+            if i is not None
+        ]
+
+        return min(index_keys, key=lambda x: len(x[1])) if index_keys else None
+
 
 class DisjunctionEventFilter(AbstractEventBaseFilter):
 
     def __init__(self, *filters: AbstractEventBaseFilter):
         self.filters = filters
+        self.optimizer: Optional["EventFilterOptimizer"] = None
 
     def __repr__(self):
         return f"{type(self).__name__}({', '.join(repr(i) for i in self.filters)})"
@@ -122,4 +146,22 @@ class DisjunctionEventFilter(AbstractEventBaseFilter):
         return all(i.check_event_type(event_type) for i in self.filters)
 
     def get_result(self, event, results: dict[AbstractEventBaseFilter, bool]) -> bool:
+        if self.optimizer is not None:
+            return self.optimizer.get_result(self, event, results)
+
         return any(i.get_result(event, results) for i in self.filters)
+
+    def get_index_keys(self) -> Optional[tuple[AbstractEventFilterIndex, frozenset[Hashable]]]:
+        index = None
+        keys = set()
+
+        for i in self.filters:
+            index_keys = i.get_index_keys()
+
+            if (index_keys is None) or ((index is not None) and (index_keys[0] != index)):
+                return
+
+            index = index_keys[0]
+            keys.update(index_keys[1])
+
+        return (index, frozenset(keys)) if index is not None else None
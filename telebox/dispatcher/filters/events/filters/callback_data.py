@@ -1,8 +1,22 @@
+from dataclasses import dataclass
+from typing import Optional
+
 from telebox.dispatcher.filters.events.filter import AbstractEventFilter
+from telebox.dispatcher.filters.events.index import AbstractEventFilterIndex
 from telebox.dispatcher.enums.event_type import EventType
 from telebox.bot.types.types.callback_query import CallbackQuery
 
 
+@dataclass(frozen=True)
+class CallbackDataFilterIndex(AbstractEventFilterIndex):
+
+    def get_key(self, event: CallbackQuery) -> Optional[str]:
+        return event.data
+
+
+_index = CallbackDataFilterIndex()
+
+
 class CallbackDataFilter(AbstractEventFilter):
 
     def __init__(self, *data: str):
@@ -13,3 +27,6 @@ class CallbackDataFilter(AbstractEventFilter):
 
     def check_event(self, event: CallbackQuery) -> bool:
         return event.data in self._data if self._data else event.data is not None
+
+    def get_index_keys(self) -> Optional[tuple[CallbackDataFilterIndex, frozenset[str]]]:
+        return (_index, frozenset(self._data)) if self._data else None
@@ -1,6 +1,8 @@
+from dataclasses import dataclass
 from typing import Union
 
 from telebox.dispatcher.filters.events.filter import AbstractEventFilter
+from telebox.dispatcher.filters.events.index import AbstractEventFilterIndex
 from telebox.dispatcher.enums.event_type import EventType
 from telebox.dispatcher.utils.media_group import MediaGroup
 from telebox.bot.types.types.message import Message
@@ -9,6 +11,23 @@ from telebox.bot.types.types.chat_member_updated import ChatMemberUpdated
 from telebox.bot.types.types.chat_join_request import ChatJoinRequest
 
 
+@dataclass(frozen=True)
+class ChatTypeFilterIndex(AbstractEventFilterIndex):
+
+    def get_key(
+        self,
+        event: Union[Message,
+                     MediaGroup,
+                     CallbackQuery,
+                     ChatMemberUpdated,
+                     ChatJoinRequest]
+    ) -> str:
+        return event.chat_type
+
+
+_index = ChatTypeFilterIndex()
+
+
 class ChatTypeFilter(AbstractEventFilter):
 
     def __init__(self, *types: str):
@@ -40,3 +59,6 @@ class ChatTypeFilter(AbstractEventFilter):
                      ChatJoinRequest]
     ) -> bool:
         return event.chat_type in self._types
+
+    def get_index_keys(self) -> tuple[ChatTypeFilterIndex, frozenset[str]]:
+        return _index, frozenset(self._types)
@@ -1,9 +1,22 @@
+from dataclasses import dataclass
+
 from telebox.dispatcher.filters.events.filter import AbstractEventFilter
+from telebox.dispatcher.filters.events.index import AbstractEventFilterIndex
 from telebox.dispatcher.enums.event_type import EventType
 from telebox.bot.types.types.message import Message
 from telebox.bot.enums.message_content_type import MessageContentType
 
 
+@dataclass(frozen=True)
+class MessageContentTypeFilterIndex(AbstractEventFilterIndex):
+
+    def get_key(self, event: Message) -> MessageContentType:
+        return event.content_type
+
+
+_index = MessageContentTypeFilterIndex()
+
+
 class MessageContentTypeFilter(AbstractEventFilter):
 
     def __init__(self, *types: MessageContentType):
@@ -22,3 +35,6 @@ class MessageContentTypeFilter(AbstractEventFilter):
 
     def check_event(self, event: Message) -> bool:
         return event.content_type in self._types
+
+    def get_index_keys(self) -> tuple[MessageContentTypeFilterIndex, frozenset[MessageContentType]]:
+        return _index, frozenset(self._types)
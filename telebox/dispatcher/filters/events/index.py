@@ -0,0 +1,9 @@
+from abc import ABC, abstractmethod
+from typing import Hashable
+
+
+class AbstractEventFilterIndex(ABC):
+
+    @abstractmethod
+    def get_key(self, event) -> Hashable:
+        pass
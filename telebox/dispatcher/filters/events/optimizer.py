@@ -0,0 +1,166 @@
+from dataclasses import dataclass
+from typing import Union
+import time
+
+from telebox.dispatcher.filters.events.filter import (
+    AbstractEventBaseFilter,
+    InversionEventFilter,
+    ConjunctionEventFilter,
+    DisjunctionEventFilter
+)
+
+
+_MIN_PASS_RATE = 0.001
+
+
+@dataclass(frozen=True)
+class EventFilterStats:
+    calls: int
+    passes: int
+    total_secs: float
+
+    @property
+    def pass_rate(self) -> float:
+        return self.passes / self.calls if self.calls else 0.0
+
+    @property
+    def mean_secs(self) -> float:
+        return self.total_secs / self.calls if self.calls else 0.0
+
+
+class _FilterStats:
+
+    def __init__(self):
+        self.calls = 0
+        self.passes = 0
+        self.total_secs = 0.0
+
+
+class _Node:
+
+    def __init__(self, filters: tuple[AbstractEventBaseFilter, ...]):
+        self.order = filters
+        self.calls = 0
+
+
+class EventFilterOptimizer:
+    """Reorder AND/OR filters by cost and pass rate, only non-reorderable filters keep their place."""
+
+    def __init__(
+        self,
+        *,
+        sampling_interval: int = 10,
+        reordering_interval: int = 1000,
+        min_samples: int = 10
+    ):
+        if sampling_interval < 1:
+            raise ValueError("Sampling interval cannot be less than one!")
+
+        if reordering_interval < 1:
+            raise ValueError("Reordering interval cannot be less than one!")
+
+        if min_samples < 1:
+            raise ValueError("Minimum number of samples cannot be less than one!")
+
+        self._sampling_interval = sampling_interval
+        self._reordering_interval = reordering_interval
+        self._min_samples = min_samples
+        self._nodes: dict[AbstractEventBaseFilter, _Node] = {}
+        self._stats: dict[AbstractEventBaseFilter, _FilterStats] = {}
+
+    def add_filter(self, filter_: AbstractEventBaseFilter) -> None:
+        if isinstance(filter_, InversionEventFilter):
+            self.add_filter(filter_.filter)
+        elif isinstance(filter_, (ConjunctionEventFilter, DisjunctionEventFilter)):
+            if filter_ not in self._nodes:
+                self._nodes[filter_] = _Node(filter_.filters)
+
+                for i in filter_.filters:
+                    self._stats.setdefault(i, _FilterStats())
+                    self.add_filter(i)
+
+            filter_.optimizer = self
+
+    def get_stats(self) -> dict[AbstractEventBaseFilter, EventFilterStats]:
+        """Get approximate stats, concurrent updates are not synchronized and can be lost."""
+        return {
+            filter_: EventFilterStats(
+                calls=stats.calls,
+                passes=stats.passes,
+                total_secs=stats.total_secs
+            )
+            for filter_, stats in tuple(self._stats.items())
+        }
+
+    def get_order(
+        self,
+        filter_: Union[ConjunctionEventFilter, DisjunctionEventFilter]
+    ) -> tuple[AbstractEventBaseFilter, ...]:
+        return self._nodes[filter_].order
+
+    def get_result(
+        self,
+        filter_: Union[ConjunctionEventFilter, DisjunctionEventFilter],
+        event,
+        results: dict[AbstractEventBaseFilter, bool]
+    ) -> bool:
+        node = self._nodes[filter_]
+        # Counters are updated without a lock, they only drive sampling and ordering.
+        node.calls += 1
+        is_conjunction = isinstance(filter_, ConjunctionEventFilter)
+
+        if not node.calls % self._reordering_interval:
+            node.order = self._get_order(node.order, is_conjunction)
+
+        if node.calls % self._sampling_interval:
+            for i in node.order:
+                if bool(i.get_result(event, results)) is not is_conjunction:
+                    return not is_conjunction
+
+            return is_conjunction
+
+        for i in node.order:
+            start_time = time.perf_counter()
+            result = bool(i.get_result(event, results))
+            stats = self._stats[i]
+            stats.total_secs += time.perf_counter() - start_time
+            stats.calls += 1
+
+            if result:
+                stats.passes += 1
+
+            if result is not is_conjunction:
+                return not is_conjunction
+
+        return is_conjunction
+
+    def _get_order(
+        self,
+        filters: tuple[AbstractEventBaseFilter, ...],
+        is_conjunction: bool
+    ) -> tuple[AbstractEventBaseFilter, ...]:
+        order = []
+        reorderable_filters = []
+
+        for i in filters:
+            if i.reorderable:
+                reorderable_filters.append(i)
+            else:
+                order.extend(sorted(reorderable_filters, key=lambda x: self._get_rank(x, is_conjunction)))
+                order.append(i)
+                reorderable_filters = []
+
+        order.extend(sorted(reorderable_filters, key=lambda x: self._get_rank(x, is_conjunction)))
+
+        return tuple(order)
+
+    def _get_rank(self, filter_: AbstractEventBaseFilter, is_conjunction: bool) -> float:
+        stats = self._stats[filter_]
+
+        if stats.calls < self._min_samples:
+            return 0.0
+
+        pass_rate = stats.passes / stats.calls
+        short_circuit_rate = 1 - pass_rate if is_conjunction else pass_rate
+
+        return (stats.total_secs / stats.calls) / max(short_circuit_rate, _MIN_PASS_RATE)
@@ -31,6 +31,13 @@ class Middleware:
     ) -> Optional[Aborting]:
         pass
 
+    def process_dropped_event(
+        self,
+        event: Event,
+        event_type: EventType
+    ) -> None:
+        pass
+
     def pre_process_error(
         self,
         error: Exception,
@@ -1,12 +1,13 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Optional
+import time
 
 from telebox.dispatcher.typing import Event
 from telebox.dispatcher.enums.event_type import EventType
 from telebox.dispatcher.enums.processing_status import ProcessingStatus
 
 
-@dataclass
+@dataclass(eq=False)
 class EventInfo:
     event: Event
     event_type: EventType
@@ -17,3 +18,4 @@ class EventInfo:
     busy_threads_processed: bool = False
     middleware_pre_processed: bool = False
     processing_status: ProcessingStatus = ProcessingStatus.PROCESSING
+    time: float = field(default_factory=time.monotonic)
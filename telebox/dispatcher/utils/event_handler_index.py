@@ -0,0 +1,59 @@
+from typing import Iterator, Hashable
+import heapq
+
+from telebox.dispatcher.types.event_handler_info import EventHandlerInfo
+from telebox.dispatcher.filters.events.index import AbstractEventFilterIndex
+
+
+class EventHandlerIndex:
+
+    def __init__(self):
+        self._handlers: list[EventHandlerInfo] = []
+        self._unindexed_positions: list[int] = []
+        self._index_positions: dict[AbstractEventFilterIndex, list[int]] = {}
+        self._key_positions: dict[AbstractEventFilterIndex, dict[Hashable, list[int]]] = {}
+
+    def __iter__(self) -> Iterator[EventHandlerInfo]:
+        return iter(self._handlers)
+
+    def __len__(self) -> int:
+        return len(self._handlers)
+
+    def add(self, handler: EventHandlerInfo) -> None:
+        position = len(self._handlers)
+        self._handlers.append(handler)
+        index_keys = handler.filter.get_index_keys()
+
+        if index_keys is None:
+            self._unindexed_positions.append(position)
+
+            return
+
+        index, keys = index_keys
+        self._index_positions.setdefault(index, []).append(position)
+        key_positions = self._key_positions.setdefault(index, {})
+
+        for i in keys:
+            key_positions.setdefault(i, []).append(position)
+
+    def get_candidates(self, event) -> Iterator[EventHandlerInfo]:
+        if not self._key_positions:
+            yield from self._handlers
+
+            return
+
+        positions = [self._unindexed_positions]
+
+        for index, key_positions in self._key_positions.items():
+            # noinspection PyBroadException
+            try:
+                key_handler_positions = key_positions.get(index.get_key(event))
+            except Exception:
+                # The filter itself will raise or reject it when its turn comes.
+                key_handler_positions = self._index_positions[index]
+
+            if key_handler_positions is not None:
+                positions.append(key_handler_positions)
+
+        for i in heapq.merge(*positions):
+            yield self._handlers[i]
@@ -0,0 +1,83 @@
+from typing import Optional, Iterator
+from collections import deque
+import itertools
+
+from telebox.dispatcher.types.event_info import EventInfo
+from telebox.dispatcher.enums.event_type import EventType
+
+
+DEFAULT_EVENT_TYPE_WEIGHT = 1
+
+
+class EventLanes:
+
+    def __init__(self, event_type_weights: Optional[dict[EventType, int]] = None):
+        if event_type_weights is None:
+            event_type_weights = {}
+        elif any(i < 1 for i in event_type_weights.values()):
+            raise ValueError("Event type weight cannot be less than one!")
+
+        self._event_type_weights = event_type_weights
+        self._lanes: dict[int, deque[EventInfo]] = {
+            i: deque()
+            for i in sorted({DEFAULT_EVENT_TYPE_WEIGHT, *event_type_weights.values()}, reverse=True)
+        }
+        self._current_weights = {i: 0 for i in self._lanes}
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __iter__(self) -> Iterator[EventInfo]:
+        return itertools.chain.from_iterable(self._lanes.values())
+
+    def append(self, event: EventInfo) -> None:
+        self._lanes[
+            self._event_type_weights.get(event.event_type, DEFAULT_EVENT_TYPE_WEIGHT)
+        ].append(event)
+        self._size += 1
+
+    def popleft(self) -> EventInfo:
+        lane = min(
+            (i for i in self._lanes.values() if i),
+            key=lambda x: x[0].time
+        )
+        self._size -= 1
+
+        return lane.popleft()
+
+    def pop_next(self) -> EventInfo:
+        if len(self._lanes) == 1:
+            self._size -= 1
+
+            return self._lanes[DEFAULT_EVENT_TYPE_WEIGHT].popleft()
+
+        total_weight = 0
+        selected_weight = None
+
+        for weight, lane in self._lanes.items():
+            if lane:
+                self._current_weights[weight] += weight
+                total_weight += weight
+
+                if (
+                    (selected_weight is None)
+                    or (self._current_weights[weight] > self._current_weights[selected_weight])
+                ):
+                    selected_weight = weight
+
+        lane = self._lanes[selected_weight]
+        self._current_weights[selected_weight] -= total_weight
+        self._size -= 1
+        event = lane.popleft()
+
+        if not lane:
+            self._current_weights[selected_weight] = 0
+
+        return event
+
+    def remove(self, event: EventInfo) -> None:
+        self._lanes[
+            self._event_type_weights.get(event.event_type, DEFAULT_EVENT_TYPE_WEIGHT)
+        ].remove(event)
+        self._size -= 1
@@ -0,0 +1,389 @@
+from typing import Optional, Union, Callable
+from collections import deque
+from threading import Lock, Condition
+import itertools
+import math
+import time
+
+from telebox.dispatcher.types.event_info import EventInfo
+from telebox.dispatcher.enums.event_type import EventType
+from telebox.dispatcher.enums.overflow_policy import OverflowPolicy
+from telebox.dispatcher.enums.processing_status import ProcessingStatus
+from telebox.dispatcher.utils.event_lanes import EventLanes
+
+
+DEFAULT_EVENT_TYPE_PRIORITIES = {i: 1 for i in EventType} | {
+    EventType.SHIPPING_QUERY: 3,
+    EventType.PRE_CHECKOUT_QUERY: 3,
+    EventType.CALLBACK_QUERY: 2,
+    EventType.INLINE_QUERY: 2,
+    EventType.EDITED_MESSAGE: 0,
+    EventType.EDITED_CHANNEL_POST: 0,
+    EventType.EDITED_BUSINESS_MESSAGE: 0,
+    EventType.MESSAGE_REACTION: 0,
+    EventType.MESSAGE_REACTION_COUNT: 0,
+    EventType.CHOSEN_INLINE_RESULT: 0,
+    EventType.POLL: 0
+}
+
+
+class _Shard:
+
+    def __init__(
+        self,
+        max_size: Optional[int],
+        event_type_weights: Optional[dict[EventType, int]]
+    ):
+        self.events = EventLanes(event_type_weights)
+        self.max_size = max_size
+        self.processing_chat_ids: set[int] = set()
+        self.chat_queues: dict[int, deque[EventInfo]] = {}
+        self.chat_sizes: dict[int, int] = {}
+        self.unprocessed_events = 0
+        self.dropped_events = 0
+        self.workers = 0
+        self.lock = Lock()
+        self.new_event_condition = Condition(self.lock)
+        self.not_full_condition = Condition(self.lock)
+        self.all_events_processed_condition = Condition(self.lock)
+
+
+class EventQueue:
+
+    def __init__(
+        self,
+        shards: int = 1,
+        *,
+        max_size: Optional[int] = None,
+        max_chat_size: Optional[int] = None,
+        max_event_age_secs: Union[int, float, None] = None,
+        overflow_policy: OverflowPolicy = OverflowPolicy.BLOCK,
+        event_type_priorities: Optional[dict[EventType, int]] = None,
+        event_type_weights: Optional[dict[EventType, int]] = None,
+        drop_callback: Optional[Callable[[EventInfo], None]] = None
+    ):
+        if shards < 1:
+            raise ValueError("Number of shards cannot be less than one!")
+
+        if (max_size is not None) and (max_size < 1):
+            raise ValueError("Maximum queue size cannot be less than one!")
+
+        if (max_chat_size is not None) and (max_chat_size < 1):
+            raise ValueError("Maximum chat queue size cannot be less than one!")
+
+        if (max_event_age_secs is not None) and (max_event_age_secs <= 0):
+            raise ValueError("Maximum event age seconds must be greater than zero!")
+
+        shard_max_size = math.ceil(max_size / shards) if max_size is not None else None
+        self._shards = tuple(_Shard(shard_max_size, event_type_weights) for _ in range(shards))
+        self._shard_numbers = itertools.count()
+        self._worker_lock = Lock()
+        self.max_size = max_size
+        self.max_chat_size = max_chat_size
+        self.max_event_age_secs = max_event_age_secs
+        self.overflow_policy = overflow_policy
+        self.event_type_priorities = (
+            event_type_priorities
+            if event_type_priorities is not None
+            else DEFAULT_EVENT_TYPE_PRIORITIES
+        )
+        self.event_type_weights = event_type_weights
+        self._drop_callback = drop_callback
+
+    @property
+    def shards(self) -> int:
+        return len(self._shards)
+
+    @property
+    def size(self) -> int:
+        return sum(len(i.events) for i in self._shards)
+
+    @property
+    def dropped_events(self) -> int:
+        return sum(i.dropped_events for i in self._shards)
+
+    def get_empty_copy(self) -> "EventQueue":
+        return EventQueue(
+            self.shards,
+            max_size=self.max_size,
+            max_chat_size=self.max_chat_size,
+            max_event_age_secs=self.max_event_age_secs,
+            overflow_policy=self.overflow_policy,
+            event_type_priorities=self.event_type_priorities,
+            event_type_weights=self.event_type_weights,
+            drop_callback=self._drop_callback
+        )
+
+    def register_worker(self, shard_index: Optional[int] = None) -> int:
+        with self._worker_lock:
+            if shard_index is None:
+                shard_index = self._get_worker_shard_index()
+
+            self._shards[shard_index].workers += 1
+
+            return shard_index
+
+    def move_worker(self, shard_index: int) -> int:
+        with self._worker_lock:
+            shard = self._shards[shard_index]
+            new_shard_index = self._get_worker_shard_index()
+            new_shard = self._shards[new_shard_index]
+
+            if (new_shard is shard) or (shard.workers == 1) or (not new_shard.events):
+                return shard_index
+
+            shard.workers -= 1
+            new_shard.workers += 1
+
+            return new_shard_index
+
+    def unregister_worker(self, shard_index: int) -> bool:
+        with self._worker_lock:
+            shard = self._shards[shard_index]
+
+            if shard.workers == 1:
+                return False
+
+            shard.workers -= 1
+
+            return True
+
+    def put(self, event: EventInfo) -> bool:
+        shard = self._shards[self._get_shard_index(event.chat_id)]
+        dropped_event = None
+
+        with shard.lock:
+            if self.overflow_policy is OverflowPolicy.BLOCK:
+                # Workers never wait for chat queues, so the chat limit is also
+                # applied here, to the thread that receives events.
+                while _check_shard_fullness(shard) or self._check_chat_fullness(shard, event):
+                    shard.not_full_condition.wait()
+            elif _check_shard_fullness(shard):
+                dropped_event = self._pop_dropped_event(shard.events, event)
+
+                if dropped_event is not event:
+                    self._drop_event(shard, dropped_event)
+
+            if dropped_event is not event:
+                if event.chat_id is not None:
+                    shard.chat_sizes[event.chat_id] = shard.chat_sizes.get(event.chat_id, 0) + 1
+
+                shard.events.append(event)
+                shard.unprocessed_events += 1
+                shard.new_event_condition.notify()
+            else:
+                event.processing_status = ProcessingStatus.DROPPED
+                shard.dropped_events += 1
+
+        if dropped_event is not None:
+            self._process_dropped_event(dropped_event)
+
+        return dropped_event is not event
+
+    def get(
+        self,
+        shard_index: int,
+        timeout_secs: Union[int, float, None] = None
+    ) -> Optional[EventInfo]:
+        shard = self._shards[shard_index]
+        dropped_events = []
+
+        try:
+            with shard.lock:
+                end_time = time.monotonic() + timeout_secs if timeout_secs is not None else None
+
+                while True:
+                    while not shard.events:
+                        if end_time is None:
+                            shard.new_event_condition.wait()
+                        else:
+                            remaining_secs = end_time - time.monotonic()
+
+                            if remaining_secs <= 0:
+                                return
+
+                            shard.new_event_condition.wait(remaining_secs)
+
+                    event = shard.events.pop_next()
+                    shard.not_full_condition.notify_all()
+
+                    if self._check_event_expiration(event):
+                        self._drop_event(shard, event)
+                        dropped_events.append(event)
+                        continue
+
+                    return event
+        finally:
+            for i in dropped_events:
+                self._process_dropped_event(i)
+
+    def add_chat_event(self, shard_index: int, event: EventInfo) -> bool:
+        shard = self._shards[shard_index]
+        dropped_event = None
+
+        with shard.lock:
+            if event.chat_id not in shard.processing_chat_ids:
+                shard.processing_chat_ids.add(event.chat_id)
+
+                return False
+
+            chat_events = shard.chat_queues.get(event.chat_id)
+
+            if chat_events is None:
+                chat_events = shard.chat_queues[event.chat_id] = deque()
+            elif (
+                (self.max_chat_size is not None)
+                and (self.overflow_policy is not OverflowPolicy.BLOCK)
+                and (len(chat_events) >= self.max_chat_size)
+            ):
+                dropped_event = self._pop_dropped_event(chat_events, event)
+                self._drop_event(shard, dropped_event)
+
+            if dropped_event is not event:
+                chat_events.append(event)
+
+        if dropped_event is not None:
+            self._process_dropped_event(dropped_event)
+
+        return True
+
+    def set_chat_event_completion(self, shard_index: int, chat_id: int) -> Optional[EventInfo]:
+        shard = self._shards[shard_index]
+        dropped_events = []
+
+        try:
+            with shard.lock:
+                while True:
+                    event = self._complete_chat_event(shard, chat_id)
+
+                    if (event is None) or (not self._check_event_expiration(event)):
+                        return event
+
+                    self._drop_event(shard, event)
+                    dropped_events.append(event)
+        finally:
+            for i in dropped_events:
+                self._process_dropped_event(i)
+
+    def set_event_completion(self, shard_index: int, chat_id: Optional[int] = None) -> None:
+        shard = self._shards[shard_index]
+
+        with shard.all_events_processed_condition:
+            self._decrease_chat_size(shard, chat_id)
+            shard.unprocessed_events -= 1
+
+            if not shard.unprocessed_events:
+                shard.all_events_processed_condition.notify_all()
+
+    def wait_events(self) -> None:
+        while True:
+            for i in self._shards:
+                with i.all_events_processed_condition:
+                    while i.unprocessed_events:
+                        i.all_events_processed_condition.wait()
+
+            if not any(i.unprocessed_events for i in self._shards):
+                return
+
+    def _get_worker_shard_index(self) -> int:
+        # Shards without workers come first, then the ones with the most pending events per worker.
+        return min(
+            range(len(self._shards)),
+            key=lambda x: (
+                self._shards[x].workers > 0,
+                -len(self._shards[x].events) / (self._shards[x].workers + 1),
+                self._shards[x].workers
+            )
+        )
+
+    def _get_shard_index(self, chat_id: Optional[int]) -> int:
+        if len(self._shards) == 1:
+            return 0
+
+        if chat_id is None:
+            return next(self._shard_numbers) % len(self._shards)
+
+        return hash(chat_id) % len(self._shards)
+
+    def _pop_dropped_event(
+        self,
+        events: Union[EventLanes, deque[EventInfo]],
+        new_event: EventInfo
+    ) -> EventInfo:
+        if self.overflow_policy is OverflowPolicy.DROP_NEWEST:
+            return new_event
+        elif self.overflow_policy is OverflowPolicy.DROP_OLDEST:
+            return events.popleft()
+
+        dropped_event = min(events, key=lambda x: (self._get_event_priority(x), x.time))
+
+        if self._get_event_priority(new_event) < self._get_event_priority(dropped_event):
+            return new_event
+
+        events.remove(dropped_event)
+
+        return dropped_event
+
+    def _get_event_priority(self, event: EventInfo) -> int:
+        return self.event_type_priorities.get(event.event_type, 0)
+
+    def _check_chat_fullness(self, shard: _Shard, event: EventInfo) -> bool:
+        # The event being processed is counted too, so the chat queue itself
+        # can hold up to the maximum chat size.
+        return (
+            (self.max_chat_size is not None)
+            and (event.chat_id is not None)
+            and (shard.chat_sizes.get(event.chat_id, 0) > self.max_chat_size)
+        )
+
+    def _check_event_expiration(self, event: EventInfo) -> bool:
+        return (
+            (self.max_event_age_secs is not None)
+            and (time.monotonic() - event.time > self.max_event_age_secs)
+        )
+
+    def _complete_chat_event(self, shard: _Shard, chat_id: int) -> Optional[EventInfo]:
+        chat_events = shard.chat_queues.get(chat_id)
+
+        if chat_events is None:
+            shard.processing_chat_ids.remove(chat_id)
+
+            return
+
+        next_event = chat_events.popleft()
+        next_event.from_chat_queue = True
+
+        if not chat_events:
+            del shard.chat_queues[chat_id]
+
+        return next_event
+
+    def _decrease_chat_size(self, shard: _Shard, chat_id: Optional[int]) -> None:
+        if chat_id is None:
+            return
+
+        chat_size = shard.chat_sizes[chat_id] - 1
+
+        if chat_size:
+            shard.chat_sizes[chat_id] = chat_size
+        else:
+            del shard.chat_sizes[chat_id]
+
+        shard.not_full_condition.notify_all()
+
+    def _drop_event(self, shard: _Shard, event: EventInfo) -> None:
+        self._decrease_chat_size(shard, event.chat_id)
+        event.processing_status = ProcessingStatus.DROPPED
+        shard.dropped_events += 1
+        shard.unprocessed_events -= 1
+
+        if not shard.unprocessed_events:
+            shard.all_events_processed_condition.notify_all()
+
+    def _process_dropped_event(self, event: EventInfo) -> None:
+        if self._drop_callback is not None:
+            self._drop_callback(event)
+
+
+def _check_shard_fullness(shard: _Shard) -> bool:
+    return (shard.max_size is not None) and (len(shard.events) >= shard.max_size)
@@ -249,7 +249,7 @@ def _get_event_attribute(
     *,
     strictly: bool
 ) -> Any:
-    if type(event) in types:
+    if isinstance(event, tuple(types)):
         return getattr(event, attribute)
     elif strictly:
         raise InvalidEventError(f"No {name} in event" + " {event!r}!", event=event)
@@ -4,6 +4,9 @@ from telebox.bot.types.types.message import Message
 from telebox.dispatcher.enums.event_type import EventType
 
 
+MAX_MEDIA_GROUP_SIZE = 10
+
+
 class MediaGroupContainer:
 
     def __init__(self, event: Message, event_type: EventType):
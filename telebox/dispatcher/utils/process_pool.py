@@ -0,0 +1,183 @@
+import logging
+from typing import Optional, Union, Callable, Any
+from multiprocessing.connection import Connection
+from threading import Lock
+import itertools
+import multiprocessing
+import os
+import signal
+import sys
+import threading
+import time
+
+from telebox.utils.serialization import get_serialized_bytes
+
+
+logger = logging.getLogger(__name__)
+_STOP_CONTENT = b""
+
+
+class _Worker:
+
+    def __init__(self, process: multiprocessing.Process, connection: Connection):
+        self.process = process
+        self.connection = connection
+        self.lock = Lock()
+
+
+class UpdateProcessPool:
+
+    def __init__(
+        self,
+        processes: int,
+        target: Callable[[Connection], None],
+        *,
+        restart_delay_secs: Union[int, float] = 1
+    ):
+        if processes < 2:
+            raise ValueError("Number of processes cannot be less than two!")
+
+        if restart_delay_secs < 0:
+            raise ValueError("Restart delay seconds cannot be negative!")
+
+        self._processes = processes
+        self._target = target
+        self._restart_delay_secs = restart_delay_secs
+        self._context = multiprocessing.get_context("fork")
+        self._workers: list[_Worker] = []
+        self._worker_numbers = itertools.count()
+
+    def start(self) -> None:
+        if threading.active_count() > 1:
+            logger.warning(
+                "Update processes are forked while other threads are running, "
+                "locks held by these threads can stay locked in the processes!"
+            )
+
+        self._workers = [self._start_worker(i) for i in range(self._processes)]
+        logger.info("Update process pool started with %r processes.", self._processes)
+
+    def put(self, data: dict[str, Any], content: Optional[bytes] = None) -> None:
+        chat_id = _get_raw_update_chat_id(data)
+
+        if chat_id is None:
+            index = next(self._worker_numbers) % self._processes
+        else:
+            index = hash(chat_id) % self._processes
+
+        if content is None:
+            content = get_serialized_bytes(data)
+
+        worker = self._workers[index]
+
+        with worker.lock:
+            if not worker.process.is_alive():
+                self._restart_worker(worker, index)
+
+            try:
+                worker.connection.send_bytes(content)
+            except OSError:
+                logger.error(
+                    "Update process %r is unavailable, update dropped: %r.",
+                    worker.process.pid,
+                    data
+                )
+
+    def stop(self) -> None:
+        for i in self._workers:
+            with i.lock:
+                try:
+                    i.connection.send_bytes(_STOP_CONTENT)
+                except OSError:
+                    pass
+
+        for i in self._workers:
+            i.process.join()
+            i.connection.close()
+
+        self._workers = []
+        logger.info("Update process pool stopped.")
+
+    def _start_worker(self, index: int) -> _Worker:
+        reader, writer = self._context.Pipe(duplex=False)
+        process = self._context.Process(
+            target=_run_worker_supervision,
+            args=(self._target, reader, self._restart_delay_secs),
+            name=f"telebox-worker-{index}",
+            daemon=True
+        )
+        process.start()
+        reader.close()
+        logger.debug("Update process %r started.", process.pid)
+
+        return _Worker(process, writer)
+
+    def _restart_worker(self, worker: _Worker, index: int) -> None:
+        # Updates left in the pipe of a dead supervisor are lost with it.
+        logger.error(
+            "Update process supervisor %r exited with code %r, restarting it...",
+            worker.process.pid,
+            worker.process.exitcode
+        )
+        worker.connection.close()
+        new_worker = self._start_worker(index)
+        worker.process = new_worker.process
+        worker.connection = new_worker.connection
+
+
+def _run_worker_supervision(
+    target: Callable[[Connection], None],
+    connection: Connection,
+    restart_delay_secs: Union[int, float]
+) -> None:
+    # The supervising process has no threads, so forking it is safe. Restarted
+    # workers read the same pipe, so unread updates keep their order.
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+
+    while True:
+        pid = os.fork()
+
+        if not pid:
+            _run_worker(target, connection)
+
+        _, status = os.waitpid(pid, 0)
+        exit_code = os.waitstatus_to_exitcode(status)
+
+        if not exit_code:
+            return
+
+        logger.error("Update process %r exited with code %r, restarting it...", pid, exit_code)
+        time.sleep(restart_delay_secs)
+
+
+def _run_worker(target: Callable[[Connection], None], connection: Connection) -> None:
+    exit_code = 0
+
+    # noinspection PyBroadException
+    try:
+        target(connection)
+    except BaseException:
+        logger.exception("An error occurred in update process %r!", os.getpid())
+        exit_code = 1
+    finally:
+        sys.stdout.flush()
+        sys.stderr.flush()
+        os._exit(exit_code)
+
+
+def _get_raw_update_chat_id(data: dict[str, Any]) -> Optional[int]:
+    for name, value in data.items():
+        if (name == "update_id") or not isinstance(value, dict):
+            continue
+
+        chat = value.get("chat") or (value.get("message") or {}).get("chat")
+
+        if chat is not None:
+            return chat.get("id")
+
+        user = value.get("from") or value.get("user")
+
+        if user is not None:
+            return user.get("id")
+
+    return None
@@ -0,0 +1,31 @@
+from typing import Optional
+from threading import Condition
+
+
+class UpdateOffset:
+
+    def __init__(self):
+        self._update_id: Optional[int] = None
+        self._is_closed = False
+        self._condition = Condition()
+
+    @property
+    def value(self) -> Optional[int]:
+        update_id = self._update_id
+
+        return update_id + 1 if update_id is not None else None
+
+    def confirm(self, update_id: int) -> None:
+        with self._condition:
+            self._update_id = update_id
+            self._condition.notify_all()
+
+    def wait_change(self, value: Optional[int]) -> None:
+        with self._condition:
+            while (self.value == value) and (not self._is_closed):
+                self._condition.wait()
+
+    def close(self) -> None:
+        with self._condition:
+            self._is_closed = True
+            self._condition.notify_all()
@@ -0,0 +1,190 @@
+import logging
+from typing import Optional, Callable, Iterable, Any
+from http import HTTPStatus
+from queue import Queue, Full
+from threading import Thread, RLock
+import asyncio
+
+
+logger = logging.getLogger(__name__)
+MAX_CONTENT_LENGTH = 1024 * 1024
+_SECRET_TOKEN_HEADER = "X-Telegram-Bot-Api-Secret-Token"
+
+
+class WebhookApp:
+
+    def __init__(
+        self,
+        update_loader: Callable[[bytes], Any],
+        update_processor: Callable[[Any], None],
+        *,
+        secret_token: Optional[str] = None,
+        max_queue_size: int = 1000,
+        parser_threads: int = 1,
+        stop_callback: Optional[Callable[[], None]] = None
+    ):
+        if max_queue_size < 1:
+            raise ValueError("Maximum queue size cannot be less than one!")
+
+        if parser_threads < 1:
+            raise ValueError("Number of parser threads cannot be less than one!")
+
+        self._update_loader = update_loader
+        self._update_processor = update_processor
+        self._secret_token = secret_token
+        self._updates: Queue[Optional[bytes]] = Queue(max_queue_size)
+        self._parser_threads = parser_threads
+        self._stop_callback = stop_callback
+        self._threads: list[Thread] = []
+        self._lock = RLock()
+
+    def __call__(self, environ: dict[str, Any], start_response: Callable) -> Iterable[bytes]:
+        if environ["REQUEST_METHOD"] != "POST":
+            status = HTTPStatus.METHOD_NOT_ALLOWED
+        elif (
+            (self._secret_token is not None)
+            and (environ.get("HTTP_X_TELEGRAM_BOT_API_SECRET_TOKEN") != self._secret_token)
+        ):
+            status = HTTPStatus.FORBIDDEN
+        else:
+            content_length = environ.get("CONTENT_LENGTH")
+
+            if not (content_length or "").isdigit():
+                status = HTTPStatus.LENGTH_REQUIRED
+            elif int(content_length) > MAX_CONTENT_LENGTH:
+                status = HTTPStatus.REQUEST_ENTITY_TOO_LARGE
+            else:
+                status = self._add_update(
+                    environ["wsgi.input"].read(int(content_length))
+                )
+
+        start_response(f"{status.value} {status.phrase}", [("Content-Length", "0")])
+
+        return [b""]
+
+    async def asgi(
+        self,
+        scope: dict[str, Any],
+        receive: Callable,
+        send: Callable
+    ) -> None:
+        if scope["type"] == "lifespan":
+            await self._process_lifespan(receive, send)
+            return
+        elif scope["type"] != "http":
+            return
+
+        headers = {
+            name.decode("latin-1").lower(): value.decode("latin-1")
+            for name, value in scope["headers"]
+        }
+
+        if scope["method"] != "POST":
+            status = HTTPStatus.METHOD_NOT_ALLOWED
+        elif (
+            (self._secret_token is not None)
+            and (headers.get(_SECRET_TOKEN_HEADER.lower()) != self._secret_token)
+        ):
+            status = HTTPStatus.FORBIDDEN
+        else:
+            chunks = []
+            size = 0
+            more_body = True
+
+            while more_body:
+                message = await receive()
+                chunk = message.get("body", b"")
+                size += len(chunk)
+                more_body = message.get("more_body", False)
+
+                if size > MAX_CONTENT_LENGTH:
+                    break
+
+                chunks.append(chunk)
+
+            if size > MAX_CONTENT_LENGTH:
+                status = HTTPStatus.REQUEST_ENTITY_TOO_LARGE
+            else:
+                status = self._add_update(b"".join(chunks))
+
+        await send({
+            "type": "http.response.start",
+            "status": status.value,
+            "headers": [(b"content-length", b"0")]
+        })
+        await send({
+            "type": "http.response.body",
+            "body": b""
+        })
+
+    def start(self) -> None:
+        with self._lock:
+            if self._threads:
+                raise RuntimeError("Webhook app is already started!")
+
+            self._threads = [
+                Thread(target=self._process_updates, daemon=True)
+                for _ in range(self._parser_threads)
+            ]
+
+            for i in self._threads:
+                i.start()
+
+        logger.info("Webhook app started.")
+
+    def stop(self) -> None:
+        with self._lock:
+            threads = self._threads
+            self._threads = []
+
+        if not threads:
+            return
+
+        logger.info("Webhook app stopping...")
+
+        for _ in threads:
+            self._updates.put(None)
+
+        for i in threads:
+            i.join()
+
+        if self._stop_callback is not None:
+            self._stop_callback()
+
+        logger.info("Webhook app stopped.")
+
+    def _add_update(self, content: bytes) -> HTTPStatus:
+        try:
+            self._updates.put_nowait(content)
+        except Full:
+            logger.warning("Webhook update queue is full, update rejected!")
+
+            return HTTPStatus.SERVICE_UNAVAILABLE
+
+        return HTTPStatus.OK
+
+    def _process_updates(self) -> None:
+        while True:
+            content = self._updates.get()
+
+            if content is None:
+                return
+
+            # noinspection PyBroadException
+            try:
+                self._update_processor(
+                    self._update_loader(content)
+                )
+            except Exception:
+                logger.exception("An error occurred while parsing a webhook update!")
+
+    async def _process_lifespan(self, receive: Callable, send: Callable) -> None:
+        while True:
+            message = await receive()
+
+            if message["type"] == "lifespan.startup":
+                await send({"type": "lifespan.startup.complete"})
+            elif message["type"] == "lifespan.shutdown":
+                await asyncio.get_running_loop().run_in_executor(None, self.stop)
+                await send({"type": "lifespan.shutdown.complete"})
+                return
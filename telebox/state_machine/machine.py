@@ -26,9 +26,11 @@ class StateMachine:
         self,
         initial_state: State,
         states: Iterable[State],
-        storage: AbstractStateStorage
+        storage: AbstractStateStorage,
+        *,
+        max_state_depth: Optional[int] = None
     ):
-        self._state_manager = StateManager(initial_state, storage)
+        self._state_manager = StateManager(initial_state, storage, max_depth=max_state_depth)
         self.add_states(states)
         self._transition_scheme = TransitionScheme()
         self.context = Context(self)
@@ -89,7 +91,7 @@ class StateMachine:
     def get_state(self, *, chat_id: int, user_id: Optional[int] = None) -> State:
         magazine = self._state_manager.load_magazine(chat_id=chat_id, user_id=user_id)
 
-        return self._state_manager.get_state(magazine.current_state)
+        return self._state_manager.get_state_by_id(magazine.current_state_id)
 
     def set_next_state(
         self,
@@ -102,7 +104,7 @@ class StateMachine:
         user_id: Optional[int] = None
     ) -> None:
         magazine = self._state_manager.load_magazine(chat_id=chat_id, user_id=user_id)
-        current_state = self._state_manager.get_state(magazine.current_state)
+        current_state = self._state_manager.get_state_by_id(magazine.current_state_id)
 
         try:
             next_state = self._transition_scheme.get_destination_state(
@@ -138,16 +140,16 @@ class StateMachine:
         user_id: Optional[int] = None
     ) -> None:
         magazine = self._state_manager.load_magazine(chat_id=chat_id, user_id=user_id)
-        current_state = self._state_manager.get_state(magazine.current_state)
+        current_state = self._state_manager.get_state_by_id(magazine.current_state_id)
 
-        if magazine.previous_state is None:
+        if magazine.previous_state_id is None:
             raise PreviousStateNotFoundError(
                 "A previous state cannot be found because the current "
                 "state is the initial state!",
                 current_state=current_state
             )
 
-        previous_state = self._state_manager.get_state(magazine.previous_state)
+        previous_state = self._state_manager.get_state_by_id(magazine.previous_state_id)
         self._process_transition(
             event=event,
             magazine=magazine,
@@ -168,7 +170,7 @@ class StateMachine:
         user_id: Optional[int] = None
     ) -> None:
         magazine = self._state_manager.load_magazine(chat_id=chat_id, user_id=user_id)
-        current_state = self._state_manager.get_state(magazine.current_state)
+        current_state = self._state_manager.get_state_by_id(magazine.current_state_id)
         self._process_transition(
             event=event,
             magazine=magazine,
@@ -208,5 +210,5 @@ class StateMachine:
     ) -> None:
         source_state.process_exit(chat_id, user_id, event, data)
         destination_state.process_enter(chat_id, user_id, event, data)
-        magazine.set_state(str(destination_state))
+        magazine.set_state_id(destination_state.id)
         self._state_manager.save_magazine(magazine, chat_id=chat_id, user_id=user_id)
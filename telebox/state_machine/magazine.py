@@ -1,35 +1,70 @@
-from typing import Optional
+from typing import Optional, Iterator
+from array import array
+
+from telebox.state_machine.registry import state_registry
 
 
 class StateMagazine:
 
-    def __init__(self, states: list[str]):
-        if not states:
+    def __init__(self, state_ids: array, *, max_depth: Optional[int] = None):
+        if not state_ids:
             raise ValueError("State magazine cannot be empty!")
 
-        self._states = states[:]
+        if (max_depth is not None) and (max_depth < 2):
+            raise ValueError("Maximum magazine depth cannot be less than two!")
+
+        self._state_ids = state_ids
+        self._max_depth = max_depth
+
+        if (max_depth is not None) and (len(state_ids) > max_depth):
+            del state_ids[1:len(state_ids) - max_depth + 1]
+
+    def __iter__(self) -> Iterator[str]:
+        return map(state_registry.get_name, self._state_ids)
 
-    def __iter__(self):
-        return iter(self._states)
+    def __len__(self) -> int:
+        return len(self._state_ids)
 
     def __repr__(self):
-        return f"{type(self).__name__}({self._states!r})"
+        return f"{type(self).__name__}({list(self)!r})"
+
+    @property
+    def state_ids(self) -> array:
+        return self._state_ids
 
     @property
     def current_state(self) -> str:
-        return self._states[-1]
+        return state_registry.get_name(self._state_ids[-1])
+
+    @property
+    def current_state_id(self) -> int:
+        return self._state_ids[-1]
 
     @property
     def previous_state(self) -> Optional[str]:
         try:
-            return self._states[-2]
+            return state_registry.get_name(self._state_ids[-2])
+        except IndexError:
+            return None
+
+    @property
+    def previous_state_id(self) -> Optional[int]:
+        try:
+            return self._state_ids[-2]
         except IndexError:
             return None
 
     def set_state(self, state: str) -> None:
+        self.set_state_id(state_registry.get_id(state))
+
+    def set_state_id(self, state_id: int) -> None:
         try:
-            index = self._states.index(state)
+            index = self._state_ids.index(state_id)
         except ValueError:
-            self._states.append(state)
+            self._state_ids.append(state_id)
+
+            if (self._max_depth is not None) and (len(self._state_ids) > self._max_depth):
+                # The initial state is kept so that the history can always return to it.
+                del self._state_ids[1]
         else:
-            del self._states[index + 1:]
+            del self._state_ids[index + 1:]
@@ -1,8 +1,10 @@
 from typing import Optional
+from array import array
 
 from telebox.state_machine.state import State
 from telebox.state_machine.storages.storage import AbstractStateStorage
 from telebox.state_machine.magazine import StateMagazine
+from telebox.state_machine.registry import state_registry
 from telebox.state_machine.errors import (
     StateNameExistsError,
     StateNotFoundError
@@ -11,10 +13,23 @@ from telebox.state_machine.errors import (
 
 class StateManager:
 
-    def __init__(self, initial_state: State, storage: AbstractStateStorage):
+    def __init__(
+        self,
+        initial_state: State,
+        storage: AbstractStateStorage,
+        *,
+        max_depth: Optional[int] = None
+    ):
+        if (max_depth is not None) and (max_depth < 2):
+            raise ValueError("Maximum magazine depth cannot be less than two!")
+
         self._initial_state = initial_state
+        self._initial_state_id = initial_state.id
         self._storage = storage
+        self._max_depth = max_depth
         self._states: dict[str, State] = {}
+        self._state_ids: dict[int, State] = {}
+        self._state_set: set[State] = set()
         self.add_state(initial_state)
 
     @property
@@ -23,10 +38,10 @@ class StateManager:
 
     @property
     def states(self) -> set[State]:
-        return set(self._states.values())
+        return self._state_set.copy()
 
     def add_state(self, state: State) -> None:
-        if state not in self.states:
+        if state not in self._state_set:
             if state.name in self._states:
                 raise StateNameExistsError(
                     "State name {state_name!r} already exists!",
@@ -34,9 +49,11 @@ class StateManager:
                 )
 
             self._states[state.name] = state
+            self._state_ids[state.id] = state
+            self._state_set.add(state)
 
     def check_state(self, state: State) -> bool:
-        return state in self.states
+        return state in self._state_set
 
     def get_state(self, name: str) -> State:
         try:
@@ -47,18 +64,27 @@ class StateManager:
                 state_name=name
             ) from None
 
+    def get_state_by_id(self, state_id: int) -> State:
+        try:
+            return self._state_ids[state_id]
+        except KeyError:
+            raise StateNotFoundError(
+                "State with name {state_name!r} not found!",
+                state_name=state_registry.get_name(state_id)
+            ) from None
+
     def load_magazine(
         self,
         *,
         chat_id: int,
         user_id: Optional[int] = None
     ) -> StateMagazine:
-        states = self._storage.load_states(chat_id=chat_id, user_id=user_id)
+        state_ids = self._storage.load_state_ids(chat_id=chat_id, user_id=user_id)
 
-        if not states:
-            states = [str(self._initial_state)]
+        if not state_ids:
+            state_ids = array("I", (self._initial_state_id,))
 
-        return StateMagazine(states)
+        return StateMagazine(state_ids, max_depth=self._max_depth)
 
     def save_magazine(
         self,
@@ -67,4 +93,4 @@ class StateManager:
         chat_id: int,
         user_id: Optional[int] = None
     ) -> None:
-        self._storage.save_states(list(magazine), chat_id=chat_id, user_id=user_id)
+        self._storage.save_state_ids(magazine.state_ids, chat_id=chat_id, user_id=user_id)
@@ -0,0 +1,33 @@
+from threading import Lock
+
+
+class StateRegistry:
+    """Interns state names as IDs that are never released, so state names must form a finite set."""
+
+    def __init__(self):
+        self._ids: dict[str, int] = {}
+        self._names: list[str] = []
+        self._lock = Lock()
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+    def get_id(self, name: str) -> int:
+        try:
+            return self._ids[name]
+        except KeyError:
+            with self._lock:
+                id_ = self._ids.get(name)
+
+                if id_ is None:
+                    id_ = len(self._names)
+                    self._names.append(name)
+                    self._ids[name] = id_
+
+                return id_
+
+    def get_name(self, id_: int) -> str:
+        return self._names[id_]
+
+
+state_registry = StateRegistry()
@@ -1,10 +1,13 @@
 from typing import Optional
 
+from telebox.state_machine.registry import state_registry
+
 
 class State:
 
     def __init__(self, name: Optional[str] = None):
         self._name = name or type(self).__name__
+        self._id = state_registry.get_id(self._name)
 
     def __repr__(self):
         return f"{type(self).__name__}(name={self.name!r})"
@@ -16,6 +19,10 @@ class State:
     def name(self) -> str:
         return self._name
 
+    @property
+    def id(self) -> int:
+        return self._id
+
     def process_enter(self, chat_id, user_id, event, data) -> None:
         pass
 
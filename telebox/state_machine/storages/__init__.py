@@ -1,9 +1,22 @@
 from .storage import AbstractStateStorage
-from .storages import MemoryStateStorage, JSONStateStorage
+from .storages import (
+    MemoryStateStorage,
+    JSONStateStorage,
+    JSONLogStateStorage,
+    SQLiteStateStorage,
+    CachedStateStorage,
+    StateCacheStats,
+    RedisStateStorage
+)
 
 
 __all__ = [
     "AbstractStateStorage",
     "MemoryStateStorage",
-    "JSONStateStorage"
+    "JSONStateStorage",
+    "JSONLogStateStorage",
+    "SQLiteStateStorage",
+    "CachedStateStorage",
+    "StateCacheStats",
+    "RedisStateStorage"
 ]
@@ -1,5 +1,8 @@
 from abc import ABC, abstractmethod
 from typing import Optional
+from array import array
+
+from telebox.state_machine.registry import state_registry
 
 
 class AbstractStateStorage(ABC):
@@ -17,3 +20,22 @@ class AbstractStateStorage(ABC):
     @abstractmethod
     def load_states(self, *, chat_id: int, user_id: Optional[int] = None) -> list[str]:
         pass
+
+    def save_state_ids(
+        self,
+        state_ids: array,
+        *,
+        chat_id: int,
+        user_id: Optional[int] = None
+    ) -> None:
+        self.save_states(
+            list(map(state_registry.get_name, state_ids)),
+            chat_id=chat_id,
+            user_id=user_id
+        )
+
+    def load_state_ids(self, *, chat_id: int, user_id: Optional[int] = None) -> array:
+        return array(
+            "I",
+            map(state_registry.get_id, self.load_states(chat_id=chat_id, user_id=user_id))
+        )
@@ -1,8 +1,17 @@
 from .memory import MemoryStateStorage
 from .json import JSONStateStorage
+from .json_log import JSONLogStateStorage
+from .sqlite import SQLiteStateStorage
+from .cached import CachedStateStorage, StateCacheStats
+from .redis import RedisStateStorage
 
 
 __all__ = [
     "MemoryStateStorage",
-    "JSONStateStorage"
+    "JSONStateStorage",
+    "JSONLogStateStorage",
+    "SQLiteStateStorage",
+    "CachedStateStorage",
+    "StateCacheStats",
+    "RedisStateStorage"
 ]
@@ -0,0 +1,234 @@
+import logging
+from dataclasses import dataclass
+from typing import Optional, Union
+from collections import OrderedDict
+from threading import Thread, Lock, Event
+import time
+
+from telebox.state_machine.storages.storage import AbstractStateStorage
+
+
+logger = logging.getLogger(__name__)
+StateKey = tuple[int, Optional[int]]
+_KEY_LOCKS = 64
+
+
+@dataclass(frozen=True)
+class StateCacheStats:
+    size: int
+    hits: int
+    misses: int
+    evictions: int
+    dirty_states: int
+
+
+class _Entry:
+
+    def __init__(self, states: tuple[str, ...], expiration_time: Optional[float]):
+        self.states = states
+        self.expiration_time = expiration_time
+
+
+class _PendingLoad:
+
+    def __init__(self):
+        self.is_stale = False
+
+
+class CachedStateStorage(AbstractStateStorage):
+
+    def __init__(
+        self,
+        storage: AbstractStateStorage,
+        *,
+        max_size: int = 10000,
+        ttl_secs: Union[int, float, None] = None,
+        with_write_behind: bool = False,
+        write_behind_delay_secs: Union[int, float] = 1
+    ):
+        if max_size < 1:
+            raise ValueError("Maximum cache size cannot be less than one!")
+
+        if (ttl_secs is not None) and (ttl_secs <= 0):
+            raise ValueError("TTL seconds must be greater than zero!")
+
+        if write_behind_delay_secs <= 0:
+            raise ValueError("Write-behind delay seconds must be greater than zero!")
+
+        self.storage = storage
+        self._max_size = max_size
+        self._ttl_secs = ttl_secs
+        self._write_behind_delay_secs = write_behind_delay_secs
+        self._entries: OrderedDict[StateKey, _Entry] = OrderedDict()
+        self._pending_loads: dict[StateKey, list[_PendingLoad]] = {}
+        self._dirty_states: dict[StateKey, tuple[str, ...]] = {}
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._lock = Lock()
+        self._key_locks = tuple(Lock() for _ in range(_KEY_LOCKS))
+        self._flush_lock = Lock()
+        self._closing_event = Event()
+
+        if with_write_behind:
+            self._flush_thread: Optional[Thread] = Thread(target=self._run_flushing, daemon=True)
+            self._flush_thread.start()
+        else:
+            self._flush_thread = None
+
+    @property
+    def hits(self) -> int:
+        return self._hits
+
+    @property
+    def misses(self) -> int:
+        return self._misses
+
+    def get_stats(self) -> StateCacheStats:
+        with self._lock:
+            return StateCacheStats(
+                size=len(self._entries),
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                dirty_states=len(self._dirty_states)
+            )
+
+    def save_states(
+        self,
+        states: list[str],
+        *,
+        chat_id: int,
+        user_id: Optional[int] = None
+    ) -> None:
+        key = (chat_id, user_id)
+        states = tuple(states)
+
+        if self._flush_thread is not None:
+            with self._lock:
+                self._set_entry(key, states)
+                self._dirty_states[key] = states
+
+            return
+
+        with self._get_key_lock(key):
+            try:
+                self.storage.save_states(list(states), chat_id=chat_id, user_id=user_id)
+            except BaseException:
+                self.invalidate(chat_id=chat_id, user_id=user_id)
+                raise
+
+            with self._lock:
+                self._set_entry(key, states)
+
+    def load_states(self, *, chat_id: int, user_id: Optional[int] = None) -> list[str]:
+        key = (chat_id, user_id)
+
+        with self._lock:
+            entry = self._entries.get(key)
+
+            if entry is not None:
+                if (entry.expiration_time is None) or (entry.expiration_time > time.monotonic()):
+                    self._entries.move_to_end(key)
+                    self._hits += 1
+
+                    return list(entry.states)
+
+                del self._entries[key]
+
+            self._misses += 1
+            states = self._dirty_states.get(key)
+
+            if states is not None:
+                self._set_entry(key, states)
+
+                return list(states)
+
+            pending_load = _PendingLoad()
+            self._pending_loads.setdefault(key, []).append(pending_load)
+
+        try:
+            states = tuple(
+                self.storage.load_states(chat_id=chat_id, user_id=user_id)
+            )
+        except BaseException:
+            with self._lock:
+                self._remove_pending_load(key, pending_load)
+
+            raise
+
+        with self._lock:
+            self._remove_pending_load(key, pending_load)
+
+            if not pending_load.is_stale:
+                self._set_entry(key, states)
+
+        return list(states)
+
+    def invalidate(self, *, chat_id: int, user_id: Optional[int] = None) -> None:
+        key = (chat_id, user_id)
+
+        with self._lock:
+            self._entries.pop(key, None)
+            self._set_pending_loads_stale(key)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+            for i in self._pending_loads:
+                self._set_pending_loads_stale(i)
+
+    def flush(self) -> None:
+        with self._flush_lock:
+            with self._lock:
+                dirty_states = dict(self._dirty_states)
+
+            for key, states in dirty_states.items():
+                chat_id, user_id = key
+                self.storage.save_states(list(states), chat_id=chat_id, user_id=user_id)
+
+                with self._lock:
+                    if self._dirty_states.get(key) is states:
+                        del self._dirty_states[key]
+
+    def close(self) -> None:
+        if self._flush_thread is not None:
+            self._closing_event.set()
+            self._flush_thread.join()
+            self._flush_thread = None
+            self.flush()
+
+    def _set_entry(self, key: StateKey, states: tuple[str, ...]) -> None:
+        self._entries[key] = _Entry(
+            states=states,
+            expiration_time=time.monotonic() + self._ttl_secs if self._ttl_secs is not None else None
+        )
+        self._entries.move_to_end(key)
+        self._set_pending_loads_stale(key)
+
+        while len(self._entries) > self._max_size:
+            self._entries.popitem(last=False)
+            self._evictions += 1
+
+    def _remove_pending_load(self, key: StateKey, pending_load: _PendingLoad) -> None:
+        pending_loads = self._pending_loads[key]
+        pending_loads.remove(pending_load)
+
+        if not pending_loads:
+            del self._pending_loads[key]
+
+    def _set_pending_loads_stale(self, key: StateKey) -> None:
+        for i in self._pending_loads.get(key, ()):
+            i.is_stale = True
+
+    def _get_key_lock(self, key: StateKey) -> Lock:
+        return self._key_locks[hash(key) % _KEY_LOCKS]
+
+    def _run_flushing(self) -> None:
+        while not self._closing_event.wait(self._write_behind_delay_secs):
+            # noinspection PyBroadException
+            try:
+                self.flush()
+            except Exception:
+                logger.exception("An error occurred while flushing cached states!")
@@ -0,0 +1,205 @@
+import logging
+from typing import Optional, Union, BinaryIO
+from pathlib import Path
+from threading import Thread, RLock, Event
+import contextlib
+import os
+
+from telebox.state_machine.storages.storage import AbstractStateStorage
+from telebox.utils.serialization import get_serialized_bytes, get_deserialized_data
+
+
+logger = logging.getLogger(__name__)
+StateKey = tuple[int, Optional[int]]
+
+
+class JSONLogStateStorage(AbstractStateStorage):
+
+    def __init__(
+        self,
+        path: Union[str, os.PathLike],
+        *,
+        with_fsync: bool = True,
+        compaction_min_records: int = 10000,
+        compaction_ratio: Union[int, float] = 2
+    ):
+        if compaction_min_records < 1:
+            raise ValueError("Minimum number of compaction records cannot be less than one!")
+
+        if compaction_ratio <= 0:
+            raise ValueError("Compaction ratio must be greater than zero!")
+
+        self._path = Path(path)
+        self._log_path = self._path.with_name(f"{self._path.name}.log")
+        self._compacting_log_path = self._path.with_name(f"{self._path.name}.log.compacting")
+        self._with_fsync = with_fsync
+        self._compaction_min_records = compaction_min_records
+        self._compaction_ratio = compaction_ratio
+        self._states: dict[StateKey, list[str]] = {}
+        self._log_records = 0
+        self._lock = RLock()
+        self._compaction_lock = RLock()
+        self._compaction_event = Event()
+        self._closing_event = Event()
+        self._load()
+        self._log_file: Optional[BinaryIO] = self._log_path.open("ab")
+        self._compaction_thread = Thread(target=self._run_compaction, daemon=True)
+        self._compaction_thread.start()
+
+    def save_states(
+        self,
+        states: list[str],
+        *,
+        chat_id: int,
+        user_id: Optional[int] = None
+    ) -> None:
+        record = get_serialized_bytes([chat_id, user_id, states]) + b"\n"
+
+        with self._lock:
+            if self._log_file is None:
+                raise RuntimeError("Storage is closed!")
+
+            self._log_file.write(record)
+            self._log_file.flush()
+
+            if self._with_fsync:
+                os.fsync(self._log_file.fileno())
+
+            if states:
+                self._states[(chat_id, user_id)] = states[:]
+            else:
+                self._states.pop((chat_id, user_id), None)
+
+            self._log_records += 1
+
+            if (
+                (self._log_records >= self._compaction_min_records)
+                and (self._log_records >= len(self._states) * self._compaction_ratio)
+            ):
+                self._compaction_event.set()
+
+    def load_states(self, *, chat_id: int, user_id: Optional[int] = None) -> list[str]:
+        with self._lock:
+            states = self._states.get((chat_id, user_id))
+
+        return states[:] if states is not None else []
+
+    def compact(self) -> None:
+        with self._compaction_lock:
+            with self._lock:
+                if self._log_file is None:
+                    raise RuntimeError("Storage is closed!")
+
+                states = dict(self._states)
+                self._log_file.close()
+
+                if self._compacting_log_path.exists():
+                    # The previous compaction did not finish, so its records have to be kept.
+                    with self._compacting_log_path.open("ab") as file:
+                        file.write(self._log_path.read_bytes())
+
+                    self._log_path.unlink()
+                else:
+                    os.replace(self._log_path, self._compacting_log_path)
+
+                self._log_file = self._log_path.open("ab")
+                self._log_records = 0
+
+            stored_states: dict[str, dict[str, list[str]]] = {}
+
+            for (chat_id, user_id), chat_states in states.items():
+                stored_states.setdefault(str(chat_id), {})[str(user_id)] = chat_states
+
+            temp_path = self._path.with_name(f"{self._path.name}.tmp")
+
+            with temp_path.open("wb") as file:
+                file.write(
+                    get_serialized_bytes(stored_states)
+                )
+                file.flush()
+                os.fsync(file.fileno())
+
+            os.replace(temp_path, self._path)
+            _sync_directory(self._path.parent)
+            self._compacting_log_path.unlink()
+
+        logger.debug("State storage %r compacted.", str(self._path))
+
+    def close(self) -> None:
+        self._closing_event.set()
+        self._compaction_event.set()
+        self._compaction_thread.join()
+
+        with self._lock:
+            if self._log_file is not None:
+                self._log_file.close()
+                self._log_file = None
+
+    def _load(self) -> None:
+        with contextlib.suppress(FileNotFoundError):
+            stored_states = get_deserialized_data(
+                self._path.read_bytes()
+            )
+
+            for chat_id, user_states in stored_states.items():
+                for user_id, states in user_states.items():
+                    if states:
+                        self._states[(int(chat_id), _get_user_id(user_id))] = states
+
+        for i in (self._compacting_log_path, self._log_path):
+            with contextlib.suppress(FileNotFoundError):
+                with i.open("rb+") as file:
+                    size = 0
+
+                    for line in file:
+                        if not line.endswith(b"\n"):
+                            # The last write was interrupted, so new records must not be appended to it.
+                            logger.warning("Incomplete record removed from %r: %r.", str(i), line)
+                            file.truncate(size)
+                            break
+
+                        size += len(line)
+
+                        # noinspection PyBroadException
+                        try:
+                            chat_id, user_id, states = get_deserialized_data(line)
+                        except Exception:
+                            logger.warning("Damaged record skipped in %r: %r.", str(i), line)
+                            continue
+
+                        if states:
+                            self._states[(chat_id, user_id)] = states
+                        else:
+                            self._states.pop((chat_id, user_id), None)
+
+                        self._log_records += 1
+
+    def _run_compaction(self) -> None:
+        while True:
+            self._compaction_event.wait()
+            self._compaction_event.clear()
+
+            if self._closing_event.is_set():
+                return
+
+            # noinspection PyBroadException
+            try:
+                self.compact()
+            except Exception:
+                logger.exception("An error occurred while compacting state storage %r!", str(self._path))
+
+
+def _get_user_id(user_id: str) -> Optional[int]:
+    return int(user_id) if user_id != "None" else None
+
+
+def _sync_directory(path: Path) -> None:
+    if not hasattr(os, "O_DIRECTORY"):
+        return
+
+    descriptor = os.open(path, os.O_RDONLY | os.O_DIRECTORY)
+
+    try:
+        os.fsync(descriptor)
+    finally:
+        os.close(descriptor)
@@ -1,21 +1,17 @@
 from typing import Optional
+from array import array
 
 from telebox.state_machine.storages.storage import AbstractStateStorage
+from telebox.state_machine.registry import state_registry
 
 
-StateDict = dict[
-    int,
-    dict[
-        int,
-        list[str]
-    ]
-]
+StateKey = tuple[int, Optional[int]]
 
 
 class MemoryStateStorage(AbstractStateStorage):
 
     def __init__(self):
-        self._states: StateDict = {}
+        self._states: dict[StateKey, bytes] = {}
 
     def save_states(
         self,
@@ -24,15 +20,32 @@ class MemoryStateStorage(AbstractStateStorage):
         chat_id: int,
         user_id: Optional[int] = None
     ) -> None:
-        try:
-            self._states[chat_id][user_id] = states[:]
-        except KeyError:
-            self._states[chat_id] = {
-                user_id: states[:]
-            }
+        self.save_state_ids(
+            array("I", map(state_registry.get_id, states)),
+            chat_id=chat_id,
+            user_id=user_id
+        )
 
     def load_states(self, *, chat_id: int, user_id: Optional[int] = None) -> list[str]:
+        return list(
+            map(state_registry.get_name, self.load_state_ids(chat_id=chat_id, user_id=user_id))
+        )
+
+    def save_state_ids(
+        self,
+        state_ids: array,
+        *,
+        chat_id: int,
+        user_id: Optional[int] = None
+    ) -> None:
+        if state_ids:
+            # State IDs are only valid within the process, so only this storage keeps them.
+            self._states[(chat_id, user_id)] = state_ids.tobytes()
+        else:
+            self._states.pop((chat_id, user_id), None)
+
+    def load_state_ids(self, *, chat_id: int, user_id: Optional[int] = None) -> array:
         try:
-            return self._states[chat_id][user_id][:]
+            return array("I", self._states[(chat_id, user_id)])
         except KeyError:
-            return []
+            return array("I")
@@ -0,0 +1,71 @@
+from typing import Optional, TYPE_CHECKING
+
+from telebox.state_machine.storages.storage import AbstractStateStorage
+if TYPE_CHECKING:
+    from redis import Redis
+
+
+class RedisStateStorage(AbstractStateStorage):
+
+    def __init__(
+        self,
+        client: Optional["Redis"] = None,
+        *,
+        url: str = "redis://localhost:6379/0",
+        key_prefix: str = "telebox:states",
+        ttl_secs: Optional[int] = None
+    ):
+        if (ttl_secs is not None) and (ttl_secs < 1):
+            raise ValueError("TTL seconds cannot be less than one!")
+
+        self._owns_client = client is None
+        self.client = client if client is not None else _get_client(url)
+        self._key_prefix = key_prefix
+        self._ttl_secs = ttl_secs
+
+    def save_states(
+        self,
+        states: list[str],
+        *,
+        chat_id: int,
+        user_id: Optional[int] = None
+    ) -> None:
+        key = self._get_key(chat_id, user_id)
+        pipeline = self.client.pipeline(transaction=True)
+        pipeline.delete(key)
+
+        if states:
+            pipeline.rpush(key, *states)
+
+            if self._ttl_secs is not None:
+                pipeline.expire(key, self._ttl_secs)
+
+        pipeline.execute()
+
+    def load_states(self, *, chat_id: int, user_id: Optional[int] = None) -> list[str]:
+        return [
+            i.decode("UTF-8") if isinstance(i, bytes) else i
+            for i in self.client.lrange(self._get_key(chat_id, user_id), 0, -1)
+        ]
+
+    def close(self) -> None:
+        if self._owns_client:
+            self.client.close()
+
+    def _get_key(self, chat_id: int, user_id: Optional[int]) -> str:
+        if user_id is None:
+            return f"{self._key_prefix}:{chat_id}"
+
+        return f"{self._key_prefix}:{chat_id}:{user_id}"
+
+
+def _get_client(url: str) -> "Redis":
+    try:
+        import redis
+    except ImportError:
+        raise ImportError(
+            "To use Redis state storage you need to install «redis»:"
+            "\npip install -U telebox[redis]"
+        ) from None
+
+    return redis.Redis.from_url(url)
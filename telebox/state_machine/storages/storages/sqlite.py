@@ -0,0 +1,223 @@
+import logging
+from typing import Optional, Union
+from threading import Thread, RLock, Condition, Event, local
+from pathlib import Path
+import sqlite3
+import time
+import weakref
+
+from telebox.state_machine.storages.storage import AbstractStateStorage
+from telebox.utils.serialization import get_serialized_data, get_deserialized_data
+
+
+logger = logging.getLogger(__name__)
+StateKey = tuple[int, int]
+_NO_USER_ID = 0
+
+
+class _ThreadConnection:
+
+    def __init__(self, connection: sqlite3.Connection):
+        self.connection = connection
+
+
+class _Batch:
+
+    def __init__(self):
+        self.states: dict[StateKey, list[str]] = {}
+        self.completion_event = Event()
+        self.error: Optional[Exception] = None
+
+
+class SQLiteStateStorage(AbstractStateStorage):
+
+    def __init__(
+        self,
+        path: Union[str, Path],
+        *,
+        table: str = "telebox_states",
+        timeout_secs: Union[int, float] = 30,
+        with_group_commit: bool = False,
+        group_commit_delay_secs: Union[int, float] = 0
+    ):
+        if not table.isidentifier():
+            raise ValueError("Table name must be a valid identifier!")
+
+        if group_commit_delay_secs < 0:
+            raise ValueError("Group commit delay seconds cannot be negative!")
+
+        self._path = str(path)
+        self._table = table
+        self._timeout_secs = timeout_secs
+        self._group_commit_delay_secs = group_commit_delay_secs
+        self._local = local()
+        self._connections: set[sqlite3.Connection] = set()
+        self._connection_lock = RLock()
+        self._save_query = (
+            f"INSERT OR REPLACE INTO {table} (chat_id, user_id, states) VALUES (?, ?, ?)"
+        )
+        self._delete_query = f"DELETE FROM {table} WHERE chat_id = ? AND user_id = ?"
+        self._load_query = f"SELECT states FROM {table} WHERE chat_id = ? AND user_id = ?"
+        self._closed = False
+
+        connection = self._get_connection()
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.execute(
+            f"CREATE TABLE IF NOT EXISTS {table} ("
+            "chat_id INTEGER NOT NULL, "
+            "user_id INTEGER NOT NULL, "
+            "states TEXT NOT NULL, "
+            "PRIMARY KEY (chat_id, user_id)"
+            ") WITHOUT ROWID"
+        )
+
+        if with_group_commit:
+            self._batch: Optional[_Batch] = _Batch()
+            self._batch_condition = Condition()
+            self._commit_thread: Optional[Thread] = Thread(target=self._run_group_commit, daemon=True)
+            self._commit_thread.start()
+        else:
+            self._batch = None
+            self._commit_thread = None
+
+    def save_states(
+        self,
+        states: list[str],
+        *,
+        chat_id: int,
+        user_id: Optional[int] = None
+    ) -> None:
+        key = (chat_id, _get_user_id(user_id))
+
+        if self._batch is None:
+            self._save_states(self._get_connection(), key, states)
+
+            return
+
+        with self._batch_condition:
+            if self._closed:
+                raise RuntimeError("Storage is closed!")
+
+            batch = self._batch
+            batch.states[key] = states[:]
+            self._batch_condition.notify()
+
+        batch.completion_event.wait()
+
+        if batch.error is not None:
+            raise batch.error
+
+    def load_states(self, *, chat_id: int, user_id: Optional[int] = None) -> list[str]:
+        row = self._get_connection().execute(
+            self._load_query,
+            (chat_id, _get_user_id(user_id))
+        ).fetchone()
+
+        return get_deserialized_data(row[0]) if row is not None else []
+
+    def close(self) -> None:
+        if self._commit_thread is not None:
+            with self._batch_condition:
+                self._closed = True
+                self._batch_condition.notify()
+
+            self._commit_thread.join()
+            self._commit_thread = None
+
+        with self._connection_lock:
+            self._closed = True
+
+            for i in self._connections:
+                i.close()
+
+            self._connections.clear()
+            # Connections cached by other threads are released too.
+            self._local = local()
+
+    def _get_connection(self) -> sqlite3.Connection:
+        if self._closed:
+            raise RuntimeError("Storage is closed!")
+
+        thread_connection = getattr(self._local, "connection", None)
+
+        if thread_connection is None:
+            with self._connection_lock:
+                if self._closed:
+                    raise RuntimeError("Storage is closed!")
+
+                connection = sqlite3.connect(
+                    self._path,
+                    timeout=self._timeout_secs,
+                    check_same_thread=False,
+                    isolation_level=None
+                )
+                connection.execute("PRAGMA synchronous=NORMAL")
+                self._connections.add(connection)
+                thread_connection = self._local.connection = _ThreadConnection(connection)
+                # Thread-local data is released when its thread exits, so connections
+                # of retired pool threads are closed instead of piling up.
+                weakref.finalize(
+                    thread_connection,
+                    _close_connection,
+                    connection,
+                    self._connections,
+                    self._connection_lock
+                )
+
+        return thread_connection.connection
+
+    def _save_states(self, connection: sqlite3.Connection, key: StateKey, states: list[str]) -> None:
+        if states:
+            connection.execute(self._save_query, (*key, get_serialized_data(states)))
+        else:
+            connection.execute(self._delete_query, key)
+
+    def _run_group_commit(self) -> None:
+        connection = self._get_connection()
+
+        while True:
+            with self._batch_condition:
+                while (not self._batch.states) and (not self._closed):
+                    self._batch_condition.wait()
+
+                if not self._batch.states:
+                    return
+
+            if self._group_commit_delay_secs:
+                time.sleep(self._group_commit_delay_secs)
+
+            with self._batch_condition:
+                batch = self._batch
+                self._batch = _Batch()
+
+            try:
+                connection.execute("BEGIN IMMEDIATE")
+
+                try:
+                    for key, states in batch.states.items():
+                        self._save_states(connection, key, states)
+                except BaseException:
+                    connection.execute("ROLLBACK")
+                    raise
+                else:
+                    connection.execute("COMMIT")
+            except Exception as error:
+                logger.exception("An error occurred while committing states!")
+                batch.error = error
+
+            batch.completion_event.set()
+
+
+def _get_user_id(user_id: Optional[int]) -> int:
+    return user_id if user_id is not None else _NO_USER_ID
+
+
+def _close_connection(
+    connection: sqlite3.Connection,
+    connections: set[sqlite3.Connection],
+    connection_lock: RLock
+) -> None:
+    with connection_lock:
+        connections.discard(connection)
+
+    connection.close()
@@ -1,8 +1,8 @@
 from .not_set import NotSet, NOT_SET
 from .group import Group
 from .callback_data_builders import AbstractCallbackDataBuilder
-from .task_executor import TaskExecutor
-from .thread_pool import ThreadPool
+from .task_executor import TaskExecutor, AbstractTaskStore, MemoryTaskStore, SQLiteTaskStore
+from .thread_pool import ThreadPool, ThreadPoolStats
 from .env import Env
 from .text import get_html_text, get_markdown_text
 from .signals import set_signal_handler
@@ -15,7 +15,11 @@ __all__ = [
     "Group",
     "AbstractCallbackDataBuilder",
     "TaskExecutor",
+    "AbstractTaskStore",
+    "MemoryTaskStore",
+    "SQLiteTaskStore",
     "ThreadPool",
+    "ThreadPoolStats",
     "Env",
     "get_html_text",
     "get_markdown_text",
@@ -7,5 +7,9 @@ def get_serialized_data(data: Any) -> str:
     return orjson.dumps(data).decode("UTF-8")
 
 
+def get_serialized_bytes(data: Any) -> bytes:
+    return orjson.dumps(data)
+
+
 def get_deserialized_data(data: str) -> Any:
     return orjson.loads(data)
@@ -1,6 +1,13 @@
 from .task_executor import TaskExecutor
+from .cron import CronSchedule
+from .stores import AbstractTaskStore, StoredTask, MemoryTaskStore, SQLiteTaskStore
 
 
 __all__ = [
-    "TaskExecutor"
+    "TaskExecutor",
+    "CronSchedule",
+    "AbstractTaskStore",
+    "StoredTask",
+    "MemoryTaskStore",
+    "SQLiteTaskStore"
 ]
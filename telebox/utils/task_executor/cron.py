@@ -0,0 +1,101 @@
+from datetime import datetime, timedelta
+
+from telebox.utils.task_executor.errors import InvalidCronExpressionError
+
+
+_FIELD_RANGES = (
+    (0, 59),
+    (0, 23),
+    (1, 31),
+    (1, 12),
+    (0, 6)
+)
+_MAX_SEARCH_DAYS = 366 * 5
+
+
+class CronSchedule:
+
+    def __init__(self, expression: str):
+        fields = expression.split()
+
+        if len(fields) != len(_FIELD_RANGES):
+            raise InvalidCronExpressionError(
+                "Cron expression must contain five fields: {expression!r}!",
+                expression=expression
+            )
+
+        try:
+            self.minutes, self.hours, self.days, self.months, self.weekdays = (
+                _get_field_values(field, *range_)
+                for field, range_ in zip(fields, _FIELD_RANGES)
+            )
+        except ValueError:
+            raise InvalidCronExpressionError(
+                "Invalid cron expression: {expression!r}!",
+                expression=expression
+            ) from None
+
+        self.expression = expression
+        self._any_day = fields[2] == "*"
+        self._any_weekday = fields[4] == "*"
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.expression!r})"
+
+    def get_next_time(self, time: datetime) -> datetime:
+        time = time.replace(second=0, microsecond=0) + timedelta(minutes=1)
+        end_time = time + timedelta(days=_MAX_SEARCH_DAYS)
+
+        while time < end_time:
+            if time.month not in self.months:
+                time = (time.replace(day=1, hour=0, minute=0) + timedelta(days=32)).replace(day=1)
+            elif not self._check_day(time):
+                time = time.replace(hour=0, minute=0) + timedelta(days=1)
+            elif time.hour not in self.hours:
+                time = time.replace(minute=0) + timedelta(hours=1)
+            elif time.minute not in self.minutes:
+                time += timedelta(minutes=1)
+            else:
+                return time
+
+        raise InvalidCronExpressionError(
+            "Cron expression never matches: {expression!r}!",
+            expression=self.expression
+        )
+
+    def _check_day(self, time: datetime) -> bool:
+        day_matches = time.day in self.days
+        weekday_matches = (time.isoweekday() % 7) in self.weekdays
+
+        if self._any_day:
+            return weekday_matches
+        elif self._any_weekday:
+            return day_matches
+
+        return day_matches or weekday_matches
+
+
+def _get_field_values(field: str, min_value: int, max_value: int) -> frozenset[int]:
+    values = set()
+
+    for i in field.split(","):
+        range_, _, step = i.partition("/")
+        step = int(step) if step else 1
+
+        if step < 1:
+            raise ValueError
+
+        if range_ == "*":
+            start, end = min_value, max_value
+        elif "-" in range_:
+            start, end = map(int, range_.split("-", 1))
+        else:
+            start = int(range_)
+            end = max_value if step > 1 else start
+
+        if (start < min_value) or (end > max_value) or (start > end):
+            raise ValueError
+
+        values.update(range(start, end + 1, step))
+
+    return frozenset(values)
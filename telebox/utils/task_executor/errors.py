@@ -11,3 +11,13 @@ class TaskExecutorError(TeleboxError):
 @dataclass
 class TaskNotFoundError(TaskExecutorError):
     id: str
+
+
+@dataclass
+class InvalidCronExpressionError(TaskExecutorError):
+    expression: str
+
+
+@dataclass
+class TaskNotRegisteredError(TaskExecutorError):
+    name: str
@@ -0,0 +1,10 @@
+from .store import AbstractTaskStore, StoredTask
+from .stores import MemoryTaskStore, SQLiteTaskStore
+
+
+__all__ = [
+    "AbstractTaskStore",
+    "StoredTask",
+    "MemoryTaskStore",
+    "SQLiteTaskStore"
+]
@@ -0,0 +1,38 @@
+from abc import ABC, abstractmethod
+from dataclasses import dataclass, field
+from typing import Optional, Any
+
+
+@dataclass
+class StoredTask:
+    id: str
+    name: str
+    start_time: float
+    args: list[Any] = field(default_factory=list)
+    kwargs: dict[str, Any] = field(default_factory=dict)
+
+
+class AbstractTaskStore(ABC):
+
+    @abstractmethod
+    def add_task(self, task: StoredTask) -> None:
+        pass
+
+    @abstractmethod
+    def remove_task(self, id_: str) -> bool:
+        pass
+
+    @abstractmethod
+    def claim_tasks(self, time: float, limit: int, lease_secs: float) -> list[StoredTask]:
+        pass
+
+    @abstractmethod
+    def complete_tasks(self, ids: list[str]) -> None:
+        pass
+
+    @abstractmethod
+    def get_next_time(self) -> Optional[float]:
+        pass
+
+    def close(self) -> None:
+        pass
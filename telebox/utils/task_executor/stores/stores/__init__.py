@@ -0,0 +1,8 @@
+from .memory import MemoryTaskStore
+from .sqlite import SQLiteTaskStore
+
+
+__all__ = [
+    "MemoryTaskStore",
+    "SQLiteTaskStore"
+]
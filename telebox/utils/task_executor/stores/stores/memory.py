@@ -0,0 +1,58 @@
+from typing import Optional
+from threading import RLock
+import heapq
+
+from telebox.utils.task_executor.stores.store import AbstractTaskStore, StoredTask
+
+
+class MemoryTaskStore(AbstractTaskStore):
+
+    def __init__(self):
+        self._tasks: dict[str, tuple[float, StoredTask]] = {}
+        self._times: list[tuple[float, str]] = []
+        self._lock = RLock()
+
+    def add_task(self, task: StoredTask) -> None:
+        with self._lock:
+            self._set_task_time(task, task.start_time)
+
+    def remove_task(self, id_: str) -> bool:
+        with self._lock:
+            return self._tasks.pop(id_, None) is not None
+
+    def claim_tasks(self, time: float, limit: int, lease_secs: float) -> list[StoredTask]:
+        tasks = []
+
+        with self._lock:
+            while self._times and (self._times[0][0] <= time) and (len(tasks) < limit):
+                task_time, id_ = heapq.heappop(self._times)
+                item = self._tasks.get(id_)
+
+                if (item is None) or (item[0] != task_time):
+                    continue
+
+                task = item[1]
+                self._set_task_time(task, time + lease_secs)
+                tasks.append(task)
+
+        return tasks
+
+    def complete_tasks(self, ids: list[str]) -> None:
+        with self._lock:
+            for i in ids:
+                self._tasks.pop(i, None)
+
+    def get_next_time(self) -> Optional[float]:
+        with self._lock:
+            while self._times:
+                task_time, id_ = self._times[0]
+                item = self._tasks.get(id_)
+
+                if (item is not None) and (item[0] == task_time):
+                    return task_time
+
+                heapq.heappop(self._times)
+
+    def _set_task_time(self, task: StoredTask, time: float) -> None:
+        self._tasks[task.id] = (time, task)
+        heapq.heappush(self._times, (time, task.id))
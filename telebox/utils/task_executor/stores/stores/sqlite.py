@@ -0,0 +1,112 @@
+from typing import Optional, Union
+from threading import RLock
+from pathlib import Path
+import sqlite3
+
+from telebox.utils.task_executor.stores.store import AbstractTaskStore, StoredTask
+from telebox.utils.serialization import get_serialized_data, get_deserialized_data
+
+
+class SQLiteTaskStore(AbstractTaskStore):
+
+    def __init__(self, path: Union[str, Path], *, table: str = "telebox_tasks"):
+        if not table.isidentifier():
+            raise ValueError("Table name must be a valid identifier!")
+
+        self._table = table
+        self._connection = sqlite3.connect(
+            str(path),
+            check_same_thread=False,
+            isolation_level=None
+        )
+        self._lock = RLock()
+
+        with self._lock:
+            self._connection.execute("PRAGMA journal_mode=WAL")
+            self._connection.execute("PRAGMA synchronous=NORMAL")
+            self._connection.execute(
+                f"CREATE TABLE IF NOT EXISTS {table} ("
+                "id TEXT PRIMARY KEY, "
+                "name TEXT NOT NULL, "
+                "time REAL NOT NULL, "
+                "arguments TEXT NOT NULL"
+                ")"
+            )
+            self._connection.execute(f"CREATE INDEX IF NOT EXISTS {table}_time ON {table} (time)")
+
+    def add_task(self, task: StoredTask) -> None:
+        with self._lock:
+            self._connection.execute(
+                f"INSERT INTO {self._table} (id, name, time, arguments) VALUES (?, ?, ?, ?)",
+                (task.id, task.name, task.start_time, get_serialized_data([task.args, task.kwargs]))
+            )
+
+    def remove_task(self, id_: str) -> bool:
+        with self._lock:
+            cursor = self._connection.execute(f"DELETE FROM {self._table} WHERE id = ?", (id_,))
+
+            return cursor.rowcount > 0
+
+    def claim_tasks(self, time: float, limit: int, lease_secs: float) -> list[StoredTask]:
+        with self._lock:
+            self._connection.execute("BEGIN IMMEDIATE")
+
+            try:
+                rows = self._connection.execute(
+                    f"SELECT id, name, time, arguments FROM {self._table} "
+                    "WHERE time <= ? ORDER BY time LIMIT ?",
+                    (time, limit)
+                ).fetchall()
+                self._connection.executemany(
+                    f"UPDATE {self._table} SET time = ? WHERE id = ?",
+                    ((time + lease_secs, i[0]) for i in rows)
+                )
+            except BaseException:
+                self._connection.execute("ROLLBACK")
+                raise
+            else:
+                self._connection.execute("COMMIT")
+
+        tasks = []
+
+        for id_, name, start_time, arguments in rows:
+            args, kwargs = get_deserialized_data(arguments)
+            tasks.append(
+                StoredTask(
+                    id=id_,
+                    name=name,
+                    start_time=start_time,
+                    args=args,
+                    kwargs=kwargs
+                )
+            )
+
+        return tasks
+
+    def complete_tasks(self, ids: list[str]) -> None:
+        if not ids:
+            return
+
+        with self._lock:
+            self._connection.execute("BEGIN IMMEDIATE")
+
+            try:
+                self._connection.executemany(
+                    f"DELETE FROM {self._table} WHERE id = ?",
+                    ((i,) for i in ids)
+                )
+            except BaseException:
+                self._connection.execute("ROLLBACK")
+                raise
+            else:
+                self._connection.execute("COMMIT")
+
+    def get_next_time(self) -> Optional[float]:
+        with self._lock:
+            row = self._connection.execute(f"SELECT MIN(time) FROM {self._table}").fetchone()
+
+        return row[0]
+
+    def close(self) -> None:
+        with self._lock:
+            self._connection.close()
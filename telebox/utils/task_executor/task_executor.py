@@ -1,16 +1,26 @@
 import logging
-from typing import Callable, Any, Optional, Union, NoReturn
+from typing import Callable, Any, Optional, Union
 from dataclasses import dataclass
-from threading import Thread, RLock, Condition
-from queue import SimpleQueue
+from datetime import datetime, timedelta
+from threading import Thread, RLock, Condition, Event
+from queue import SimpleQueue, Empty
+import heapq
+import itertools
 import time
 import uuid
 
-from telebox.utils.thread_pool import ThreadPool
-from telebox.utils.task_executor.errors import TaskNotFoundError
+from telebox.utils.thread_pool import ThreadPool, ThreadPoolStats
+from telebox.utils.task_executor.errors import (
+    TaskExecutorError,
+    TaskNotFoundError,
+    TaskNotRegisteredError
+)
+from telebox.utils.task_executor.cron import CronSchedule
+from telebox.utils.task_executor.stores.store import AbstractTaskStore, StoredTask
 
 
 logger = logging.getLogger(__name__)
+_HEAP_COMPACTION_MIN_SIZE = 1024
 
 
 @dataclass
@@ -20,30 +30,72 @@ class Task:
     args: tuple
     kwargs: dict[str, Any]
     start_time: float
+    interval_secs: Union[int, float, None] = None
+    cron: Optional[CronSchedule] = None
+    stored: bool = False
+
+    @property
+    def recurring(self) -> bool:
+        return (self.interval_secs is not None) or (self.cron is not None)
 
 
 class TaskExecutor:
 
-    def __init__(self, min_threads: int = 5, max_threads: int = 25):
-        self._tasks = []
+    def __init__(
+        self,
+        min_threads: int = 5,
+        max_threads: int = 25,
+        *,
+        thread_idle_timeout_secs: Union[int, float, None] = 60,
+        task_store: Optional[AbstractTaskStore] = None,
+        claim_batch_size: int = 1000,
+        lease_secs: Union[int, float] = 300,
+        store_poll_interval_secs: Union[int, float] = 1
+    ):
+        if claim_batch_size < 1:
+            raise ValueError("Claim batch size cannot be less than one!")
+
+        if lease_secs <= 0:
+            raise ValueError("Lease seconds must be greater than zero!")
+
+        if store_poll_interval_secs <= 0:
+            raise ValueError("Store poll interval seconds must be greater than zero!")
+
+        self._tasks: list[tuple[float, int, Task]] = []
+        self._task_index: dict[str, Task] = {}
+        self._task_numbers = itertools.count()
+        self._removed_tasks = 0
         self._active_tasks = SimpleQueue()
         self._unfinished_tasks = 0
+        self._recurring_tasks = 0
         self._task_lock = RLock()
         self._all_tasks_done_condition = Condition(self._task_lock)
+        self._new_task_condition = Condition(self._task_lock)
         self._thread_pool = ThreadPool(
             min_threads,
             max_threads,
             target=self._process_tasks,
-            with_barrier=True
+            with_barrier=True,
+            idle_timeout_secs=thread_idle_timeout_secs,
+            get_queue_size=self._active_tasks.qsize
         )
-        self._busy_threads = 0
-        self._busy_thread_lock = RLock()
         self._submission_thread: Optional[Thread] = None
+        self._task_store = task_store
+        self._claim_batch_size = claim_batch_size
+        self._lease_secs = lease_secs
+        self._store_poll_interval_secs = store_poll_interval_secs
+        self._registered_tasks: dict[str, Callable] = {}
+        self._completed_stored_task_ids: list[str] = []
+        self._completed_stored_task_lock = RLock()
+        self._stored_task_event = Event()
+        self._stored_task_submission_thread: Optional[Thread] = None
 
     def __enter__(self):
         self.start_tasks()
 
     def __exit__(self, exc_type, exc_val, exc_tb):
+        """Cancel recurring tasks and wait for the rest."""
+        self.cancel_recurring_tasks()
         self.wait_tasks()
 
     def add_task(
@@ -52,79 +104,159 @@ class TaskExecutor:
         args: tuple = (),
         kwargs: Optional[dict[str, Any]] = None,
         *,
-        delay_secs: Union[int, float] = 0
+        delay_secs: Union[int, float] = 0,
+        interval_secs: Union[int, float, None] = None,
+        cron: Union[CronSchedule, str, None] = None
     ) -> str:
         if delay_secs < 0:
             raise ValueError("Delay seconds cannot be negative!")
 
+        if (interval_secs is not None) and (interval_secs <= 0):
+            raise ValueError("Interval seconds must be greater than zero!")
+
+        if (interval_secs is not None) and (cron is not None):
+            raise ValueError("Interval and cron cannot be used together!")
+
+        if isinstance(cron, str):
+            cron = CronSchedule(cron)
+
         task = Task(
             id=str(uuid.uuid4()),
             task=task,
             args=args,
             kwargs=kwargs or {},
-            start_time=time.monotonic() + delay_secs
+            start_time=time.monotonic() + delay_secs,
+            interval_secs=interval_secs,
+            cron=cron
         )
 
-        with self._task_lock:
-            for index, i in enumerate(self._tasks):
-                if task.start_time > i.start_time:
-                    self._tasks.insert(index, task)
-                    break
-            else:
-                self._tasks.append(task)
+        if cron is not None:
+            task.start_time = _get_cron_start_time(cron, task.start_time)
 
+        with self._task_lock:
+            self._task_index[task.id] = task
+            self._push_task(task)
             self._unfinished_tasks += 1
 
+            if task.recurring:
+                self._recurring_tasks += 1
+
         logger.debug("Task added to queue: %r, delay_secs=%r.", task, delay_secs)
 
         return task.id
 
     def remove_task(self, id_: str) -> None:
         with self._all_tasks_done_condition:
-            for index, i in enumerate(self._tasks):
-                if i.id == id_:
-                    del self._tasks[index]
-                    self._unfinished_tasks -= 1
-                    logger.debug("Task removed from queue: %r.", i)
-
-                    if not self._unfinished_tasks:
-                        self._all_tasks_done_condition.notify_all()
+            task = self._task_index.pop(id_, None)
 
-                    break
-            else:
+            if task is None:
                 raise TaskNotFoundError("Task with ID {id!r} not found!", id=id_)
 
+            self._removed_tasks += 1
+            self._unfinished_tasks -= 1
+
+            if task.recurring:
+                self._recurring_tasks -= 1
+
+            logger.debug("Task removed from queue: %r.", task)
+
+            if (
+                (len(self._tasks) >= _HEAP_COMPACTION_MIN_SIZE)
+                and (self._removed_tasks > len(self._tasks) // 2)
+            ):
+                self._tasks = [i for i in self._tasks if self._task_index.get(i[2].id) is i[2]]
+                heapq.heapify(self._tasks)
+                self._removed_tasks = 0
+
+            self._notify_all_tasks_done()
+
+    def cancel_recurring_tasks(self) -> None:
+        with self._task_lock:
+            ids = [i.id for i in self._task_index.values() if i.recurring]
+
+            for i in ids:
+                self.remove_task(i)
+
+    def register_task(self, name: str, task: Callable) -> None:
+        self._registered_tasks[name] = task
+
+    def add_stored_task(
+        self,
+        name: str,
+        args: tuple = (),
+        kwargs: Optional[dict[str, Any]] = None,
+        *,
+        delay_secs: Union[int, float] = 0
+    ) -> str:
+        if delay_secs < 0:
+            raise ValueError("Delay seconds cannot be negative!")
+
+        if name not in self._registered_tasks:
+            raise TaskNotRegisteredError("Task {name!r} is not registered!", name=name)
+
+        task = StoredTask(
+            id=str(uuid.uuid4()),
+            name=name,
+            start_time=time.time() + delay_secs,
+            args=list(args),
+            kwargs=kwargs or {}
+        )
+        self._get_task_store().add_task(task)
+        self._stored_task_event.set()
+        logger.debug("Stored task added: %r, delay_secs=%r.", task, delay_secs)
+
+        return task.id
+
+    def remove_stored_task(self, id_: str) -> None:
+        if not self._get_task_store().remove_task(id_):
+            raise TaskNotFoundError("Task with ID {id!r} not found!", id=id_)
+
+        logger.debug("Stored task removed: %r.", id_)
+
+    def get_thread_pool_stats(self) -> ThreadPoolStats:
+        return self._thread_pool.get_stats()
+
     def start_tasks(self) -> None:
         logger.debug("Tasks is starting...")
         self._submission_thread = Thread(target=self._process_task_submission, daemon=True)
         self._submission_thread.start()
+
+        if self._task_store is not None:
+            self._stored_task_submission_thread = Thread(
+                target=self._process_stored_task_submission,
+                daemon=True
+            )
+            self._stored_task_submission_thread.start()
+
         self._thread_pool.start_threads()
         logger.info("Tasks started.")
 
     def wait_tasks(self) -> None:
+        """Wait for one-time tasks and running recurring tasks, recurring tasks keep their schedule."""
         logger.info("Finishing tasks...")
 
         with self._all_tasks_done_condition:
-            while self._unfinished_tasks:
+            while self._unfinished_tasks > self._recurring_tasks:
                 self._all_tasks_done_condition.wait()
 
             self._submission_thread = None
 
+        if self._task_store is not None:
+            self._complete_stored_tasks()
+
         logger.info("Tasks finished.")
 
-    def _process_tasks(self) -> NoReturn:
+    def _process_tasks(self) -> None:
         while True:
-            task = self._active_tasks.get()
+            try:
+                task = self._active_tasks.get(timeout=self._thread_pool.idle_timeout_secs)
+            except Empty:
+                if self._thread_pool.check_thread_retirement():
+                    return
 
-            with self._busy_thread_lock:
-                self._busy_threads += 1
+                continue
 
-                if (
-                    (self._busy_threads == self._thread_pool.threads)
-                    and (self._thread_pool.threads < self._thread_pool.max_threads)
-                ):
-                    self._thread_pool.create_thread()
-                    logger.debug("Additional task processing thread created.")
+            self._thread_pool.set_thread_busy()
 
             # noinspection PyBroadException
             try:
@@ -133,24 +265,134 @@ class TaskExecutor:
             except Exception:
                 logger.exception("An error occurred while processing a task!")
             finally:
+                if task.stored:
+                    self._add_completed_stored_task(task.id)
+
                 self._set_task_completion()
                 logger.debug("Task processing finished: %r.", task)
-
-                with self._busy_thread_lock:
-                    self._busy_threads -= 1
+                self._thread_pool.set_thread_idle()
 
     def _process_task_submission(self) -> None:
-        while True:
-            with self._task_lock:
-                while self._tasks and (time.monotonic() > self._tasks[0].start_time):
-                    task = self._tasks.pop()
+        with self._new_task_condition:
+            while True:
+                now = time.monotonic()
+
+                while self._tasks and (self._tasks[0][0] <= now):
+                    *_, task = heapq.heappop(self._tasks)
+
+                    if self._task_index.get(task.id) is not task:
+                        self._removed_tasks -= 1
+                        continue
+
+                    if task.recurring:
+                        self._unfinished_tasks += 1
+
+                        if task.cron is not None:
+                            task.start_time = _get_cron_start_time(task.cron, now)
+                        else:
+                            task.start_time = max(task.start_time + task.interval_secs, now)
+
+                        self._push_task(task)
+                    else:
+                        del self._task_index[task.id]
+
                     self._active_tasks.put(task)
 
-            time.sleep(0.1)
+                self._new_task_condition.wait(self._tasks[0][0] - now if self._tasks else None)
+
+    def _process_stored_task_submission(self) -> None:
+        while True:
+            # noinspection PyBroadException
+            try:
+                self._complete_stored_tasks()
+
+                if self._active_tasks.qsize() < self._claim_batch_size:
+                    tasks = self._task_store.claim_tasks(
+                        time=time.time(),
+                        limit=self._claim_batch_size,
+                        lease_secs=self._lease_secs
+                    )
+                else:
+                    tasks = []
+
+                for i in tasks:
+                    self._submit_stored_task(i)
+
+                if len(tasks) == self._claim_batch_size:
+                    continue
+
+                next_time = self._task_store.get_next_time()
+            except Exception:
+                logger.exception("An error occurred while claiming stored tasks!")
+                next_time = None
+
+            timeout_secs = self._store_poll_interval_secs
+
+            if next_time is not None:
+                timeout_secs = min(max(next_time - time.time(), 0), timeout_secs)
+
+            self._stored_task_event.wait(timeout_secs)
+            self._stored_task_event.clear()
+
+    def _submit_stored_task(self, task: StoredTask) -> None:
+        callable_ = self._registered_tasks.get(task.name)
+
+        if callable_ is None:
+            logger.error("Stored task %r is not registered and will be retried after lease expires!", task)
+            return
+
+        with self._task_lock:
+            self._unfinished_tasks += 1
+
+        self._active_tasks.put(
+            Task(
+                id=task.id,
+                task=callable_,
+                args=tuple(task.args),
+                kwargs=task.kwargs,
+                start_time=time.monotonic(),
+                stored=True
+            )
+        )
+
+    def _add_completed_stored_task(self, id_: str) -> None:
+        with self._completed_stored_task_lock:
+            self._completed_stored_task_ids.append(id_)
+
+            if len(self._completed_stored_task_ids) >= self._claim_batch_size:
+                self._stored_task_event.set()
+
+    def _complete_stored_tasks(self) -> None:
+        with self._completed_stored_task_lock:
+            ids = self._completed_stored_task_ids
+            self._completed_stored_task_ids = []
+
+        if ids:
+            self._task_store.complete_tasks(ids)
+
+    def _get_task_store(self) -> AbstractTaskStore:
+        if self._task_store is None:
+            raise TaskExecutorError("Task store is not set!")
+
+        return self._task_store
+
+    def _push_task(self, task: Task) -> None:
+        heapq.heappush(self._tasks, (task.start_time, next(self._task_numbers), task))
+
+        if self._tasks[0][2] is task:
+            self._new_task_condition.notify()
 
     def _set_task_completion(self) -> None:
         with self._all_tasks_done_condition:
             self._unfinished_tasks -= 1
+            self._notify_all_tasks_done()
+
+    def _notify_all_tasks_done(self) -> None:
+        if self._unfinished_tasks <= self._recurring_tasks:
+            self._all_tasks_done_condition.notify_all()
+
+
+def _get_cron_start_time(cron: CronSchedule, start_time: float) -> float:
+    start_datetime = datetime.now() + timedelta(seconds=start_time - time.monotonic())
 
-            if not self._unfinished_tasks:
-                self._all_tasks_done_condition.notify_all()
+    return start_time + (cron.get_next_time(start_datetime) - start_datetime).total_seconds()
@@ -1,7 +1,22 @@
-from threading import Thread, Barrier, RLock
+import logging
+from dataclasses import dataclass
+from threading import Thread, Barrier, RLock, current_thread
 from typing import Callable, Optional, Union, Any
 
 
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class ThreadPoolStats:
+    threads: int
+    busy_threads: int
+    idle_threads: int
+    queued_items: int
+    created_threads: int
+    retired_threads: int
+
+
 class ThreadPool:
 
     def __init__(
@@ -12,7 +27,9 @@ class ThreadPool:
         *,
         args: tuple = (),
         kwargs: Optional[dict[str, Any]] = None,
-        with_barrier: bool = False
+        with_barrier: bool = False,
+        idle_timeout_secs: Union[int, float, None] = None,
+        get_queue_size: Optional[Callable[[], int]] = None
     ):
         if min_threads < 1:
             raise ValueError("Number of threads cannot be less than 1!")
@@ -20,15 +37,24 @@ class ThreadPool:
         if max_threads < min_threads:
             raise ValueError("Maximum number of threads cannot be less than minimum!")
 
+        if (idle_timeout_secs is not None) and (idle_timeout_secs <= 0):
+            raise ValueError("Idle timeout seconds must be greater than zero!")
+
+        self.min_threads = min_threads
         self.max_threads = max_threads
+        self.idle_timeout_secs = idle_timeout_secs
         self._target = target
         self._args = args
         self._kwargs = kwargs or {}
+        self._get_queue_size = get_queue_size
         self._threads = [
             Thread(target=self._process, daemon=True)
             for _ in range(min_threads)
         ]
         self._barrier = Barrier(min_threads) if with_barrier else None
+        self._busy_threads = 0
+        self._created_threads = min_threads
+        self._retired_threads = 0
         self._lock = RLock()
 
     @property
@@ -36,6 +62,24 @@ class ThreadPool:
         with self._lock:
             return len(self._threads)
 
+    @property
+    def busy_threads(self) -> int:
+        with self._lock:
+            return self._busy_threads
+
+    def get_stats(self) -> ThreadPoolStats:
+        queued_items = self._get_queue_size() if self._get_queue_size is not None else 0
+
+        with self._lock:
+            return ThreadPoolStats(
+                threads=len(self._threads),
+                busy_threads=self._busy_threads,
+                idle_threads=len(self._threads) - self._busy_threads,
+                queued_items=queued_items,
+                created_threads=self._created_threads,
+                retired_threads=self._retired_threads
+            )
+
     def start_threads(self) -> None:
         with self._lock:
             for i in self._threads:
@@ -48,12 +92,50 @@ class ThreadPool:
 
             thread = Thread(target=self._target, args=self._args, kwargs=self._kwargs, daemon=True)
             self._threads.append(thread)
+            self._created_threads += 1
             thread.start()
 
     def wait_threads(self, timeout_secs: Union[int, float, None] = None) -> None:
         with self._lock:
-            for i in self._threads:
-                i.join(timeout_secs)
+            threads = tuple(self._threads)
+
+        for i in threads:
+            i.join(timeout_secs)
+
+    def set_thread_busy(self) -> None:
+        queued_items = self._get_queue_size() if self._get_queue_size is not None else 0
+
+        with self._lock:
+            self._busy_threads += 1
+            threads = len(self._threads)
+            required_threads = queued_items - (threads - self._busy_threads)
+
+            if (self._busy_threads == threads) and (required_threads < 1):
+                required_threads = 1
+
+            for _ in range(min(required_threads, self.max_threads - threads)):
+                self.create_thread()
+                logger.debug("Additional thread created.")
+
+    def set_thread_idle(self) -> None:
+        with self._lock:
+            self._busy_threads -= 1
+
+    def check_thread_retirement(self) -> bool:
+        with self._lock:
+            if len(self._threads) <= self.min_threads:
+                return False
+
+            thread = current_thread()
+
+            if thread not in self._threads:
+                return False
+
+            self._threads.remove(thread)
+            self._retired_threads += 1
+            logger.debug("Idle thread retired.")
+
+            return True
 
     def _process(self) -> None:
         if self._barrier is not None: